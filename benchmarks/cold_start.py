@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for single CLI commands.
+Measures how long it takes from a fresh interpreter until the agents a
+command needs are ready to run (no LLM requests are made).
+
+Usage:
+    python benchmarks/cold_start.py [--runs 5]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executed in a fresh interpreter per run so imports are really cold
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from src.crew.marketing_crew import KarloDigitalTwin
+imported = time.perf_counter()
+twin = KarloDigitalTwin()
+constructed = time.perf_counter()
+crew = twin.lite_crew
+crew.philosopher  # the only agent `about` uses
+ready = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "construct": constructed - imported,
+    "first_agent": ready - constructed,
+    "total": ready - start,
+}}))
+"""
+
+
+def run_probe() -> dict:
+    """Run one cold-start probe in a subprocess and return its phase timings."""
+    env = dict(os.environ)
+    env.setdefault("OPENROUTER_API_KEY", "benchmark-placeholder")
+    env.setdefault("SERPER_API_KEY", "benchmark-placeholder")
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(root=ROOT)],
+        capture_output=True, text=True, env=env, cwd=ROOT, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 5
+
+    samples = [run_probe() for _ in range(runs)]
+
+    print(f"Cold start for `about` ({runs} runs, median seconds)")
+    print("-" * 50)
+    for phase in ("import", "construct", "first_agent", "total"):
+        print(f"  {phase:12} {statistics.median(s[phase] for s in samples):8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Resampling micro-benchmark for TTS output.
+Compares the previous FFT path (scipy.signal.resample over the whole clip)
+with the cached polyphase Resampler, one-shot and streamed in 100 ms chunks,
+across utterance lengths. Lengths are offset by a prime number of samples
+because FFT cost spikes on sizes without small factors.
+
+Usage:
+    python benchmarks/resample.py [--runs 5] [--src 44100] [--dst 24000]
+"""
+
+import importlib.util
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import scipy.signal as sps
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Load the module directly: importing the src.voice package needs PortAudio
+_spec = importlib.util.spec_from_file_location(
+    "resampler", os.path.join(ROOT, "src", "voice", "resampler.py"))
+resampler = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(resampler)
+
+SECONDS = (1, 5, 15, 30, 60)
+
+
+def fft_resample(audio: np.ndarray, src: int, dst: int) -> np.ndarray:
+    """The path EdgeTTS.synthesize used before the Resampler."""
+    return sps.resample(audio, int(len(audio) * dst / src))
+
+
+def streamed(audio: np.ndarray, src: int, dst: int) -> np.ndarray:
+    """Resampler fed in 100 ms chunks, as a streaming consumer would."""
+    stream = resampler.get_resampler(src, dst).stream()
+    step = src // 10
+    parts = [stream.process(audio[i:i + step]) for i in range(0, len(audio), step)]
+    parts.append(stream.flush())
+    return np.concatenate(parts)
+
+
+def median_ms(fn, runs: int) -> float:
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 5
+    src = int(sys.argv[sys.argv.index("--src") + 1]) if "--src" in sys.argv else 44100
+    dst = int(sys.argv[sys.argv.index("--dst") + 1]) if "--dst" in sys.argv else 24000
+
+    rng = np.random.default_rng(0)
+    resampler.get_resampler(src, dst)  # Filter design is a one-time cost, keep it out of the timings
+
+    print(f"Resampling {src} Hz -> {dst} Hz ({runs} runs, median ms)")
+    print("-" * 62)
+    print(f"  {'length':>8} {'fft (old)':>12} {'polyphase':>12} {'streamed':>12} {'speedup':>9}")
+    for seconds in SECONDS:
+        audio = (0.1 * rng.standard_normal(seconds * src + 7919)).astype(np.float32)
+        old = median_ms(lambda: fft_resample(audio.astype(np.float64), src, dst), runs)
+        new = median_ms(lambda: resampler.resample(audio, src, dst), runs)
+        chunked = median_ms(lambda: streamed(audio, src, dst), runs)
+        print(f"  {seconds:>7}s {old:12.2f} {new:12.2f} {chunked:12.2f} {old / new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Voice input benchmark: what a recording costs to send to Whisper.
+Compares the previous upload (the whole 24 kHz recording written to a WAV
+temp file) with the in-memory preprocessing stage (VAD trim, 16 kHz mono,
+WAV/FLAC/Opus). Without --file a synthetic utterance with 1.5 s of silence
+before and 2 s after is used, like an auto-stopped recording.
+
+With --transcribe (needs OPENAI_API_KEY) each variant is also sent to
+Whisper and the median request latency is reported.
+
+Usage:
+    python benchmarks/voice.py [--file recording.wav] [--runs 3] [--transcribe]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import Config  # noqa: E402
+from src.voice.stt_preprocess import UPLOAD_FORMATS, prepare_upload  # noqa: E402
+
+
+def synthetic_utterance(sample_rate: int) -> np.ndarray:
+    """Room noise, 4 s of voiced syllables, room noise."""
+    rng = np.random.default_rng(0)
+    t = np.arange(4 * sample_rate) / sample_rate
+    pitch = 140 + 20 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    syllables = np.clip(np.sin(2 * np.pi * 3.5 * t), 0, None)
+    speech = 0.15 * voiced * syllables
+
+    audio = np.concatenate([
+        np.zeros(int(1.5 * sample_rate)), speech, np.zeros(2 * sample_rate)
+    ])
+    audio += 0.003 * rng.standard_normal(len(audio))
+    return audio.astype(np.float32)
+
+
+def legacy_upload(audio: np.ndarray, sample_rate: int) -> str:
+    """The previous path: whole recording to a WAV temp file."""
+    fd, path = tempfile.mkstemp(suffix='.wav')
+    os.close(fd)
+    sf.write(path, audio, sample_rate)
+    return path
+
+
+def median_ms(samples) -> float:
+    """Median of second timings, in milliseconds."""
+    return statistics.median(samples) * 1000
+
+
+def main():
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 3
+    transcribe = "--transcribe" in sys.argv
+
+    if "--file" in sys.argv:
+        audio, sample_rate = sf.read(sys.argv[sys.argv.index("--file") + 1], dtype='float32')
+    else:
+        sample_rate = Config.AUDIO_SAMPLE_RATE
+        audio = synthetic_utterance(sample_rate)
+
+    stt = None
+    if transcribe:
+        from src.voice.stt import WhisperSTT
+        stt = WhisperSTT()
+
+    print(f"Recording: {len(audio) / sample_rate:.2f}s at {sample_rate} Hz ({runs} runs, median)")
+    print("-" * 78)
+    print(f"  {'upload':<18} {'seconds':>8} {'bytes':>10} {'vs old':>7} {'prepare ms':>11} {'whisper ms':>11}")
+
+    # Previous path
+    prepare, latency = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        path = legacy_upload(audio, sample_rate)
+        prepare.append(time.perf_counter() - start)
+        size = os.path.getsize(path)
+        if stt:
+            start = time.perf_counter()
+            stt.transcribe(path)
+            latency.append(time.perf_counter() - start)
+        os.remove(path)
+    baseline = size
+    whisper = f"{median_ms(latency):11.0f}" if latency else f"{'-':>11}"
+    print(f"  {'wav 24k (old)':<18} {len(audio) / sample_rate:8.2f} {size:10,d} {1.0:6.2f}x "
+          f"{median_ms(prepare):11.2f} {whisper}")
+
+    # Preprocessing stage
+    for upload_format in UPLOAD_FORMATS:
+        prepare, latency = [], []
+        for _ in range(runs):
+            upload = prepare_upload(audio, sample_rate, upload_format=upload_format)
+            prepare.append(upload.encode_time)
+            if stt:
+                start = time.perf_counter()
+                stt.transcribe_bytes(upload.data, upload.filename)
+                latency.append(time.perf_counter() - start)
+        whisper = f"{median_ms(latency):11.0f}" if latency else f"{'-':>11}"
+        label = f"{upload_format} {upload.sample_rate // 1000}k trimmed"
+        print(f"  {label:<18} {upload.seconds:8.2f} {upload.size:10,d} {upload.size / baseline:6.2f}x "
+              f"{median_ms(prepare):11.2f} {whisper}")
+
+    if not stt:
+        print("\n  (add --transcribe with OPENAI_API_KEY set to measure Whisper latency)")
+
+
+if __name__ == "__main__":
+    main()
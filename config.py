@@ -34,10 +34,37 @@ class Config:
     CREW_VERBOSE: bool = True
     ALLOW_DELEGATION: bool = False  # Agents work independently
     MAX_ITER: int = 5  # Maximum iterations for task completion
+    CREW_MAX_WORKERS: int = int(os.getenv("CREW_MAX_WORKERS", "3"))  # Independent tasks running at once (1 = one by one)
+    LLM_MAX_RPM: int = int(os.getenv("LLM_MAX_RPM", "30"))  # Shared by all crews/workers (0 = unlimited)
+    BATCH_WORKERS: int = int(os.getenv("BATCH_WORKERS", "4"))  # Parallel products in campaign --batch
+    LLM_STREAMING: bool = os.getenv("LLM_STREAMING", "true").lower() == "true"  # Token streaming to the terminal
 
     # Output Configuration
     OUTPUT_DIR: str = "outputs"
 
+    # LLM Response Cache - skips identical task runs across processes (disable with --no-cache)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", os.path.join(OUTPUT_DIR, ".cache", "llm_responses.sqlite"))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500"))
+    LLM_CACHE_MAX_AGE_DAYS: float = float(os.getenv("LLM_CACHE_MAX_AGE_DAYS", "7"))
+
+    # Metrics - latency/tokens/cost per stage, appended per run (see `main.py stats`)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_PATH: str = os.getenv("METRICS_PATH", os.path.join(OUTPUT_DIR, ".metrics", "metrics.jsonl"))
+    METRICS_TEXTFILE: str = os.getenv("METRICS_TEXTFILE", os.path.join(OUTPUT_DIR, ".metrics", "digital_twin.prom"))
+    METRICS_HISTORY_RUNS: int = int(os.getenv("METRICS_HISTORY_RUNS", "20"))  # Runs the percentiles cover
+    METRICS_MAX_MB: float = float(os.getenv("METRICS_MAX_MB", "20"))  # Then the file is rotated
+    LLM_PRICES: str = os.getenv("LLM_PRICES", "")  # Extra prices: model=prompt/completion USD per 1M tokens, comma separated
+    STT_PRICE_PER_MINUTE: float = float(os.getenv("STT_PRICE_PER_MINUTE", "0.006"))  # OpenAI Whisper
+
+    # Daemon Mode - `main.py serve` keeps warm agents; CLI commands route to it when running
+    DAEMON_HOST: str = os.getenv("DAEMON_HOST", "127.0.0.1")
+    DAEMON_PORT: int = int(os.getenv("DAEMON_PORT", "8765"))
+    DAEMON_WORKERS: int = int(os.getenv("DAEMON_WORKERS", "2"))  # Requests served concurrently
+    DAEMON_REQUEST_TIMEOUT: float = float(os.getenv("DAEMON_REQUEST_TIMEOUT", "900"))
+    DAEMON_STATE_FILE: str = os.path.join(OUTPUT_DIR, ".daemon.json")
+    DAEMON_CLIENT_ENABLED: bool = os.getenv("DAEMON_CLIENT_ENABLED", "true").lower() == "true"
+
     # Voice Configuration (HW4)
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")  # For Whisper STT
 
@@ -51,6 +78,80 @@ class Config:
     AUDIO_CHANNELS: int = 1  # Mono
     RECORDING_SILENCE_THRESHOLD: float = 0.01  # Silence detection threshold
     RECORDING_SILENCE_DURATION: float = 2.0  # Seconds of silence to stop recording
+    RECORDING_START_TIMEOUT: float = float(os.getenv("RECORDING_START_TIMEOUT", "10"))  # Auto-stop if nobody speaks
+
+    # Recording - microphone capture buffer, grown off the audio thread and spilled to a memory map
+    RECORDING_BUFFER_SECONDS: float = float(os.getenv("RECORDING_BUFFER_SECONDS", "30"))  # Preallocated capture
+    RECORDING_MEMORY_SECONDS: float = float(os.getenv("RECORDING_MEMORY_SECONDS", "600"))  # Longer: memory-mapped file
+    RECORDING_MAX_SECONDS: float = float(os.getenv("RECORDING_MAX_SECONDS", "7200"))  # Hard limit per recording
+
+    # Voice Activity Detection - adaptive threshold = noise floor x ratio (never below the silence threshold)
+    VAD_NOISE_RATIO: float = float(os.getenv("VAD_NOISE_RATIO", "3.0"))
+    VAD_MIN_SPEECH: float = float(os.getenv("VAD_MIN_SPEECH", "0.12"))  # Seconds of speech before it counts
+    VAD_CALIBRATION: float = float(os.getenv("VAD_CALIBRATION", "0.25"))  # Seconds measuring the room at the start
+    VAD_USE_ZCR: bool = os.getenv("VAD_USE_ZCR", "true").lower() == "true"  # Reject hiss-like (broadband) noise
+    VAD_ZCR_MAX: float = float(os.getenv("VAD_ZCR_MAX", "0.4"))  # Zero crossings per sample accepted as speech
+    VAD_PRE_ROLL: float = float(os.getenv("VAD_PRE_ROLL", "0.3"))  # Seconds kept before detected speech
+
+    # Speech Backends - cloud engines, or deterministic in-process stand-ins for offline runs
+    TTS_BACKEND: str = os.getenv("TTS_BACKEND", "edge").lower()  # edge or local
+    STT_BACKEND: str = os.getenv("STT_BACKEND", "openai").lower()  # openai or local
+    LOCAL_TTS_LATENCY: float = float(os.getenv("LOCAL_TTS_LATENCY", "0.2"))  # Seconds per local synthesis
+    LOCAL_STT_LATENCY: float = float(os.getenv("LOCAL_STT_LATENCY", "0.3"))  # Seconds per local transcription
+    LOCAL_STT_TRANSCRIPT: str = os.getenv("LOCAL_STT_TRANSCRIPT", "")  # Fixed local transcript ('' = describe audio)
+
+    # STT Upload - recordings are trimmed, downsampled and compressed in memory before Whisper
+    STT_SAMPLE_RATE: int = int(os.getenv("STT_SAMPLE_RATE", "16000"))  # Whisper works at 16 kHz internally
+    STT_UPLOAD_FORMAT: str = os.getenv("STT_UPLOAD_FORMAT", "flac").lower()  # flac, opus or wav
+    STT_STREAMING: bool = os.getenv("STT_STREAMING", "true").lower() == "true"  # Transcribe segments while recording
+    STT_SEGMENT_PAUSE: float = float(os.getenv("STT_SEGMENT_PAUSE", "0.6"))  # Pause (seconds) that ends a segment
+    STT_SEGMENT_MIN_SECONDS: float = float(os.getenv("STT_SEGMENT_MIN_SECONDS", "3.0"))  # Shorter segments wait for more
+    STT_STREAM_WORKERS: int = int(os.getenv("STT_STREAM_WORKERS", "3"))  # Segment uploads in flight at once
+
+    # Playback - one output stream stays open for the session, fed from a bounded chunk queue
+    PLAYBACK_BLOCK_SIZE: int = int(os.getenv("PLAYBACK_BLOCK_SIZE", "1024"))  # Frames per device callback
+    PLAYBACK_QUEUE_CHUNKS: int = int(os.getenv("PLAYBACK_QUEUE_CHUNKS", "32"))  # Chunks queued before producers wait
+
+    # Barge-in - interactive podcast listens while agents speak and stops them when the user talks
+    BARGE_IN_ENABLED: bool = os.getenv("BARGE_IN_ENABLED", "false").lower() == "true"  # Use headphones (no echo cancellation)
+    BARGE_IN_BLOCK_SIZE: int = int(os.getenv("BARGE_IN_BLOCK_SIZE", "256"))  # Input frames per detection step
+    BARGE_IN_MIN_SPEECH: float = float(os.getenv("BARGE_IN_MIN_SPEECH", "0.15"))  # Seconds of speech to interrupt
+    BARGE_IN_NOISE_RATIO: float = float(os.getenv("BARGE_IN_NOISE_RATIO", "6.0"))  # Higher than VAD_NOISE_RATIO to ignore echo
+
+    # Hands-free interactive podcast - pauses end the user's turn, keyword routing picks the agent
+    HANDS_FREE_TURN_PAUSE: float = float(os.getenv("HANDS_FREE_TURN_PAUSE", "1.2"))  # Seconds of silence ending a turn
+    HANDS_FREE_MAX_TURNS: int = int(os.getenv("HANDS_FREE_MAX_TURNS", "20"))  # Agent turns per session
+    HANDS_FREE_IDLE_TURNS: int = int(os.getenv("HANDS_FREE_IDLE_TURNS", "2"))  # Silent user turns before ending
+
+    # Speculation - interactive podcast generates every agent's reply while the user chooses
+    SPECULATION_ENABLED: bool = os.getenv("SPECULATION_ENABLED", "false").lower() == "true"
+    SPECULATION_TOKEN_BUDGET: int = int(os.getenv("SPECULATION_TOKEN_BUDGET", "20000"))  # Unused-reply tokens per session
+    SPECULATION_TOKEN_ESTIMATE: int = int(os.getenv("SPECULATION_TOKEN_ESTIMATE", "1500"))  # Per reply, until measured
+
+    # Streaming TTS - synthesize sentence chunks in parallel and start playback with the first one
+    TTS_STREAMING: bool = os.getenv("TTS_STREAMING", "true").lower() == "true"
+    TTS_STREAM_PARALLEL: int = int(os.getenv("TTS_STREAM_PARALLEL", "3"))  # Chunks synthesizing at once
+    TTS_CHUNK_MAX_CHARS: int = int(os.getenv("TTS_CHUNK_MAX_CHARS", "240"))  # Sentences merged up to this size
+    TTS_MAX_CONCURRENCY: int = int(os.getenv("TTS_MAX_CONCURRENCY", "6"))  # Edge TTS requests in flight at once
+
+    # TTS Audio Cache - decoded, resampled PCM reused across runs (disable with --no-cache)
+    TTS_CACHE_ENABLED: bool = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+    TTS_CACHE_DIR: str = os.getenv("TTS_CACHE_DIR", os.path.join(OUTPUT_DIR, ".cache", "tts"))
+    TTS_CACHE_MAX_MB: float = float(os.getenv("TTS_CACHE_MAX_MB", "500"))
+
+    # Offline Rendering - voice-chat --render writes one mixed file instead of playing live
+    RENDER_GAP_SECONDS: float = float(os.getenv("RENDER_GAP_SECONDS", "0.35"))  # Silence between speakers
+    RENDER_CROSSFADE_SECONDS: float = float(os.getenv("RENDER_CROSSFADE_SECONDS", "0"))  # Overlap instead of a gap
+
+    # Podcast Pipeline - generation/synthesis run ahead of playback
+    PODCAST_LOOKAHEAD: int = int(os.getenv("PODCAST_LOOKAHEAD", "2"))  # Generated turns waiting for synthesis
+    PODCAST_GENERATORS: int = int(os.getenv("PODCAST_GENERATORS", "3"))  # Concurrent LLM calls for independent turns
+
+    # Discussion Memory - what agents see of a podcast: recent turns verbatim plus a summary of older ones
+    DISCUSSION_RECENT_TURNS: int = int(os.getenv("DISCUSSION_RECENT_TURNS", "4"))
+    DISCUSSION_PROMPT_TOKENS: int = int(os.getenv("DISCUSSION_PROMPT_TOKENS", "700"))  # Per turn, summary included
+    DISCUSSION_SUMMARY_TOKENS: int = int(os.getenv("DISCUSSION_SUMMARY_TOKENS", "300"))
+    DISCUSSION_POINT_WORDS: int = int(os.getenv("DISCUSSION_POINT_WORDS", "30"))  # Per summarized turn
 
     @classmethod
     def validate(cls) -> bool:
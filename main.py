@@ -19,22 +19,61 @@ from typing import Optional
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.crew.marketing_crew import KarloDigitalTwin
+from src.daemon.client import TwinClient
 from config import Config
 
 # Initialize Rich console for beautiful terminal output
 console = Console()
 
-# Voice capabilities imports (lazy loaded)
-try:
-    from src.voice.audio_utils import AudioRecorder, AudioPlayer
-    from src.voice.stt import WhisperSTT
-    from src.voice.tts import EdgeTTS
-    from src.voice.podcast_orchestrator import PodcastOrchestrator
-    VOICE_AVAILABLE = True
-except ImportError as e:
-    VOICE_AVAILABLE = False
-    VOICE_IMPORT_ERROR = str(e)
+# Voice capabilities imports (lazy loaded by load_voice(); they pull in crewai and PortAudio)
+VOICE_AVAILABLE = None
+VOICE_IMPORT_ERROR = ""
+AUDIO_DEVICE_ERROR = ""
+
+
+def load_voice(require_device: bool = True) -> bool:
+    """
+    Import the voice modules on first use and report whether they are available.
+
+    Args:
+        require_device: If False, succeed without PortAudio (offline rendering only)
+    """
+    global VOICE_AVAILABLE, VOICE_IMPORT_ERROR, AUDIO_DEVICE_ERROR
+    global AudioRecorder, AudioPlayer, WhisperSTT, EdgeTTS, PodcastOrchestrator
+
+    if VOICE_AVAILABLE is None:
+        try:
+            from src.voice.audio_utils import AudioRecorder, AudioPlayer, AUDIO_DEVICE_ERROR
+            from src.voice.stt import WhisperSTT
+            from src.voice.tts import EdgeTTS
+            from src.voice.podcast_orchestrator import PodcastOrchestrator
+            VOICE_AVAILABLE = True
+        except (ImportError, OSError) as e:
+            VOICE_AVAILABLE = False
+            VOICE_IMPORT_ERROR = str(e)
+
+    if VOICE_AVAILABLE and require_device and AUDIO_DEVICE_ERROR:
+        VOICE_IMPORT_ERROR = AUDIO_DEVICE_ERROR
+        return False
+
+    return VOICE_AVAILABLE
+
+
+def get_twin():
+    """
+    Get the digital twin for a command.
+
+    Routes to a running `serve` daemon when there is one (skipping the crewai
+    import and agent construction), otherwise builds a local KarloDigitalTwin.
+    """
+    if Config.DAEMON_CLIENT_ENABLED:
+        client = TwinClient.discover()
+        if client is not None:
+            console.print(f"[dim]Using digital twin daemon at {client.url}[/dim]")
+            return client
+
+    from src.crew.marketing_crew import KarloDigitalTwin
+    return KarloDigitalTwin()
 
 
 def print_header():
@@ -76,10 +115,145 @@ def print_agents_info():
     console.print(table)
 
 
+def save_marketing_package(output_dir: str, heading: str, content: str,
+                           intermediary_outputs: Optional[dict] = None):
+    """Write the final package and every intermediary step output to output_dir."""
+    intermediary_dir = f"{output_dir}/intermediary_outputs"
+    os.makedirs(intermediary_dir, exist_ok=True)
+
+    # Save final output
+    with open(f"{output_dir}/final_marketing_package.md", "w") as f:
+        f.write(f"# {heading}\n\n")
+        f.write(content)
+
+    # Save intermediary outputs if available
+    for filename, step_content in (intermediary_outputs or {}).items():
+        with open(f"{intermediary_dir}/{filename}.md", "w") as f:
+            f.write(f"# {filename.replace('_', ' ').title()}\n\n")
+            f.write(step_content)
+
+
+def render_pipeline_stream(stream, total_steps: int = 4) -> dict:
+    """
+    Render a PipelineStream live, one panel per pipeline step.
+
+    Running steps show the tail of their output as tokens arrive, finished
+    steps collapse to a summary and later steps show as queued.
+
+    Args:
+        stream: PipelineStream from KarloDigitalTwin.stream_analyze/stream_campaign
+        total_steps: Number of steps in the pipeline (for queued placeholders)
+
+    Returns:
+        The pipeline result dictionary
+    """
+    from rich.console import Group
+    from rich.live import Live
+
+    steps = {}  # step -> {"agent", "status", "text", "cached"}
+
+    def render():
+        panels = []
+        for step in range(1, max(total_steps, max(steps, default=0)) + 1):
+            state = steps.get(step)
+            if state is None:
+                panels.append(Panel("[dim]queued[/dim]", title=f"Step {step}", border_style="dim"))
+            elif state["status"] == "done":
+                source = "cache" if state["cached"] else "done"
+                panels.append(Panel(f"[dim]✓ {source} · {len(state['text'])} chars[/dim]",
+                                    title=f"Step {step}: {state['agent']}", border_style="green"))
+            else:
+                # Tail of the text so the live view never outgrows the terminal
+                tail = "\n".join(state["text"].splitlines()[-12:]) or "[dim]thinking...[/dim]"
+                panels.append(Panel(tail, title=f"Step {step}: {state['agent']}", border_style="cyan"))
+        return Group(*panels)
+
+    with Live(render(), console=console, refresh_per_second=8, transient=True) as live:
+        for chunk in stream:
+            state = steps.setdefault(chunk.step, {"agent": chunk.agent, "status": "running",
+                                                  "text": "", "cached": False})
+            if chunk.kind == 'token':
+                state["text"] += chunk.text
+            elif chunk.kind == 'end':
+                state.update(status="done", text=chunk.text, cached=chunk.cached)
+            live.update(render())
+
+    if stream.time_to_first_token is not None:
+        console.print(f"[dim]Time to first token: {stream.time_to_first_token:.2f}s[/dim]")
+
+    return stream.result
+
+
+def campaign_dir(product: str) -> str:
+    """Output directory for a product campaign."""
+    return f"outputs/{product.replace(' ', '_').lower()}_campaign"
+
+
+def print_cache_stats(twin=None):
+    """
+    Print response cache hits/misses for this run (if caching is enabled).
+
+    Args:
+        twin: Twin the command ran on; nothing is printed for a daemon client,
+              whose cache counters live in the daemon process
+    """
+    if isinstance(twin, TwinClient):
+        return
+
+    from src.crew.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    if cache is not None:
+        stats = cache.stats()
+        console.print(f"[dim]Response cache: {stats['hits']} hits / {stats['misses']} misses[/dim]")
+
+
+def print_audio_cache_stats():
+    """Print TTS audio cache hits/misses for this run (if caching is enabled)."""
+    from src.voice.audio_cache import get_audio_cache
+
+    cache = get_audio_cache()
+    if cache is not None:
+        stats = cache.stats()
+        console.print(f"[dim]Audio cache: {stats['hits']} hits / {stats['misses']} misses "
+                      f"({stats['hit_rate']:.0%} hit rate)[/dim]")
+
+
+def finish_run_metrics():
+    """Export this command's metrics and print a one-line summary."""
+    from src.crew.instrumentation import get_instrumentation
+
+    run = get_instrumentation().finish_run()
+    if run is not None:
+        llm = run['stages'].get('llm', {})
+        console.print(f"[dim]Metrics: {llm.get('count', 0)} LLM calls, "
+                      f"{run['prompt_tokens'] + run['completion_tokens']:,} tokens, "
+                      f"~${run['cost']:.4f} in {run['elapsed']:.1f}s ({Config.METRICS_PATH})[/dim]")
+
+
+# Commands that only read local state are not recorded as runs
+# (the daemon records each request it serves as a run of its own)
+UNMETERED_COMMANDS = {'stats', 'cache', 'info', 'serve'}
+
+
 @click.group()
-def cli():
+@click.option('--no-cache', is_flag=True, help='Bypass the on-disk LLM response and TTS audio caches')
+@click.option('--local', is_flag=True, help='Run in this process even if a daemon is running')
+@click.pass_context
+def cli(ctx: click.Context, no_cache: bool, local: bool):
     """Karlo's Digital Twin - Marketing Intelligence System"""
-    pass
+    if Config.METRICS_ENABLED and ctx.invoked_subcommand not in UNMETERED_COMMANDS:
+        from src.crew.instrumentation import get_instrumentation
+        get_instrumentation().start_run(ctx.invoked_subcommand)
+        ctx.call_on_close(finish_run_metrics)
+
+    if no_cache:
+        Config.LLM_CACHE_ENABLED = False
+        Config.TTS_CACHE_ENABLED = False
+        # The daemon has its own cache settings, so honour --no-cache locally
+        Config.DAEMON_CLIENT_ENABLED = False
+    if local:
+        Config.DAEMON_CLIENT_ENABLED = False
 
 
 @cli.command()
@@ -137,7 +311,7 @@ def about():
         task = progress.add_task("[cyan]Summarizing background...", total=None)
 
         try:
-            twin = KarloDigitalTwin()
+            twin = get_twin()
 
             # Hardcoded backup in case API fails
             background = """Karlo Vrančić is a 22-year-old student from Croatia pursuing MS degrees at Harvard
@@ -172,7 +346,9 @@ Karlo works on combining technical skills with creative problem-solving in his e
 
 @cli.command()
 @click.option('--topic', '-t', help='Specific topic to analyze')
-def analyze(topic: Optional[str]):
+@click.option('--stream/--no-stream', default=Config.LLM_STREAMING,
+              help='Show each agent\'s output live as it is generated')
+def analyze(topic: Optional[str], stream: bool):
     """Analyze current trends or a specific topic."""
     print_header()
 
@@ -189,8 +365,12 @@ def analyze(topic: Optional[str]):
         task = progress.add_task("[cyan]Running marketing analysis pipeline...", total=None)
 
         try:
-            twin = KarloDigitalTwin()
-            result = twin.analyze(topic)
+            twin = get_twin()
+            if stream and hasattr(twin, 'stream_analyze'):
+                progress.stop()
+                result = render_pipeline_stream(twin.stream_analyze(topic))
+            else:
+                result = twin.analyze(topic)
 
             progress.stop()
 
@@ -203,28 +383,16 @@ def analyze(topic: Optional[str]):
             )
             console.print(panel)
 
-            # Create output directory structure
+            # Save final and intermediary outputs
             topic_dir = f"outputs/{topic.replace(' ', '_').lower()}"
-            intermediary_dir = f"{topic_dir}/intermediary_outputs"
-            os.makedirs(intermediary_dir, exist_ok=True)
-
-            # Save final output
-            final_output_file = f"{topic_dir}/final_marketing_package.md"
-            with open(final_output_file, "w") as f:
-                f.write(f"# Final Marketing Package: {topic}\n\n")
-                f.write(str(result.get("analysis", "")))
-
-            # Save intermediary outputs if available
-            if "intermediary_outputs" in result:
-                for filename, content in result.get("intermediary_outputs", {}).items():
-                    intermediary_file = f"{intermediary_dir}/{filename}.md"
-                    with open(intermediary_file, "w") as f:
-                        f.write(f"# {filename.replace('_', ' ').title()}\n\n")
-                        f.write(content)
+            save_marketing_package(topic_dir, f"Final Marketing Package: {topic}",
+                                   str(result.get("analysis", "")),
+                                   result.get("intermediary_outputs"))
 
             console.print(f"\n[green]✓ Analysis saved to {topic_dir}/[/green]")
             console.print(f"  [cyan]→ Final package: final_marketing_package.md[/cyan]")
             console.print(f"  [cyan]→ Intermediary outputs: intermediary_outputs/[/cyan]")
+            print_cache_stats(twin)
 
         except Exception as e:
             progress.stop()
@@ -233,10 +401,20 @@ def analyze(topic: Optional[str]):
 
 @cli.command()
 @click.option('--product', '-p', help='Product to create campaign for')
-def campaign(product: Optional[str]):
+@click.option('--batch', '-b', type=click.Path(exists=True, dir_okay=False),
+              help='File with one product per line (# for comments)')
+@click.option('--workers', '-w', default=Config.BATCH_WORKERS, show_default=True,
+              help='Products generated in parallel in batch mode')
+@click.option('--stream/--no-stream', default=Config.LLM_STREAMING,
+              help='Show each agent\'s output live as it is generated')
+def campaign(product: Optional[str], batch: Optional[str], workers: int, stream: bool):
     """Generate a complete marketing campaign for a product."""
     print_header()
 
+    if batch:
+        run_campaign_batch(batch, workers)
+        return
+
     if not product:
         product = Prompt.ask("[cyan]What product should I create a campaign for?[/cyan]",
                            default="developer humor t-shirts")
@@ -251,8 +429,12 @@ def campaign(product: Optional[str]):
         task = progress.add_task("[cyan]Creating marketing campaign...", total=None)
 
         try:
-            twin = KarloDigitalTwin()
-            result = twin.campaign(product)
+            twin = get_twin()
+            if stream and hasattr(twin, 'stream_campaign'):
+                progress.stop()
+                result = render_pipeline_stream(twin.stream_campaign(product))
+            else:
+                result = twin.campaign(product)
 
             progress.stop()
 
@@ -265,34 +447,74 @@ def campaign(product: Optional[str]):
             )
             console.print(panel)
 
-            # Create output directory structure
-            product_dir = f"outputs/{product.replace(' ', '_').lower()}_campaign"
-            intermediary_dir = f"{product_dir}/intermediary_outputs"
-            os.makedirs(intermediary_dir, exist_ok=True)
-
-            # Save final output
-            final_output_file = f"{product_dir}/final_marketing_package.md"
-            with open(final_output_file, "w") as f:
-                f.write(f"# Final Marketing Campaign: {product}\n\n")
-                f.write(str(result.get("campaign", "")))
-
-            # Save intermediary outputs if available
-            if "intermediary_outputs" in result:
-                for filename, content in result.get("intermediary_outputs", {}).items():
-                    intermediary_file = f"{intermediary_dir}/{filename}.md"
-                    with open(intermediary_file, "w") as f:
-                        f.write(f"# {filename.replace('_', ' ').title()}\n\n")
-                        f.write(content)
+            # Save final and intermediary outputs
+            product_dir = campaign_dir(product)
+            save_marketing_package(product_dir, f"Final Marketing Campaign: {product}",
+                                   str(result.get("campaign", "")),
+                                   result.get("intermediary_outputs"))
 
             console.print(f"\n[green]✓ Campaign saved to {product_dir}/[/green]")
             console.print(f"  [cyan]→ Final package: final_marketing_package.md[/cyan]")
             console.print(f"  [cyan]→ Intermediary outputs: intermediary_outputs/[/cyan]")
+            print_cache_stats(twin)
 
         except Exception as e:
             progress.stop()
             console.print(f"[red]Error during campaign generation: {str(e)}[/red]")
 
 
+def run_campaign_batch(batch_file: str, workers: int):
+    """Generate campaigns for every product in batch_file and print a throughput summary."""
+    with open(batch_file) as f:
+        products = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+    if not products:
+        console.print(f"[red]No products found in {batch_file}[/red]")
+        return
+
+    console.print(f"\n[bold cyan]🚀 Batch Campaigns: {len(products)} products, {workers} workers, "
+                  f"{Config.LLM_MAX_RPM or 'unlimited'} requests/min shared[/bold cyan]\n")
+
+    def on_complete(result: dict):
+        # Runs in the worker thread: write each product as soon as it is done
+        product = result["product"]
+        if result["status"] == "failed":
+            console.print(f"[red]✗ {product} failed after {result['elapsed']:.1f}s: {result['error']}[/red]")
+            return
+
+        product_dir = campaign_dir(product)
+        save_marketing_package(product_dir, f"Final Marketing Campaign: {product}",
+                               result["campaign"], result.get("intermediary_outputs"))
+        console.print(f"[green]✓ {product}[/green] [dim]({result['elapsed']:.1f}s) → {product_dir}/[/dim]")
+
+    # Batches always run locally: the worker pool lives in this process
+    from src.crew.marketing_crew import KarloDigitalTwin
+
+    start = time.time()
+    twin = KarloDigitalTwin()
+    results = twin.campaign_many(products, workers=workers, on_complete=on_complete)
+    wall_time = time.time() - start
+
+    # Throughput summary
+    table = Table(title="📈 Batch Summary", show_header=True, header_style="bold magenta")
+    table.add_column("Product", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right", style="yellow")
+    for result in results:
+        status = "[green]completed[/green]" if result["status"] == "completed" else "[red]failed[/red]"
+        table.add_row(result["product"], status, f"{result['elapsed']:.1f}s")
+    console.print()
+    console.print(table)
+
+    succeeded = sum(1 for r in results if r["status"] == "completed")
+    serial_time = sum(r["elapsed"] for r in results)
+    console.print(f"\n  Completed: [green]{succeeded}[/green] / {len(results)}")
+    console.print(f"  Wall time: [yellow]{wall_time:.1f}s[/yellow] "
+                  f"(sum of per-product times {serial_time:.1f}s, {serial_time / max(wall_time, 1e-9):.1f}x overlap)")
+    console.print(f"  Throughput: [yellow]{succeeded / wall_time * 60:.2f} campaigns/min[/yellow]")
+    print_cache_stats()
+
+
 @cli.command()
 def trend():
     """Quick trend analysis without full pipeline."""
@@ -310,7 +532,7 @@ def trend():
         task = progress.add_task("[cyan]Analyzing trend...", total=None)
 
         try:
-            twin = KarloDigitalTwin()
+            twin = get_twin()
             result = twin.quick_take(query)
 
             progress.stop()
@@ -328,6 +550,145 @@ def trend():
             console.print(f"[red]Error: {str(e)}[/red]")
 
 
+@cli.command()
+@click.option('--clear', is_flag=True, help='Delete every cached response and audio clip')
+def cache(clear: bool):
+    """Show statistics for the on-disk LLM response and TTS audio caches."""
+    print_header()
+    console.print("\n[bold cyan]🗄️  LLM Response Cache[/bold cyan]\n")
+
+    from src.crew.response_cache import ResponseCache
+    response_cache = ResponseCache()
+
+    if clear:
+        response_cache.clear()
+        console.print("[green]✓ Cache cleared[/green]")
+
+    stats = response_cache.stats()
+    table = Table(show_header=False)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="yellow")
+    table.add_row("Path", stats["path"])
+    table.add_row("Entries", f"{stats['entries']} / {response_cache.max_entries}")
+    table.add_row("Size", f"{stats['bytes'] / 1024:.1f} KB")
+    table.add_row("Lifetime hits", str(stats["lifetime_hits"]))
+    table.add_row("Max age", f"{Config.LLM_CACHE_MAX_AGE_DAYS:g} days")
+    console.print(table)
+
+    console.print("\n[bold cyan]🔊 TTS Audio Cache[/bold cyan]\n")
+    try:
+        # Importing the voice package loads PortAudio
+        from src.voice.audio_cache import AudioCache
+    except (ImportError, OSError) as e:
+        console.print(f"[yellow]Voice capabilities not available: {e}[/yellow]")
+        return
+    audio_cache = AudioCache()
+
+    if clear:
+        audio_cache.clear()
+        console.print("[green]✓ Audio cache cleared[/green]")
+
+    stats = audio_cache.stats()
+    table = Table(show_header=False)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="yellow")
+    table.add_row("Path", stats["path"])
+    table.add_row("Clips", str(stats["entries"]))
+    table.add_row("Size", f"{stats['bytes'] / 1024 / 1024:.1f} MB / {Config.TTS_CACHE_MAX_MB:g} MB")
+    table.add_row("Lifetime hits", str(stats["lifetime_hits"]))
+    console.print(table)
+
+
+@cli.command()
+@click.option('--runs', '-n', default=Config.METRICS_HISTORY_RUNS, show_default=True,
+              help='Most recent runs to include')
+@click.option('--command', '-c', 'command_filter', help='Only runs of this command (e.g. campaign)')
+def stats(runs: int, command_filter: Optional[str]):
+    """Show p50/p95 latency, tokens and cost per stage over recent runs."""
+    from src.crew.instrumentation import STAGES, Instrumentation, summarize
+
+    print_header()
+    spans = Instrumentation.load_spans(Config.METRICS_PATH, runs, command=command_filter)
+    if not spans:
+        console.print(f"[yellow]No metrics recorded yet ({Config.METRICS_PATH}).[/yellow]")
+        return
+
+    run_count = len({span['run'] for span in spans})
+    scope = f" of '{command_filter}'" if command_filter else ""
+    console.print(f"\n[bold cyan]📈 Last {run_count} runs{scope}[/bold cyan] [dim]({len(spans)} spans)[/dim]\n")
+
+    table = Table()
+    table.add_column("Stage", style="cyan")
+    for column in ("Calls", "Cached", "p50", "p95", "Max", "Queue p95", "Tokens in/out", "Cost"):
+        table.add_column(column, justify="right", style="yellow")
+
+    by_stage = summarize(spans)
+    for stage in sorted(by_stage, key=lambda name: STAGES.index(name) if name in STAGES else len(STAGES)):
+        row = by_stage[stage]
+        table.add_row(stage, str(row['count']), str(row['cached']),
+                      f"{row['p50']:.2f}s", f"{row['p95']:.2f}s", f"{row['max']:.2f}s",
+                      f"{row['queue_p95']:.2f}s",
+                      f"{row['prompt_tokens'] / 1000:.1f}k/{row['completion_tokens'] / 1000:.1f}k", f"${row['cost']:.4f}")
+    console.print(table)
+
+    # Where the time and money go: the costliest agents, steps, tools and engines
+    by_name = summarize([{**span, 'where': f"{span['stage']}: {span['name']}"} for span in spans],
+                        key='where')
+    table = Table(title="Top agents / steps")
+    table.add_column("Stage: name", style="cyan")
+    for column in ("Calls", "p50", "p95", "Total", "Cost"):
+        table.add_column(column, justify="right", style="yellow")
+    for where, row in sorted(by_name.items(), key=lambda item: (item[1]['cost'], item[1]['total']),
+                             reverse=True)[:12]:
+        table.add_row(where, str(row['count']), f"{row['p50']:.2f}s", f"{row['p95']:.2f}s",
+                      f"{row['total']:.1f}s", f"${row['cost']:.4f}")
+    console.print(table)
+    console.print(f"\n[dim]Prometheus textfile: {Config.METRICS_TEXTFILE}[/dim]")
+
+
+@cli.command()
+@click.option('--host', default=Config.DAEMON_HOST, show_default=True, help='Interface to bind')
+@click.option('--port', default=Config.DAEMON_PORT, show_default=True, help='Port to listen on')
+@click.option('--workers', '-w', default=Config.DAEMON_WORKERS, show_default=True,
+              help='Requests served concurrently (one warm twin each)')
+@click.option('--stop', is_flag=True, help='Stop the running daemon')
+def serve(host: str, port: int, workers: int, stop: bool):
+    """Keep a warm digital twin in memory and serve it over localhost HTTP."""
+    print_header()
+
+    if stop:
+        client = TwinClient.discover()
+        if client is None:
+            console.print("[yellow]No daemon is running.[/yellow]")
+        else:
+            client.shutdown()
+            console.print(f"[green]✓ Daemon at {client.url} stopped[/green]")
+        return
+
+    running = TwinClient.discover()
+    if running is not None:
+        console.print(f"[yellow]A daemon is already running at {running.url}[/yellow]")
+        return
+
+    from src.daemon.server import TwinServer
+
+    with console.status("[cyan]Warming up agents..."):
+        start = time.time()
+        server = TwinServer(host=host, port=port, workers=workers)
+        server.warm_up()
+
+    console.print(f"[green]✓ Digital twin daemon ready in {time.time() - start:.1f}s[/green]")
+    console.print(f"  [cyan]→ http://{host}:{port} ({workers} workers)[/cyan]")
+    console.print("  [dim]Other commands now route here automatically (use --local to opt out)[/dim]")
+    console.print("  [dim]Press Ctrl+C or run 'python main.py serve --stop' to stop[/dim]\n")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    console.print("[yellow]Daemon stopped.[/yellow]")
+
+
 @cli.command()
 def info():
     """Display information about the digital twin and its agents."""
@@ -341,6 +702,9 @@ def info():
         ("analyze", "Analyze trends and generate marketing insights"),
         ("campaign", "Create a complete marketing campaign"),
         ("trend", "Quick trend analysis"),
+        ("cache", "Show or clear the LLM response cache"),
+        ("stats", "Latency, tokens and cost per stage over recent runs"),
+        ("serve", "Run a warm daemon that other commands route to"),
         ("info", "Display this information"),
     ]
 
@@ -352,13 +716,15 @@ def info():
         ("voice-chat", "Podcast-style discussion with voice input/output"),
         ("test-mic", "Test microphone recording"),
         ("test-voices", "Test TTS voices for each agent"),
+        ("podcast-batch", "Render episodes for many topics to audio files"),
     ]
 
+    voice_available = load_voice()
     for cmd, desc in voice_commands:
-        status = "[green]✓[/green]" if VOICE_AVAILABLE else "[red]✗[/red]"
+        status = "[green]✓[/green]" if voice_available else "[red]✗[/red]"
         console.print(f"  {status} [green]{cmd:12}[/green] - {desc}")
 
-    if not VOICE_AVAILABLE:
+    if not voice_available:
         console.print("\n[yellow]⚠️  Voice features require additional setup:[/yellow]")
         console.print("  1. pip install -r requirements.txt")
         console.print("  2. brew install portaudio (macOS)")
@@ -368,22 +734,79 @@ def info():
     console.print(f"  Lite Model (simple tasks): [yellow]{Config.LITE_MODEL}[/yellow]")
     console.print(f"  Pro Model (complex tasks): [yellow]{Config.PRO_MODEL}[/yellow]")
     console.print(f"  API: [yellow]OpenRouter[/yellow]")
-    console.print(f"  Crew Mode: [yellow]Sequential (Philosopher → Architect → Optimizer)[/yellow]")
+    console.print(f"  Crew Mode: [yellow]DAG (independent tasks run concurrently, {Config.CREW_MAX_WORKERS} workers)[/yellow]")
+    cache_status = "enabled" if Config.LLM_CACHE_ENABLED else "disabled"
+    console.print(f"  Response Cache: [yellow]{cache_status} ({Config.LLM_CACHE_PATH})[/yellow]")
+    audio_cache_status = "enabled" if Config.TTS_CACHE_ENABLED else "disabled"
+    console.print(f"  TTS Audio Cache: [yellow]{audio_cache_status} ({Config.TTS_CACHE_DIR})[/yellow]")
+    console.print(f"  Speech Backends: [yellow]TTS {Config.TTS_BACKEND}, STT {Config.STT_BACKEND}[/yellow]")
 
     console.print("\n[bold cyan]📊 Model Usage:[/bold cyan]")
     console.print(f"  [green]Lite Model[/green] → introduce, about")
     console.print(f"  [green]Pro Model[/green] → analyze, campaign, trend")
 
 
+def render_podcast(topic: Optional[str], rounds: int, output_path: str, gap: float, crossfade: float):
+    """Headless voice-chat: render the discussion to one audio file (no sound device needed)."""
+    if not topic:
+        console.print("[red]--render needs a --topic (there is no microphone input when rendering)[/red]")
+        return
+
+    if not load_voice(require_device=False):
+        console.print(f"[red]✗ Voice capabilities not available[/red]")
+        console.print(f"[yellow]Error: {VOICE_IMPORT_ERROR}[/yellow]")
+        return
+
+    console.print(f"\n[bold cyan]💾 Rendering Podcast to {output_path}[/bold cyan]\n")
+
+    try:
+        orchestrator = PodcastOrchestrator(use_lite=False, voice=False)
+        start = time.time()
+        result = orchestrator.render_discussion(topic, output_path, rounds=rounds,
+                                                gap=gap, crossfade=crossfade)
+        elapsed = time.time() - start
+
+        orchestrator.save_transcript(result)
+
+        console.print("\n[green]✅ Podcast rendered![/green]")
+        console.print(f"[cyan]Topic:[/cyan] {result['topic']}")
+        console.print(f"[cyan]Audio:[/cyan] {result['output_path']} ({result['duration']:.1f}s)")
+        console.print(f"[cyan]Render time:[/cyan] {elapsed:.1f}s "
+                      f"({result['duration'] / elapsed:.1f}x real time)")
+        print_audio_cache_stats()
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Rendering cancelled.[/yellow]")
+    except Exception as e:
+        console.print(f"\n[red]Error during rendering: {str(e)}[/red]")
+
+
 @cli.command()
 @click.option('--topic', '-t', help='Topic to discuss (optional, can use voice input)')
 @click.option('--rounds', '-r', default=2, help='Number of discussion rounds (default: 2)')
 @click.option('--interactive', '-i', is_flag=True, help='Interactive mode - you participate in the discussion')
-def voice_chat(topic: Optional[str], rounds: int, interactive: bool):
+@click.option('--barge-in/--no-barge-in', default=Config.BARGE_IN_ENABLED, show_default=True,
+              help='Interactive mode: interrupt an agent by speaking (use headphones)')
+@click.option('--hands-free', is_flag=True,
+              help='Interactive mode without the keyboard: pause to hand over, agents picked by keywords')
+@click.option('--speculate/--no-speculate', default=Config.SPECULATION_ENABLED, show_default=True,
+              help='Interactive mode: generate every agent\'s reply while you choose (costs extra tokens)')
+@click.option('--render', type=click.Path(dir_okay=False),
+              help='Render the discussion to an audio file (e.g. out.wav) instead of playing it')
+@click.option('--gap', default=Config.RENDER_GAP_SECONDS, show_default=True,
+              help='Seconds of silence between speakers when rendering')
+@click.option('--crossfade', default=Config.RENDER_CROSSFADE_SECONDS, show_default=True,
+              help='Seconds by which speakers overlap when rendering (replaces the gap)')
+def voice_chat(topic: Optional[str], rounds: int, interactive: bool, barge_in: bool,
+               hands_free: bool, speculate: bool, render: Optional[str], gap: float, crossfade: float):
     """Voice-enabled podcast discussion mode with real-time speech."""
     print_header()
 
-    if not VOICE_AVAILABLE:
+    if render:
+        render_podcast(topic, rounds, render, gap, crossfade)
+        return
+
+    if not load_voice():
         console.print(f"[red]✗ Voice capabilities not available[/red]")
         console.print(f"[yellow]Error: {VOICE_IMPORT_ERROR}[/yellow]")
         console.print("\n[cyan]To enable voice features:[/cyan]")
@@ -402,18 +825,24 @@ def voice_chat(topic: Optional[str], rounds: int, interactive: bool):
     try:
         if interactive:
             # Interactive mode - user participates
-            orchestrator = InteractivePodcast(use_lite=False)
+            orchestrator = InteractivePodcast(use_lite=False, barge_in=barge_in, speculate=speculate)
 
-            # Get topic if not provided
-            if not topic:
-                console.print("[yellow]Please provide a topic:[/yellow]")
-                topic = input("> ").strip()
+            try:
+                # Get topic if not provided
                 if not topic:
-                    console.print("[red]No topic provided. Cancelled.[/red]")
-                    return
-
-            # Run interactive discussion
-            result = orchestrator.run_interactive_discussion(topic)
+                    console.print("[yellow]Please provide a topic:[/yellow]")
+                    topic = input("> ").strip()
+                    if not topic:
+                        console.print("[red]No topic provided. Cancelled.[/red]")
+                        return
+
+                # Run interactive discussion
+                if hands_free:
+                    result = orchestrator.run_hands_free(topic)
+                else:
+                    result = orchestrator.run_interactive_discussion(topic)
+            finally:
+                orchestrator.close()
 
             # Save transcript
             orchestrator.save_transcript(result)
@@ -421,11 +850,16 @@ def voice_chat(topic: Optional[str], rounds: int, interactive: bool):
             console.print("\n[green]✅ Interactive podcast complete![/green]")
             console.print(f"[cyan]Topic:[/cyan] {result['topic']}")
             console.print(f"[cyan]Contributions:[/cyan] {len(result['transcript'])}")
+            if 'turn_gap' in result:
+                console.print(f"[cyan]End of speech → agent audio:[/cyan] "
+                              f"mean {result['turn_gap']['mean']:.2f}s, max {result['turn_gap']['max']:.2f}s")
+            if 'response_time' in result:
+                console.print(f"[cyan]Agent response time:[/cyan] "
+                              f"mean {result['response_time']['mean']:.2f}s, max {result['response_time']['max']:.2f}s")
 
         else:
             # Regular podcast mode - agents only
             stt = WhisperSTT()
-            recorder = AudioRecorder()
             orchestrator = PodcastOrchestrator(use_lite=False)
 
             # Get topic via voice or parameter
@@ -434,13 +868,14 @@ def voice_chat(topic: Optional[str], rounds: int, interactive: bool):
                 console.print("[dim]Press Ctrl+C to cancel[/dim]\n")
 
                 # Record audio
-                audio_file = recorder.record_to_file()
+                recorder = AudioRecorder()
+                try:
+                    audio = recorder.record()
 
-                console.print("[cyan]🔄 Transcribing...[/cyan]")
-                topic = stt.transcribe(audio_file)
-
-                # Clean up temp file
-                os.remove(audio_file)
+                    console.print("[cyan]🔄 Transcribing...[/cyan]")
+                    topic = stt.transcribe_audio(audio, recorder.sample_rate)
+                finally:
+                    recorder.close()
 
                 console.print(f"\n[green]✓ You said:[/green] [bold]{topic}[/bold]\n")
 
@@ -468,6 +903,8 @@ def voice_chat(topic: Optional[str], rounds: int, interactive: bool):
             console.print(f"[cyan]Rounds:[/cyan] {result['rounds']}")
             console.print(f"[cyan]Contributions:[/cyan] {len(result['transcript'])}")
 
+        print_audio_cache_stats()
+
     except KeyboardInterrupt:
         console.print("\n[yellow]Voice chat cancelled.[/yellow]")
     except Exception as e:
@@ -476,13 +913,77 @@ def voice_chat(topic: Optional[str], rounds: int, interactive: bool):
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
 
 
+@cli.command('podcast-batch')
+@click.argument('topics_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--workers', '-w', default=Config.BATCH_WORKERS, show_default=True,
+              help='Episodes produced in parallel')
+@click.option('--rounds', '-r', default=2, show_default=True, help='Discussion rounds per episode')
+def podcast_batch(topics_file: str, workers: int, rounds: int):
+    """Render podcast episodes for every topic in a file (one per line, headless)."""
+    print_header()
+
+    with open(topics_file) as f:
+        topics = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+    if not topics:
+        console.print(f"[red]No topics found in {topics_file}[/red]")
+        return
+
+    if not load_voice(require_device=False):
+        console.print(f"[red]✗ Voice capabilities not available[/red]")
+        console.print(f"[yellow]Error: {VOICE_IMPORT_ERROR}[/yellow]")
+        return
+
+    console.print(f"\n[bold cyan]🎙️  Batch Podcasts: {len(topics)} topics, {workers} workers, {rounds} rounds, "
+                  f"{Config.LLM_MAX_RPM or 'unlimited'} requests/min shared[/bold cyan]\n")
+
+    def on_complete(result: dict):
+        # Runs in the worker thread: audio and transcript are already written
+        topic = result["topic"]
+        if result["status"] == "failed":
+            console.print(f"[red]✗ {topic} failed after {result['elapsed']:.1f}s: {result['error']}[/red]")
+            return
+
+        console.print(f"[green]✓ {topic}[/green] [dim]({result['elapsed']:.1f}s, "
+                      f"{result['duration']:.0f}s audio) → {result['output_path']}[/dim]")
+
+    start = time.time()
+    results = PodcastOrchestrator.render_many(topics, rounds=rounds, workers=workers,
+                                              on_complete=on_complete)
+    wall_time = time.time() - start
+
+    # Throughput summary
+    table = Table(title="📈 Batch Summary", show_header=True, header_style="bold magenta")
+    table.add_column("Topic", style="cyan")
+    table.add_column("Status")
+    table.add_column("Audio", justify="right")
+    table.add_column("Time", justify="right", style="yellow")
+    for result in results:
+        status = "[green]completed[/green]" if result["status"] == "completed" else "[red]failed[/red]"
+        audio = f"{result['duration']:.0f}s" if result["status"] == "completed" else "-"
+        table.add_row(result["topic"], status, audio, f"{result['elapsed']:.1f}s")
+    console.print()
+    console.print(table)
+
+    succeeded = [r for r in results if r["status"] == "completed"]
+    serial_time = sum(r["elapsed"] for r in results)
+    audio_time = sum(r["duration"] for r in succeeded)
+    console.print(f"\n  Completed: [green]{len(succeeded)}[/green] / {len(results)}")
+    console.print(f"  Wall time: [yellow]{wall_time:.1f}s[/yellow] "
+                  f"(sum of per-topic times {serial_time:.1f}s, {serial_time / max(wall_time, 1e-9):.1f}x overlap)")
+    console.print(f"  Throughput: [yellow]{len(succeeded) / wall_time * 3600:.1f} episodes/hour[/yellow], "
+                  f"{audio_time / max(wall_time, 1e-9):.1f}x real time")
+    print_cache_stats()
+    print_audio_cache_stats()
+
+
 @cli.command()
 def test_mic():
     """Test microphone input and recording."""
     print_header()
     console.print("\n[bold cyan]🎤 Microphone Test[/bold cyan]\n")
 
-    if not VOICE_AVAILABLE:
+    if not load_voice():
         console.print(f"[red]✗ Voice capabilities not available[/red]")
         console.print(f"[yellow]Error: {VOICE_IMPORT_ERROR}[/yellow]")
         return
@@ -502,7 +1003,7 @@ def test_voices(voice: Optional[str]):
     print_header()
     console.print("\n[bold cyan]🔊 Voice Test[/bold cyan]\n")
 
-    if not VOICE_AVAILABLE:
+    if not load_voice():
         console.print(f"[red]✗ Voice capabilities not available[/red]")
         console.print(f"[yellow]Error: {VOICE_IMPORT_ERROR}[/yellow]")
         return
@@ -525,22 +1026,30 @@ def test_voices(voice: Optional[str]):
                 'optimizer': ('Brutalist Optimizer', "Your speech synthesis latency is acceptable. Optimization complete."),
             }
 
-            for agent_name, (display_name, test_text) in agents.items():
+            # Synthesize every agent's sample at once, then play them in turn
+            clips = tts.synthesize_many(
+                [test_text for _, test_text in agents.values()],
+                [tts.get_agent_voice(agent_name) for agent_name in agents]
+            )
+
+            player = AudioPlayer()
+            for (agent_name, (display_name, test_text)), audio in zip(agents.items(), clips):
                 console.print(f"\n[bold]{display_name}[/bold]")
                 console.print(f"  Text: {test_text}")
 
                 voice_id = tts.get_agent_voice(agent_name)
                 console.print(f"  Voice: {voice_id}")
 
-                audio = tts.speak_as_agent(test_text, agent_name)
-
-                player = AudioPlayer()
                 player.play(audio, blocking=True)
 
                 console.print("  [green]✓ Complete[/green]")
 
+            player.close()
+
             console.print("\n[green]✓ All voice tests complete![/green]")
 
+        print_audio_cache_stats()
+
     except Exception as e:
         console.print(f"\n[red]✗ Voice test failed: {str(e)}[/red]")
         import traceback
@@ -555,7 +1064,7 @@ def interactive():
     console.print("\n[bold cyan]🎮 Interactive Mode[/bold cyan]")
     console.print("[dim]Type 'help' for commands, 'exit' to quit[/dim]\n")
 
-    twin = KarloDigitalTwin()
+    twin = get_twin()
 
     while True:
         command = Prompt.ask("[cyan]Command[/cyan]").lower().strip()
@@ -20,18 +20,27 @@ class CynicalContentArchitect:
     has more cultural impact than a 300-page novel.
     """
 
-    def create(self, use_lite: bool = False) -> Agent:
-        """Create and return the Cynical Content Architect agent."""
-
-        # Configure LLM with OpenRouter
-        llm_config = Config.get_llm_config(use_lite=use_lite)
-
-        # Create LLM instance for CrewAI
-        llm = LLM(
-            model=f"openrouter/{llm_config['model']}",
-            api_key=llm_config['api_key'],
-            base_url=llm_config['base_url']
-        )
+    def create(self, use_lite: bool = False, podcast_mode: bool = False,
+               llm: Optional[LLM] = None, tools: Optional[list] = None) -> Agent:
+        """Create and return the Cynical Content Architect agent.
+
+        Args:
+            use_lite: If True, use lite model
+            podcast_mode: If True, create a quiet (non-verbose) agent for podcasts
+            llm: Shared LLM client (created from Config if None)
+            tools: Shared tool instances (a new FileWriterTool if None)
+        """
+
+        # Reuse a shared LLM client when given, otherwise configure one for OpenRouter
+        if llm is None:
+            llm_config = Config.get_llm_config(use_lite=use_lite)
+
+            # Create LLM instance for CrewAI
+            llm = LLM(
+                model=f"openrouter/{llm_config['model']}",
+                api_key=llm_config['api_key'],
+                base_url=llm_config['base_url']
+            )
 
         return Agent(
             role="Creative Director & Multi-platform Writer",
@@ -80,9 +89,9 @@ class CynicalContentArchitect:
             Your creative process is part jazz, part algorithm - improvisational but calculated.
             Like a basketball player, you know when to pass and when to shoot.""",
 
-            tools=[FileWriterTool()],  # For creating content files
+            tools=tools if tools is not None else [FileWriterTool()],  # For creating content files
 
-            verbose=True,
+            verbose=not podcast_mode,
 
             allow_delegation=False,
 
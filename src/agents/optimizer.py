@@ -20,26 +20,33 @@ class BrutalistOptimizer:
     Finds beauty in clean sitemaps and emotional resonance in 70% conversion rates.
     """
 
-    def create(self, use_lite: bool = False, podcast_mode: bool = False) -> Agent:
+    def create(self, use_lite: bool = False, podcast_mode: bool = False,
+               llm: Optional[LLM] = None, tools: Optional[list] = None) -> Agent:
         """Create and return the Brutalist Optimizer agent.
 
         Args:
             use_lite: If True, use lite model
             podcast_mode: If True, disable tools for conversational podcast
+            llm: Shared LLM client (created from Config if None)
+            tools: Shared tool instances (a new FileWriterTool if None)
         """
 
-        # Configure LLM with OpenRouter
-        llm_config = Config.get_llm_config(use_lite=use_lite)
+        # Reuse a shared LLM client when given, otherwise configure one for OpenRouter
+        if llm is None:
+            llm_config = Config.get_llm_config(use_lite=use_lite)
 
-        # Create LLM instance for CrewAI
-        llm = LLM(
-            model=f"openrouter/{llm_config['model']}",
-            api_key=llm_config['api_key'],
-            base_url=llm_config['base_url']
-        )
+            # Create LLM instance for CrewAI
+            llm = LLM(
+                model=f"openrouter/{llm_config['model']}",
+                api_key=llm_config['api_key'],
+                base_url=llm_config['base_url']
+            )
 
         # Only use tools in normal mode, not podcast mode
-        tools = [] if podcast_mode else [FileWriterTool()]
+        if podcast_mode:
+            tools = []
+        elif tools is None:
+            tools = [FileWriterTool()]
 
         return Agent(
             role="Technical SEO & Conversion Analyst",
@@ -20,18 +20,27 @@ class ZeitgeistPhilosopher:
     Sees memes as cultural artifacts representing collective psychological needs.
     """
 
-    def create(self, use_lite: bool = False) -> Agent:
-        """Create and return the Zeitgeist Philosopher agent."""
-
-        # Configure LLM with OpenRouter
-        llm_config = Config.get_llm_config(use_lite=use_lite)
-
-        # Create LLM instance for CrewAI
-        llm = LLM(
-            model=f"openrouter/{llm_config['model']}",
-            api_key=llm_config['api_key'],
-            base_url=llm_config['base_url']
-        )
+    def create(self, use_lite: bool = False, podcast_mode: bool = False,
+               llm: Optional[LLM] = None, tools: Optional[list] = None) -> Agent:
+        """Create and return the Zeitgeist Philosopher agent.
+
+        Args:
+            use_lite: If True, use lite model
+            podcast_mode: If True, create a quiet (non-verbose) agent for podcasts
+            llm: Shared LLM client (created from Config if None)
+            tools: Shared tool instances (a new SerperDevTool if None)
+        """
+
+        # Reuse a shared LLM client when given, otherwise configure one for OpenRouter
+        if llm is None:
+            llm_config = Config.get_llm_config(use_lite=use_lite)
+
+            # Create LLM instance for CrewAI
+            llm = LLM(
+                model=f"openrouter/{llm_config['model']}",
+                api_key=llm_config['api_key'],
+                base_url=llm_config['base_url']
+            )
 
         return Agent(
             role="Cultural Analyst & First Principles Thinker",
@@ -70,9 +79,9 @@ class ZeitgeistPhilosopher:
             identify a cultural truth, you present it raw and unfiltered, with just enough
             sarcasm to make it palatable to humans who can't handle sincerity anymore.""",
 
-            tools=[SerperDevTool()],  # Web search for trend analysis
+            tools=tools if tools is not None else [SerperDevTool()],  # Web search for trend analysis
 
-            verbose=True,
+            verbose=not podcast_mode,
 
             allow_delegation=False,
 
@@ -0,0 +1,163 @@
+"""
+Agent Registry
+Creates agents, LLM clients and tools on first use and reuses them.
+
+Agents are cached per registry under (persona, model tier, podcast_mode).
+LLM clients and tools are stateless, so they are shared by every registry in
+the process; only agents (which hold per-run executor state) are private to a
+registry. MarketingCrew, PodcastOrchestrator and InteractivePodcast all use
+the default registry unless given their own.
+"""
+
+from crewai import Agent, LLM
+from crewai_tools import FileWriterTool, SerperDevTool
+from typing import Dict, Tuple
+import threading
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.agents.philosopher import ZeitgeistPhilosopher
+from src.agents.architect import CynicalContentArchitect
+from src.agents.optimizer import BrutalistOptimizer
+from src.crew.instrumentation import get_instrumentation
+from src.crew.rate_limiter import get_rate_limiter
+from config import Config
+
+
+class AgentRegistry:
+    """Lazily builds and caches agents keyed by (persona, model tier, podcast_mode)."""
+
+    PERSONAS = {
+        'philosopher': ZeitgeistPhilosopher,
+        'architect': CynicalContentArchitect,
+        'optimizer': BrutalistOptimizer,
+    }
+
+    # Shared across all registries in the process
+    _llms: Dict[str, LLM] = {}
+    _tools: Dict[str, object] = {}
+    _shared_lock = threading.Lock()
+    _environment_ready = False
+
+    def __init__(self):
+        """Initialize an empty registry. Nothing is built until requested."""
+        self._agents: Dict[Tuple[str, str, bool], Agent] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tier(use_lite: bool) -> str:
+        """Model tier name for a use_lite flag."""
+        return 'lite' if use_lite else 'pro'
+
+    @classmethod
+    def _prepare_environment(cls):
+        """Validate configuration, set CrewAI's OpenAI fallback key and hook up metrics, once per process."""
+        if cls._environment_ready:
+            return
+
+        Config.validate()
+        get_instrumentation().install_crewai_hooks()
+
+        # Set environment variable for OpenAI API key (CrewAI fallback)
+        # This prevents CrewAI from complaining about missing OpenAI key
+        os.environ['OPENAI_API_KEY'] = Config.OPENROUTER_API_KEY
+        cls._environment_ready = True
+
+    @classmethod
+    def llm(cls, use_lite: bool = False) -> LLM:
+        """
+        Get the shared LLM client for a model tier.
+
+        Args:
+            use_lite: If True, the lite model client
+
+        Returns:
+            CrewAI LLM instance
+        """
+        tier = cls.tier(use_lite)
+        with cls._shared_lock:
+            cls._prepare_environment()
+            if tier not in cls._llms:
+                llm_config = Config.get_llm_config(use_lite=use_lite)
+                cls._llms[tier] = LLM(
+                    model=f"openrouter/{llm_config['model']}",
+                    api_key=llm_config['api_key'],
+                    base_url=llm_config['base_url'],
+                    stream=Config.LLM_STREAMING  # Token chunks feed PipelineStream
+                )
+            return cls._llms[tier]
+
+    @classmethod
+    def tool(cls, name: str):
+        """
+        Get a shared tool instance.
+
+        Args:
+            name: 'search' (SerperDevTool) or 'file_writer' (FileWriterTool)
+
+        Returns:
+            Tool instance
+        """
+        with cls._shared_lock:
+            if name not in cls._tools:
+                factories = {'search': SerperDevTool, 'file_writer': FileWriterTool}
+                cls._tools[name] = factories[name]()
+            return cls._tools[name]
+
+    def _default_tools(self, persona: str, podcast_mode: bool) -> list:
+        """Tools each persona gets (mirrors the defaults in the agent classes)."""
+        if persona == 'philosopher':
+            return [self.tool('search')]
+        if persona == 'optimizer' and podcast_mode:
+            return []
+        return [self.tool('file_writer')]
+
+    def get(self, persona: str, use_lite: bool = False, podcast_mode: bool = False) -> Agent:
+        """
+        Get an agent, building it on first request.
+
+        Args:
+            persona: 'philosopher', 'architect' or 'optimizer'
+            use_lite: If True, use the lite model tier
+            podcast_mode: If True, a quiet conversational variant
+
+        Returns:
+            Cached CrewAI agent
+        """
+        if persona not in self.PERSONAS:
+            raise ValueError(
+                f"Unknown persona: {persona}. "
+                f"Available personas: {list(self.PERSONAS.keys())}"
+            )
+
+        key = (persona, self.tier(use_lite), podcast_mode)
+        with self._lock:
+            if key not in self._agents:
+                agent = self.PERSONAS[persona]().create(
+                    use_lite=use_lite,
+                    podcast_mode=podcast_mode,
+                    llm=self.llm(use_lite),
+                    tools=self._default_tools(persona, podcast_mode)
+                )
+
+                # All agents draw from one process-wide requests-per-minute budget
+                rate_limiter = get_rate_limiter()
+                if rate_limiter is not None:
+                    agent.set_rpm_controller(rate_limiter)
+
+                self._agents[key] = agent
+            return self._agents[key]
+
+    def created(self) -> list:
+        """Keys of the agents built so far (useful for cold-start diagnostics)."""
+        with self._lock:
+            return list(self._agents.keys())
+
+
+_default_registry = AgentRegistry()
+
+
+def get_agent_registry() -> AgentRegistry:
+    """Get the process-wide default registry."""
+    return _default_registry
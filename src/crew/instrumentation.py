@@ -0,0 +1,530 @@
+"""
+Instrumentation
+Latency, token and cost accounting for every stage of a run.
+
+A span is recorded for each LLM call, crew kickoff and tool call (from
+CrewAI's event bus), for each pipeline task (TaskScheduler), and for each
+TTS synthesis, STT request and playback, and for the time until a streamed
+pipeline shows its first token. A span holds:
+  - wall time
+  - queue time: waiting for a worker, a TTS slot or the rate limiter
+  - prompt and completion tokens
+  - model
+  - estimated cost
+
+A run is one CLI command. At the end of a run, its spans and a per-stage
+summary are appended to METRICS_PATH as JSON lines. A Prometheus textfile
+(for node_exporter's textfile collector) is then rewritten with p50/p95
+per stage over the last METRICS_HISTORY_RUNS runs. `main.py stats` prints
+the same percentiles.
+
+The daemon serves concurrent requests in one process, so it records each
+request as its own run with scoped_run(); the run follows the request through
+a context variable, which worker threads and event handlers copy.
+"""
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import contextvars
+import json
+import math
+import threading
+import time
+import uuid
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+STAGES = ('task', 'crew', 'llm', 'tool', 'stream', 'tts', 'stt', 'playback')
+
+# USD per million (prompt, completion) tokens; override or extend with LLM_PRICES
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    'google/gemini-2.5-pro': (1.25, 10.0),
+    'google/gemini-2.5-flash': (0.30, 2.50),
+    'google/gemini-2.5-flash-lite': (0.10, 0.40),
+    'openai/gpt-4-turbo': (10.0, 30.0),
+    'openai/gpt-4o': (2.50, 10.0),
+    'openai/gpt-4o-mini': (0.15, 0.60),
+}
+
+# Seconds the current LLM request waited for the shared rate limiter
+RATE_LIMIT_WAIT: contextvars.ContextVar = contextvars.ContextVar('rate_limit_wait', default=0.0)
+
+
+@dataclass
+class Span:
+    """One timed unit of work."""
+
+    stage: str        # task, crew, llm, tool, stream, tts, stt, playback
+    name: str         # Agent role, pipeline step, tool, engine...
+    wall: float       # Seconds from start to finish
+    queue: float = 0.0  # Seconds waiting before the work started
+    agent: str = ""
+    model: str = ""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0   # Estimated USD
+    cached: bool = False
+    ok: bool = True
+    at: float = field(default_factory=time.time)
+
+
+def model_prices(model: str) -> Optional[Tuple[float, float]]:
+    """Per-million-token prices for a model id (with or without a provider prefix)."""
+    prices = dict(MODEL_PRICES)
+    for entry in filter(None, Config.LLM_PRICES.split(',')):
+        # model=prompt/completion
+        name, _, values = entry.partition('=')
+        prompt, _, completion = values.partition('/')
+        prices[name.strip()] = (float(prompt), float(completion or prompt))
+
+    if model.startswith('openrouter/'):
+        model = model[len('openrouter/'):]
+    if model in prices:
+        return prices[model]
+    matches = [name for name in prices if model.endswith(name)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the price of an LLM call.
+
+    Args:
+        model: Model id
+        prompt_tokens: Tokens sent
+        completion_tokens: Tokens generated
+
+    Returns:
+        USD (0.0 for models without a known price)
+    """
+    prices = model_prices(model)
+    if prices is None:
+        return 0.0
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..1) of unsorted values; 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def summarize(spans: List[Dict[str, Any]], key: str = 'stage') -> Dict[str, Dict[str, float]]:
+    """
+    Aggregate spans per stage (or per another span field).
+
+    Cached spans count towards totals but not towards latency percentiles.
+
+    Args:
+        spans: Span dictionaries
+        key: Field to group by ('stage', 'name', ...)
+
+    Returns:
+        Mapping of group to count, cached, p50/p95/max wall, p50/p95 queue,
+        total wall, tokens and cost
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for span in spans:
+        groups.setdefault(span[key], []).append(span)
+
+    summary = {}
+    for group, members in groups.items():
+        timed = [span for span in members if not span.get('cached')]
+        walls = [span['wall'] for span in timed]
+        queues = [span['queue'] for span in timed]
+        summary[group] = {
+            'count': len(members),
+            'cached': len(members) - len(timed),
+            'errors': sum(1 for span in members if not span.get('ok', True)),
+            'p50': round(percentile(walls, 0.5), 4),
+            'p95': round(percentile(walls, 0.95), 4),
+            'max': round(max(walls, default=0.0), 4),
+            'queue_p50': round(percentile(queues, 0.5), 4),
+            'queue_p95': round(percentile(queues, 0.95), 4),
+            'total': round(sum(walls), 4),
+            'prompt_tokens': sum(span.get('prompt_tokens', 0) for span in members),
+            'completion_tokens': sum(span.get('completion_tokens', 0) for span in members),
+            'cost': round(sum(span.get('cost', 0.0) for span in members), 6),
+        }
+    return summary
+
+
+class Instrumentation:
+    """Thread-safe span recorder for one process, exporting per-run metrics."""
+
+    def __init__(self,
+                 path: str = Config.METRICS_PATH,
+                 textfile: str = Config.METRICS_TEXTFILE,
+                 history_runs: int = Config.METRICS_HISTORY_RUNS,
+                 enabled: bool = Config.METRICS_ENABLED):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: JSON lines file spans and run summaries are appended to
+            textfile: Prometheus textfile rewritten after every run ('' = none)
+            history_runs: Runs the textfile percentiles cover
+            enabled: If False, recording and export do nothing
+        """
+        self.path = path
+        self.textfile = textfile
+        self.history_runs = history_runs
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self.run_id: Optional[str] = None
+        self.command: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._open: Dict[str, Tuple[Any, float]] = {}  # Event id -> (start timestamp, queue seconds)
+        self._hooks_installed = False
+        # Run of the current context (scoped_run), taking precedence over the process-wide run
+        self._scoped: contextvars.ContextVar = contextvars.ContextVar(f'instrumentation_run_{id(self)}',
+                                                                     default=None)
+        self._export_lock = threading.Lock()  # Scoped runs can finish concurrently
+
+    def start_run(self, command: str):
+        """
+        Begin a run; spans recorded from now on belong to it.
+
+        Args:
+            command: CLI command (or other label) the run is aggregated under
+        """
+        with self._lock:
+            self.spans = []
+            self.run_id = uuid.uuid4().hex[:12]
+            self.command = command
+            self.started_at = time.time()
+
+    @contextmanager
+    def scoped_run(self, command: str) -> Iterator[None]:
+        """
+        Record a run for the current context only, then export it.
+
+        Spans recorded by this thread, and by threads and event handlers that
+        copy its context, go to this run instead of the process-wide one.
+
+        Args:
+            command: Label the run is aggregated under
+        """
+        if not self.enabled:
+            yield
+            return
+
+        run = {'run': uuid.uuid4().hex[:12], 'command': command, 'at': time.time(), 'spans': []}
+        token = self._scoped.set(run)
+        try:
+            yield
+        finally:
+            self._scoped.reset(token)
+            # Queued handlers copied the context holding this run, so they still append to it
+            self._flush_events()
+            with self._lock:
+                spans = [asdict(span) for span in run['spans']]
+            self._export(spans, run['run'], command, run['at'])
+
+    def record(self, stage: str, name: str, wall: float, **fields) -> Optional[Span]:
+        """
+        Record a finished span.
+
+        Args:
+            stage: Stage name (see STAGES)
+            name: What ran (agent role, step, engine, tool...)
+            wall: Seconds it took
+            **fields: Other Span fields (queue, agent, model, tokens, cost, cached, ok)
+
+        Returns:
+            The span, or None when disabled or outside a run
+        """
+        if not self.enabled:
+            return None
+        scoped = self._scoped.get()
+        if scoped is None and self.run_id is None:
+            return None
+        span = Span(stage=stage, name=name, wall=wall, **fields)
+        with self._lock:
+            (scoped['spans'] if scoped is not None else self.spans).append(span)
+        return span
+
+    @contextmanager
+    def span(self, stage: str, name: str, queued_at: Optional[float] = None,
+             **fields) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block of work.
+
+        The yielded dictionary is recorded with the span, so the block can
+        add fields it learns while running (tokens, cached...).
+
+        Args:
+            stage: Stage name (see STAGES)
+            name: What runs
+            queued_at: perf_counter() when the work was submitted (for queue time)
+            **fields: Initial Span fields
+        """
+        start = time.perf_counter()
+        if queued_at is not None:
+            fields['queue'] = start - queued_at
+        ok = True
+        try:
+            yield fields
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            self.record(stage, name, time.perf_counter() - start, ok=ok, **fields)
+
+    # CrewAI event bus handlers (run on the bus's worker threads)
+
+    def install_crewai_hooks(self):
+        """Record LLM calls, crew kickoffs and tool calls from CrewAI's event bus (once)."""
+        with self._lock:
+            if self._hooks_installed or not self.enabled:
+                return
+            self._hooks_installed = True
+
+        try:
+            from crewai.events import crewai_event_bus
+            from crewai.events.types.crew_events import CrewKickoffCompletedEvent, CrewKickoffStartedEvent
+            from crewai.events.types.llm_events import (LLMCallCompletedEvent, LLMCallFailedEvent,
+                                                        LLMCallStartedEvent)
+            from crewai.events.types.tool_usage_events import ToolUsageFinishedEvent
+        except ImportError:  # Older CrewAI releases have no typed events
+            print("⚠️  Metrics: this CrewAI version has no event bus; LLM calls are not instrumented")
+            return
+
+        crewai_event_bus.on(LLMCallStartedEvent)(self._on_llm_started)
+        crewai_event_bus.on(LLMCallCompletedEvent)(self._on_llm_finished)
+        crewai_event_bus.on(LLMCallFailedEvent)(self._on_llm_finished)
+        crewai_event_bus.on(CrewKickoffStartedEvent)(self._on_crew_started)
+        crewai_event_bus.on(CrewKickoffCompletedEvent)(self._on_crew_completed)
+        crewai_event_bus.on(ToolUsageFinishedEvent)(self._on_tool_finished)
+
+    def _on_llm_started(self, source, event):
+        # Handlers run in a copy of the calling context, which carries the rate limiter wait
+        with self._lock:
+            self._open[event.call_id] = (event.timestamp, RATE_LIMIT_WAIT.get())
+
+    def _on_llm_finished(self, source, event):
+        with self._lock:
+            started = self._open.pop(event.call_id, None)
+        if started is None:
+            return
+
+        usage = getattr(event, 'usage', None) or {}
+        prompt_tokens = int(usage.get('prompt_tokens', 0) or 0)
+        completion_tokens = int(usage.get('completion_tokens', 0) or 0)
+        model = event.model or ''
+        self.record('llm', event.agent_role or model,
+                    (event.timestamp - started[0]).total_seconds(),
+                    queue=started[1],
+                    agent=event.agent_role or '',
+                    model=model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost=estimate_cost(model, prompt_tokens, completion_tokens),
+                    ok=not hasattr(event, 'error'))
+
+    def _on_crew_started(self, source, event):
+        with self._lock:
+            self._open[event.event_id] = (event.timestamp, 0.0)
+
+    def _on_crew_completed(self, source, event):
+        with self._lock:
+            started = self._open.pop(event.started_event_id, None)
+        if started is None:
+            return
+
+        # Tokens are counted on the crew's LLM spans; this span only times the kickoff
+        agents = {agent.role for agent in getattr(event.crew, 'agents', []) or []}
+        self.record('crew', event.crew_name or ', '.join(sorted(agents)) or 'crew',
+                    (event.timestamp - started[0]).total_seconds(),
+                    agent=', '.join(sorted(agents)))
+
+    def _on_tool_finished(self, source, event):
+        self.record('tool', event.tool_name,
+                    (event.finished_at - event.started_at).total_seconds(),
+                    agent=event.agent_role or '',
+                    cached=bool(event.from_cache))
+
+    # Export
+
+    def _flush_events(self):
+        """Wait for queued event bus handlers so no LLM span is lost."""
+        try:
+            from crewai.events import crewai_event_bus
+            crewai_event_bus.flush()
+        except (ImportError, AttributeError):
+            pass
+
+    def finish_run(self) -> Optional[Dict[str, Any]]:
+        """
+        End the run and export it (JSON lines and Prometheus textfile).
+
+        Returns:
+            Run summary (command, elapsed, per-stage summary, totals), or
+            None if nothing was recorded
+        """
+        if not self.enabled or self.run_id is None:
+            return None
+        self._flush_events()
+
+        with self._lock:
+            spans = [asdict(span) for span in self.spans]
+            run_id, command, started_at = self.run_id, self.command, self.started_at
+            self.spans = []
+            self.run_id = None
+        return self._export(spans, run_id, command, started_at)
+
+    def _export(self, spans: List[Dict[str, Any]], run_id: str, command: Optional[str],
+                started_at: float) -> Optional[Dict[str, Any]]:
+        """Append a finished run to METRICS_PATH and refresh the textfile (None if it has no spans)."""
+        if not spans:
+            return None
+
+        stages = summarize(spans)
+        run = {
+            'type': 'run',
+            'run': run_id,
+            'command': command,
+            'at': started_at,
+            'elapsed': round(time.time() - started_at, 3),
+            'stages': stages,
+            'prompt_tokens': sum(stage['prompt_tokens'] for stage in stages.values()),
+            'completion_tokens': sum(stage['completion_tokens'] for stage in stages.values()),
+            'cost': round(sum(stage['cost'] for stage in stages.values()), 6),
+        }
+
+        with self._export_lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._rotate()
+            with open(self.path, 'a') as f:
+                for span in spans:
+                    f.write(json.dumps({'type': 'span', 'run': run_id, 'command': command, **span}) + "\n")
+                f.write(json.dumps(run) + "\n")
+
+            if self.textfile:
+                self.write_textfile(self.load_spans(self.path, self.history_runs))
+        return run
+
+    def _rotate(self):
+        """Start a new file once the current one exceeds METRICS_MAX_MB (one old file kept)."""
+        try:
+            if os.path.getsize(self.path) > Config.METRICS_MAX_MB * 1024 * 1024:
+                os.replace(self.path, self.path + '.1')
+        except OSError:
+            pass
+
+    @staticmethod
+    def load_spans(path: str = Config.METRICS_PATH, runs: int = Config.METRICS_HISTORY_RUNS,
+                   command: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Read the spans of the most recent runs.
+
+        Args:
+            path: JSON lines file written by finish_run()
+            runs: Number of most recent runs to include
+            command: Only runs of this command (None = all)
+
+        Returns:
+            Span dictionaries, oldest first
+        """
+        if not os.path.exists(path):
+            return []
+
+        by_run: Dict[str, List[Dict[str, Any]]] = {}
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Line cut short by a crash
+                if entry.get('type') != 'span' or (command and entry.get('command') != command):
+                    continue
+                by_run.setdefault(entry['run'], []).append(entry)
+
+        recent = list(by_run.values())[-runs:] if runs > 0 else []
+        return [span for spans in recent for span in spans]
+
+    def write_textfile(self, spans: List[Dict[str, Any]]):
+        """
+        Rewrite the Prometheus textfile from spans (atomically).
+
+        Args:
+            spans: Spans of the runs the metrics cover
+        """
+        stages = summarize(spans)
+        lines = [
+            f"# HELP digital_twin_stage_seconds Wall time per stage over the last {self.history_runs} runs",
+            "# TYPE digital_twin_stage_seconds summary",
+        ]
+        for stage, stats in stages.items():
+            lines.append(f'digital_twin_stage_seconds{{stage="{stage}",quantile="0.5"}} {stats["p50"]}')
+            lines.append(f'digital_twin_stage_seconds{{stage="{stage}",quantile="0.95"}} {stats["p95"]}')
+            lines.append(f'digital_twin_stage_seconds_sum{{stage="{stage}"}} {stats["total"]}')
+            lines.append(f'digital_twin_stage_seconds_count{{stage="{stage}"}} {stats["count"] - stats["cached"]}')
+
+        lines += [
+            "# HELP digital_twin_stage_queue_seconds Time waiting before work started, per stage",
+            "# TYPE digital_twin_stage_queue_seconds gauge",
+        ]
+        for stage, stats in stages.items():
+            lines.append(f'digital_twin_stage_queue_seconds{{stage="{stage}",quantile="0.5"}} {stats["queue_p50"]}')
+            lines.append(f'digital_twin_stage_queue_seconds{{stage="{stage}",quantile="0.95"}} {stats["queue_p95"]}')
+
+        lines += [
+            "# HELP digital_twin_stage_tokens Tokens used per stage",
+            "# TYPE digital_twin_stage_tokens gauge",
+        ]
+        for stage, stats in stages.items():
+            lines.append(f'digital_twin_stage_tokens{{stage="{stage}",kind="prompt"}} {stats["prompt_tokens"]}')
+            lines.append(f'digital_twin_stage_tokens{{stage="{stage}",kind="completion"}} {stats["completion_tokens"]}')
+
+        lines += [
+            "# HELP digital_twin_stage_cost_usd Estimated cost per stage",
+            "# TYPE digital_twin_stage_cost_usd gauge",
+        ]
+        for stage, stats in stages.items():
+            lines.append(f'digital_twin_stage_cost_usd{{stage="{stage}"}} {stats["cost"]}')
+
+        lines += [
+            "# HELP digital_twin_last_run_timestamp_seconds When the last instrumented run finished",
+            "# TYPE digital_twin_last_run_timestamp_seconds gauge",
+            f"digital_twin_last_run_timestamp_seconds {time.time():.0f}",
+        ]
+
+        directory = os.path.dirname(self.textfile)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # node_exporter may read at any time: write aside, then swap in
+        tmp_path = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.textfile)
+
+
+_shared_instrumentation: Optional[Instrumentation] = None
+_shared_lock = threading.Lock()
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Get the process-wide recorder.
+
+    CrewAI hooks are installed by the AgentRegistry before the first agent is
+    built, so commands that never load CrewAI stay fast.
+
+    Returns:
+        Shared Instrumentation (a no-op when Config.METRICS_ENABLED is false)
+    """
+    global _shared_instrumentation
+
+    with _shared_lock:
+        if _shared_instrumentation is None:
+            _shared_instrumentation = Instrumentation()
+        return _shared_instrumentation
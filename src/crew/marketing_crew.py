@@ -3,8 +3,11 @@ Marketing Crew Orchestration
 Manages the three-agent crew for Karlo's digital twin.
 """
 
-from crewai import Crew, Process
-from typing import Dict, Any, Optional
+from crewai import Agent, Crew, Process
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, List, Optional
+import threading
+import time
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -13,8 +16,12 @@ from src.agents.philosopher import ZeitgeistPhilosopher
 from src.agents.architect import CynicalContentArchitect
 from src.agents.optimizer import BrutalistOptimizer
 from src.tasks.marketing_tasks import MarketingTasks
+from src.crew.instrumentation import get_instrumentation
+from src.crew.response_cache import get_response_cache
+from src.crew.scheduler import TaskScheduler
+from src.crew.streaming import PipelineStream
+from src.agents.registry import AgentRegistry, get_agent_registry
 from config import Config
-import os
 
 
 class MarketingCrew:
@@ -23,50 +30,106 @@ class MarketingCrew:
     Implements hierarchical process: Philosopher → Architect → Optimizer
     """
 
-    def __init__(self, use_lite: bool = False):
-        """Initialize the marketing crew with all three agents.
+    def __init__(self, use_lite: bool = False, use_cache: Optional[bool] = None,
+                 registry: Optional[AgentRegistry] = None):
+        """Initialize the marketing crew. Agents are built on first use.
 
         Args:
             use_lite: If True, use lite model for all agents (for simple tasks)
+            use_cache: Serve identical task runs from the on-disk response cache
+                       (None = follow Config.LLM_CACHE_ENABLED)
+            registry: Agent registry to draw agents from (default: process-wide)
         """
 
-        # Validate configuration
-        Config.validate()
-
         # Store model preference
         self.use_lite = use_lite
 
-        # Set environment variable for OpenAI API key (CrewAI fallback)
-        # This prevents CrewAI from complaining about missing OpenAI key
-        os.environ['OPENAI_API_KEY'] = Config.OPENROUTER_API_KEY
-
-        # Create agents with appropriate model
-        self.philosopher = ZeitgeistPhilosopher().create(use_lite=use_lite)
-        self.architect = CynicalContentArchitect().create(use_lite=use_lite)
-        self.optimizer = BrutalistOptimizer().create(use_lite=use_lite)
+        # Agents, LLM clients and tools come from the shared registry
+        self.registry = registry or get_agent_registry()
 
         # Task factory
         self.tasks = MarketingTasks()
 
+        # Persistent response cache (None when disabled)
+        self.cache = get_response_cache() if use_cache is not False else None
+
         # Store crew instance
         self.crew = None
 
+    @property
+    def philosopher(self) -> Agent:
+        """The Zeitgeist Philosopher (built on first access)."""
+        return self.registry.get('philosopher', use_lite=self.use_lite)
+
+    @property
+    def architect(self) -> Agent:
+        """The Cynical Content Architect (built on first access)."""
+        return self.registry.get('architect', use_lite=self.use_lite)
+
+    @property
+    def optimizer(self) -> Agent:
+        """The Brutalist Optimizer (built on first access)."""
+        return self.registry.get('optimizer', use_lite=self.use_lite)
+
     def create_crew(self, tasks: list) -> Crew:
         """Create a crew with specific tasks."""
 
+        # Only the agents that actually have tasks (avoids building unused ones)
+        agents = []
+        for task in tasks:
+            if not any(task.agent is agent for agent in agents):
+                agents.append(task.agent)
+
         self.crew = Crew(
-            agents=[self.philosopher, self.architect, self.optimizer],
+            agents=agents,
             tasks=tasks,
             process=Process.sequential,  # Sequential process to avoid hierarchical issues
             verbose=Config.CREW_VERBOSE,
-            memory=True,  # Enable memory for better context
+            memory=True,  # Crew memory (bound to the agents by _bind_agents)
             cache=True,   # Cache results for efficiency
-            max_rpm=30,   # Rate limiting for API calls
+            max_rpm=None,  # Rate limiting is shared process-wide (Config.LLM_MAX_RPM)
             share_crew=False
         )
 
         return self.crew
 
+    def _kickoff(self, crew: Crew, listener=None) -> str:
+        """
+        Execute a crew through the DAG scheduler, serving tasks from the response cache when possible.
+
+        Tasks with an explicit context wait only for those tasks; tasks without
+        one see every previous output, as under CrewAI's sequential process.
+        Tasks with an empty context (e.g. introductions) therefore run
+        concurrently, up to Config.CREW_MAX_WORKERS at a time.
+
+        Args:
+            crew: Crew to execute
+            listener: Optional scheduler listener (e.g. a PipelineStream)
+
+        Returns:
+            Final (last task) output as text
+        """
+        self._bind_agents(crew)
+        scheduler = TaskScheduler(max_workers=Config.CREW_MAX_WORKERS, cache=self.cache,
+                                  listener=listener)
+        # No kickoff events on this path, so the crew span is recorded here
+        roles = ', '.join(sorted({agent.role for agent in crew.agents}))
+        with get_instrumentation().span('crew', roles, agent=roles):
+            return scheduler.run(crew.tasks)[-1]
+
+    @staticmethod
+    def _bind_agents(crew: Crew):
+        """
+        Attach the crew's agents to it, as Crew.kickoff would.
+
+        The scheduler executes tasks directly, so this is what gives agents the
+        crew's memory. Executors are rebuilt because pooled agents may still
+        hold one bound to an earlier crew.
+        """
+        for agent in crew.agents:
+            agent.crew = crew
+            agent.agent_executor = None
+
     def run_introduction(self, context: str = "the class") -> Dict[str, str]:
         """Have all agents introduce themselves."""
 
@@ -77,11 +140,15 @@ class MarketingCrew:
         arch_task = self.tasks.create_introduction_task(self.architect, context)
         opt_task = self.tasks.create_introduction_task(self.optimizer, context)
 
+        # Introductions do not build on each other: an empty context lets them run concurrently
+        for task in (phil_task, arch_task, opt_task):
+            task.context = []
+
         # Create crew with introduction tasks
         crew = self.create_crew([phil_task, arch_task, opt_task])
 
         # Execute introductions
-        output = crew.kickoff()
+        output = self._kickoff(crew)
 
         # Also get hardcoded introductions for backup
         results["philosopher"] = ZeitgeistPhilosopher().introduce_self()
@@ -101,18 +168,18 @@ class MarketingCrew:
         crew = self.create_crew([task])
 
         # Execute
-        output = crew.kickoff()
+        output = self._kickoff(crew)
 
-        return str(output)
+        return output
 
-    def analyze_trend(self, topic: Optional[str] = None) -> Dict[str, Any]:
-        """Run full marketing pipeline: analyze -> create -> optimize -> refine."""
+    def _pipeline_tasks(self, trend_topic: Optional[str], content_topic: Optional[str]) -> list:
+        """Build the 4-step pipeline: analyze -> create -> optimize -> refine."""
 
         # Step 1: Philosopher analyzes trends
-        trend_task = self.tasks.create_trend_analysis_task(self.philosopher, topic)
+        trend_task = self.tasks.create_trend_analysis_task(self.philosopher, trend_topic)
 
         # Step 2: Architect creates initial content based on analysis
-        content_task = self.tasks.create_content_generation_task(self.architect, topic)
+        content_task = self.tasks.create_content_generation_task(self.architect, content_topic)
         content_task.context = [trend_task]  # Uses philosopher's analysis
 
         # Step 3: Optimizer analyzes the content and provides optimization recommendations
@@ -120,74 +187,85 @@ class MarketingCrew:
         optimize_task.context = [content_task]  # Uses architect's content
 
         # Step 4: Architect creates FINAL content incorporating optimizer's feedback
-        final_content_task = self.tasks.create_final_content_task(self.architect, topic)
+        final_content_task = self.tasks.create_final_content_task(self.architect, content_topic)
         final_content_task.context = [trend_task, content_task, optimize_task]  # Uses ALL previous outputs
 
-        # Create crew with full 4-step pipeline
-        crew = self.create_crew([trend_task, content_task, optimize_task, final_content_task])
+        return [trend_task, content_task, optimize_task, final_content_task]
 
-        # Execute pipeline and capture intermediary outputs
-        result = crew.kickoff()
-
-        # Collect all task outputs for saving
+    @staticmethod
+    def _intermediary_outputs(crew: Crew) -> Dict[str, str]:
+        """Collect all task outputs for saving, numbered in pipeline order."""
         intermediary_outputs = {}
         for i, task in enumerate(crew.tasks):
             agent_name = task.agent.role.replace(" ", "_").replace("&", "and").lower()
             intermediary_outputs[f"{i+1}_{agent_name}"] = str(task.output) if task.output else ""
+        return intermediary_outputs
+
+    def analyze_trend(self, topic: Optional[str] = None, listener=None) -> Dict[str, Any]:
+        """Run full marketing pipeline: analyze -> create -> optimize -> refine.
+
+        Args:
+            topic: Topic to analyze (None = current trends)
+            listener: Optional scheduler listener (see stream_analyze)
+        """
+
+        # Create crew with full 4-step pipeline
+        crew = self.create_crew(self._pipeline_tasks(topic, topic))
+
+        # Execute pipeline and capture intermediary outputs
+        result = self._kickoff(crew, listener=listener)
 
         return {
-            "analysis": str(result),
+            "analysis": result,
             "topic": topic or "current trends",
             "status": "completed",
-            "intermediary_outputs": intermediary_outputs
+            "intermediary_outputs": self._intermediary_outputs(crew)
         }
 
-    def generate_campaign(self, product: str) -> Dict[str, Any]:
-        """Generate a complete marketing campaign using 4-step pipeline."""
-
-        # Step 1: Philosopher analyzes cultural trends for the product
-        trend_task = self.tasks.create_trend_analysis_task(
-            self.philosopher,
-            f"{product} - identify relevant cultural trends"
-        )
-
-        # Step 2: Architect creates initial content
-        content_task = self.tasks.create_content_generation_task(
-            self.architect,
-            f"{product} campaign"
-        )
-        content_task.context = [trend_task]
+    def generate_campaign(self, product: str, listener=None) -> Dict[str, Any]:
+        """Generate a complete marketing campaign using 4-step pipeline.
 
-        # Step 3: Optimizer provides recommendations
-        optimize_task = self.tasks.create_optimization_task(self.optimizer)
-        optimize_task.context = [content_task]
+        Args:
+            product: Product to create the campaign for
+            listener: Optional scheduler listener (see stream_campaign)
+        """
 
-        # Step 4: Architect creates FINAL optimized content
-        final_content_task = self.tasks.create_final_content_task(
-            self.architect,
+        # Create crew with full 4-step pipeline, focused on the product
+        crew = self.create_crew(self._pipeline_tasks(
+            f"{product} - identify relevant cultural trends",
             f"{product} campaign"
-        )
-        final_content_task.context = [trend_task, content_task, optimize_task]
-
-        # Create crew with full 4-step pipeline
-        crew = self.create_crew([trend_task, content_task, optimize_task, final_content_task])
+        ))
 
         # Execute campaign generation
-        result = crew.kickoff()
-
-        # Collect all task outputs for saving
-        intermediary_outputs = {}
-        for i, task in enumerate(crew.tasks):
-            agent_name = task.agent.role.replace(" ", "_").replace("&", "and").lower()
-            intermediary_outputs[f"{i+1}_{agent_name}"] = str(task.output) if task.output else ""
+        result = self._kickoff(crew, listener=listener)
 
         return {
-            "campaign": str(result),
+            "campaign": result,
             "product": product,
             "status": "completed",
-            "intermediary_outputs": intermediary_outputs
+            "intermediary_outputs": self._intermediary_outputs(crew)
         }
 
+    def stream_analyze(self, topic: Optional[str] = None) -> PipelineStream:
+        """
+        Run analyze_trend in the background and stream its output.
+
+        Returns:
+            PipelineStream yielding per-step token chunks; `.result` afterwards
+            holds the analyze_trend() dictionary
+        """
+        return PipelineStream(lambda listener: self.analyze_trend(topic, listener=listener))
+
+    def stream_campaign(self, product: str) -> PipelineStream:
+        """
+        Run generate_campaign in the background and stream its output.
+
+        Returns:
+            PipelineStream yielding per-step token chunks; `.result` afterwards
+            holds the generate_campaign() dictionary
+        """
+        return PipelineStream(lambda listener: self.generate_campaign(product, listener=listener))
+
     def quick_analysis(self, query: str) -> str:
         """Quick analysis without full pipeline."""
 
@@ -203,9 +281,9 @@ class MarketingCrew:
         )
 
         # Execute
-        output = crew.kickoff()
+        output = self._kickoff(crew)
 
-        return str(output)
+        return output
 
 
 class KarloDigitalTwin:
@@ -215,11 +293,18 @@ class KarloDigitalTwin:
     Uses lite model for simple tasks and pro model for complex analysis.
     """
 
-    def __init__(self):
-        """Initialize the digital twin."""
-        # Create two crews: one for lite tasks, one for pro tasks
-        self.lite_crew = MarketingCrew(use_lite=True)  # For simple tasks
-        self.pro_crew = MarketingCrew(use_lite=False)  # For complex tasks
+    def __init__(self, use_cache: Optional[bool] = None,
+                 registry: Optional[AgentRegistry] = None):
+        """Initialize the digital twin. Crews and agents are built on first use.
+
+        Args:
+            use_cache: Use the on-disk response cache (None = Config default)
+            registry: Agent registry for both crews (default: process-wide)
+        """
+        self.use_cache = use_cache
+        self.registry = registry or get_agent_registry()
+        self._lite_crew: Optional[MarketingCrew] = None
+        self._pro_crew: Optional[MarketingCrew] = None
 
         self.context = {
             "name": "Karlo Vrančić",
@@ -228,6 +313,22 @@ class KarloDigitalTwin:
             "expertise": ["AI", "Data Science", "Marketing", "Entrepreneurship"]
         }
 
+    @property
+    def lite_crew(self) -> MarketingCrew:
+        """Crew on the lite model, for simple tasks."""
+        if self._lite_crew is None:
+            self._lite_crew = MarketingCrew(use_lite=True, use_cache=self.use_cache,
+                                            registry=self.registry)
+        return self._lite_crew
+
+    @property
+    def pro_crew(self) -> MarketingCrew:
+        """Crew on the pro model, for complex tasks."""
+        if self._pro_crew is None:
+            self._pro_crew = MarketingCrew(use_lite=False, use_cache=self.use_cache,
+                                           registry=self.registry)
+        return self._pro_crew
+
     def introduce(self) -> Dict[str, str]:
         """Full introduction from all agents. Uses LITE model."""
         return self.lite_crew.run_introduction()
@@ -240,6 +341,57 @@ class KarloDigitalTwin:
         """Generate full marketing campaign. Uses PRO model."""
         return self.pro_crew.generate_campaign(product)
 
+    def campaign_many(self, products: List[str], workers: int = Config.BATCH_WORKERS,
+                      on_complete: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Generate campaigns for many products in parallel. Uses PRO model.
+
+        Each worker thread gets its own MarketingCrew (agents are not safe to
+        share between concurrent runs); all of them share the global rate limiter.
+
+        Args:
+            products: Products to create campaigns for
+            workers: Number of products processed at the same time
+            on_complete: Called from the worker thread as soon as a product finishes
+
+        Returns:
+            One result per product, in input order. Failed products have
+            status "failed" and an "error" message. Every result has "elapsed".
+        """
+        local = threading.local()
+
+        def run(product: str) -> Dict[str, Any]:
+            start = time.time()
+            try:
+                if not hasattr(local, 'crew'):
+                    # Private registry: concurrent workers must not share agent instances
+                    local.crew = MarketingCrew(use_lite=False, use_cache=self.use_cache,
+                                               registry=AgentRegistry())
+                result = local.crew.generate_campaign(product)
+            except Exception as e:
+                result = {"product": product, "status": "failed", "error": str(e)}
+            result["elapsed"] = time.time() - start
+
+            if on_complete:
+                on_complete(result)
+            return result
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(products)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(run, product): i for i, product in enumerate(products)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
+    def stream_analyze(self, topic: Optional[str] = None) -> PipelineStream:
+        """Streaming variant of analyze(). Uses PRO model."""
+        return self.pro_crew.stream_analyze(topic)
+
+    def stream_campaign(self, product: str) -> PipelineStream:
+        """Streaming variant of campaign(). Uses PRO model."""
+        return self.pro_crew.stream_campaign(product)
+
     def about_me(self) -> str:
         """Explain Karlo's background. Uses LITE model."""
         return self.lite_crew.explain_background()
@@ -0,0 +1,91 @@
+"""
+Shared Rate Limiter
+Process-wide requests-per-minute budget for every agent's LLM calls.
+
+CrewAI normally gives each Crew its own RPMController (`max_rpm`), so running
+several crews in parallel multiplies the effective rate. A RateLimiter is
+installed as the RPM controller of every agent instead, which makes all
+crews and worker threads draw from one budget.
+"""
+
+from collections import deque
+from typing import Optional
+import threading
+import time
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.crew.instrumentation import RATE_LIMIT_WAIT
+from config import Config
+
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter compatible with CrewAI's RPMController."""
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, max_rpm: int = Config.LLM_MAX_RPM):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_rpm: Maximum requests allowed in any 60 second window
+        """
+        self.max_rpm = max_rpm
+        self.total_requests = 0
+        self.total_wait = 0.0
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request slot is available, then consume it."""
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.WINDOW_SECONDS:
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.max_rpm:
+                    self._timestamps.append(now)
+                    self.total_requests += 1
+                    # Picked up as queue time by the LLM call that follows (see instrumentation)
+                    RATE_LIMIT_WAIT.set(now - started)
+                    return
+
+                wait_for = self.WINDOW_SECONDS - (now - self._timestamps[0])
+                self.total_wait += wait_for
+
+            # Sleep outside the lock so other threads can still inspect the window
+            time.sleep(wait_for)
+
+    def check_or_wait(self) -> bool:
+        """RPMController interface: called by CrewAI before every LLM request."""
+        self.acquire()
+        return True
+
+    def stop_rpm_counter(self):
+        """RPMController interface: nothing to stop, the window is time based."""
+        pass
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Get the process-wide rate limiter.
+
+    Returns:
+        Shared RateLimiter, or None when Config.LLM_MAX_RPM is 0 (unlimited)
+    """
+    global _shared_limiter
+
+    if Config.LLM_MAX_RPM <= 0:
+        return None
+
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
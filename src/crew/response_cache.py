@@ -0,0 +1,210 @@
+"""
+Persistent LLM Response Cache
+Content-addressed, on-disk cache of task outputs shared across runs.
+
+A task's cache key is a SHA-256 over everything that determines what the
+model sees: model id, the agent's role/goal/backstory/system prompt, the task
+description and expected output, and the raw outputs of its context tasks.
+Byte-identical reruns are therefore served from SQLite instead of OpenRouter.
+"""
+
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+
+class ResponseCache:
+    """SQLite-backed cache with size/age eviction and hit/miss counters."""
+
+    def __init__(self,
+                 path: str = Config.LLM_CACHE_PATH,
+                 max_entries: int = Config.LLM_CACHE_MAX_ENTRIES,
+                 max_age_days: float = Config.LLM_CACHE_MAX_AGE_DAYS):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            max_entries: Maximum number of cached responses kept on disk
+            max_age_days: Entries older than this are treated as misses and evicted
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    agent TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection (safe to use from any thread): one transaction, then closed."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # Commits, or rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(agent, description: str, expected_output: str = "",
+                 context_outputs: Optional[List[str]] = None) -> str:
+        """
+        Build the content-addressed key for a task execution.
+
+        Args:
+            agent: The CrewAI agent that runs the task
+            description: Rendered task description
+            expected_output: Task expected output specification
+            context_outputs: Raw outputs of upstream context tasks, in order
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        llm = getattr(agent, 'llm', None)
+        payload = {
+            "model": getattr(llm, 'model', str(llm)),
+            "role": getattr(agent, 'role', ''),
+            "goal": getattr(agent, 'goal', ''),
+            "backstory": getattr(agent, 'backstory', ''),
+            "system_prompt": getattr(agent, 'system_prompt', None),
+            "description": description,
+            "expected_output": expected_output,
+            "context": context_outputs or [],
+        }
+        blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response text, or None on miss
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.max_age_seconds:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE responses SET last_used_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+                (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str, model: str = "", agent: str = ""):
+        """
+        Store a response and evict stale/excess entries.
+
+        Args:
+            key: Key from make_key()
+            response: Raw task output
+            model: Model id (informational)
+            agent: Agent role (informational)
+        """
+        if not response:
+            return
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, agent, response, created_at, last_used_at, hit_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, model, agent, response, now, now)
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then least recently used ones beyond max_entries."""
+        conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.max_age_seconds,))
+        conn.execute("""
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with this process' hits/misses and on-disk totals
+        """
+        with self._lock, self._connect() as conn:
+            entries, size, lifetime_hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0), "
+                "COALESCE(SUM(hit_count), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "lifetime_hits": lifetime_hits,
+            "path": self.path,
+        }
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache.
+
+    Returns:
+        Shared ResponseCache, or None when caching is disabled (--no-cache)
+    """
+    global _shared_cache
+
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
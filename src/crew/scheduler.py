@@ -0,0 +1,171 @@
+"""
+DAG Task Scheduler
+Runs crew tasks concurrently based on the dependency graph of their context.
+
+A task becomes ready once every task in its `context` list has finished.
+A task whose context is not specified depends on every task before it, as
+under CrewAI's sequential process; tasks with an empty (or None) context are
+roots and start immediately. Ready tasks run on a thread pool, except that
+one agent never executes two tasks at once.
+
+Tasks are executed directly (Task.execute_sync), not through Crew.kickoff,
+so kickoff callbacks do not apply; MarketingCrew binds agents to their crew
+beforehand so crew memory does.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from crewai.tasks.task_output import TaskOutput
+from typing import Dict, List, Optional
+import contextvars
+import time
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.crew.instrumentation import get_instrumentation
+from src.crew.response_cache import ResponseCache
+from config import Config
+
+# Separator CrewAI uses when aggregating context outputs
+CONTEXT_SEPARATOR = "\n\n----------\n\n"
+
+
+class TaskScheduler:
+    """
+    Executes a list of CrewAI tasks as a DAG derived from their context.
+    Outputs are returned in the original task order regardless of finish order.
+    """
+
+    def __init__(self, max_workers: int = Config.CREW_MAX_WORKERS,
+                 cache: Optional[ResponseCache] = None, listener=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of tasks running at the same time
+            cache: Optional response cache consulted before each task
+            listener: Optional object with on_task_start(step, task) and
+                      on_task_end(step, task, output, cached), called from the
+                      worker thread running the task (e.g. a PipelineStream)
+        """
+        self.max_workers = max_workers
+        self.cache = cache
+        self.listener = listener
+
+    @staticmethod
+    def dependencies(tasks: list) -> Dict[int, List[int]]:
+        """
+        Build the dependency graph of a task list.
+
+        Args:
+            tasks: Tasks in pipeline order
+
+        Returns:
+            Mapping of task index to the indices of its context tasks
+        """
+        graph = {}
+        for i, task in enumerate(tasks):
+            if not isinstance(task.context, list) and task.context is not None:
+                # Context not specified: every previous output, like Crew._get_context
+                graph[i] = list(range(i))
+                continue
+            deps = []
+            for upstream in task.context or []:
+                position = next((j for j, t in enumerate(tasks) if t is upstream), None)
+                if position is None:
+                    raise ValueError(
+                        f"Task {i + 1} depends on a task that is not part of this run"
+                    )
+                deps.append(position)
+            graph[i] = deps
+        return graph
+
+    def run(self, tasks: list) -> List[str]:
+        """
+        Execute tasks, running independent ones concurrently.
+
+        Args:
+            tasks: Tasks in pipeline order
+
+        Returns:
+            Raw outputs in the same order as `tasks`
+        """
+        graph = self.dependencies(tasks)
+        outputs: Dict[int, str] = {}
+        pending = set(range(len(tasks)))
+        running = {}  # future -> task index
+        busy_agents = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                # Submit every ready task whose agent is free
+                for i in sorted(pending):
+                    agent_id = id(tasks[i].agent)
+                    if agent_id in busy_agents:
+                        continue
+                    if all(dep in outputs for dep in graph[i]):
+                        context = [outputs[dep] for dep in graph[i]]
+                        # Workers run in a copy of the caller's context (e.g. a daemon request's metrics run)
+                        future = pool.submit(contextvars.copy_context().run, self._execute,
+                                             i + 1, tasks[i], context, time.perf_counter())
+                        running[future] = i
+                        busy_agents.add(agent_id)
+                        pending.discard(i)
+
+                if not running:
+                    raise RuntimeError("Task dependency graph contains a cycle")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    busy_agents.discard(id(tasks[i].agent))
+                    # Re-raises the task's exception, aborting the run
+                    outputs[i] = future.result()
+
+        return [outputs[i] for i in range(len(tasks))]
+
+    def _execute(self, step: int, task, context_outputs: List[str], submitted_at: float) -> str:
+        """Run one task (or restore it from the cache), timed from submission, and return its raw output."""
+        with get_instrumentation().span('task', f"step {step}", queued_at=submitted_at,
+                                        agent=task.agent.role,
+                                        model=getattr(task.agent.llm, 'model', '')) as span:
+            return self._run_task(step, task, context_outputs, span)
+
+    def _run_task(self, step: int, task, context_outputs: List[str], span: dict) -> str:
+        """Execute one task for _execute (span receives cached=True on a cache hit)."""
+        if self.listener is not None:
+            self.listener.on_task_start(step, task)
+
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(task.agent, task.description,
+                                         task.expected_output, context_outputs)
+            cached = self.cache.get(key)
+            if cached is not None:
+                task.output = TaskOutput(
+                    description=task.description,
+                    expected_output=task.expected_output,
+                    raw=cached,
+                    agent=task.agent.role
+                )
+                if self.listener is not None:
+                    self.listener.on_task_end(step, task, cached, cached=True)
+                span['cached'] = True
+                return cached
+
+        context = CONTEXT_SEPARATOR.join(context_outputs) if context_outputs else None
+        output = task.execute_sync(
+            agent=task.agent,
+            context=context,
+            tools=task.tools or task.agent.tools
+        )
+        raw = output.raw if output else ""
+
+        if key is not None:
+            self.cache.put(key, raw, model=getattr(task.agent.llm, 'model', ''),
+                           agent=task.agent.role)
+
+        if self.listener is not None:
+            self.listener.on_task_end(step, task, raw)
+
+        return raw
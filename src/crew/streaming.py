@@ -0,0 +1,147 @@
+"""
+Pipeline Streaming
+Token-level streaming of crew task output, tagged with agent and step.
+
+LLM clients are created with streaming enabled (Config.LLM_STREAMING), so
+CrewAI emits an LLMStreamChunkEvent for every token chunk in the thread that
+runs the task. The TaskScheduler tells a PipelineStream which step each
+worker thread is running, which is how chunks get attributed to steps even
+when several tasks stream at the same time.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+import sys
+import os
+
+try:
+    from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+except ImportError:  # Older CrewAI releases
+    from crewai.utilities.events import crewai_event_bus, LLMStreamChunkEvent
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.crew.instrumentation import get_instrumentation
+
+
+@dataclass
+class StreamChunk:
+    """One streamed piece of pipeline output."""
+
+    step: int       # 1-based position of the task in the pipeline
+    agent: str      # Role of the agent running the step
+    kind: str       # 'start', 'token' or 'end'
+    text: str = ""  # Token text ('token'), full output ('end'), empty ('start')
+    cached: bool = False  # True when the step was served from the response cache
+
+
+class PipelineStream:
+    """
+    Iterator of StreamChunks for one pipeline run.
+
+    The pipeline runs on a background thread as soon as the stream is created.
+    Iterate it (sync or async) to consume chunks; afterwards `result` holds
+    the pipeline's normal return value and `time_to_first_token` the latency
+    until the first visible output.
+    """
+
+    _DONE = object()
+
+    def __init__(self, run: Callable[["PipelineStream"], Dict[str, Any]]):
+        """
+        Start streaming a pipeline.
+
+        Args:
+            run: Callable executing the pipeline; receives this stream as the
+                 scheduler listener and returns the pipeline result
+        """
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+        self.started_at = time.time()
+        self.first_token_at: Optional[float] = None
+        self._chunks = queue.Queue()
+        self._current = threading.local()
+        self._roles = {}
+
+        crewai_event_bus.on(LLMStreamChunkEvent)(self._on_stream_chunk)
+        # The pipeline thread copies the caller's context, so its spans join the caller's metrics run
+        self._thread = threading.Thread(target=contextvars.copy_context().run, args=(self._run, run),
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from start until the first token (or cached output) arrived."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    def _run(self, run: Callable[["PipelineStream"], Dict[str, Any]]):
+        """Execute the pipeline and close the stream."""
+        try:
+            self.result = run(self)
+            if self.result is not None:
+                self.result["time_to_first_token"] = self.time_to_first_token
+            if self.time_to_first_token is not None:
+                get_instrumentation().record('stream', 'first_token', self.time_to_first_token)
+        except BaseException as e:
+            self.error = e
+        finally:
+            off = getattr(crewai_event_bus, 'off', None)
+            if off is not None:
+                off(LLMStreamChunkEvent, self._on_stream_chunk)
+            self._chunks.put(self._DONE)
+
+    def _put(self, chunk: StreamChunk):
+        """Queue a chunk, recording time-to-first-token."""
+        if chunk.text and self.first_token_at is None:
+            self.first_token_at = time.time()
+        self._chunks.put(chunk)
+
+    # TaskScheduler listener interface (called in the worker thread)
+
+    def on_task_start(self, step: int, task):
+        """A task started on the current thread."""
+        self._current.step = step
+        self._roles[step] = task.agent.role
+        self._put(StreamChunk(step=step, agent=task.agent.role, kind='start'))
+
+    def on_task_end(self, step: int, task, output: str, cached: bool = False):
+        """A task finished on the current thread."""
+        self._current.step = None
+        self._put(StreamChunk(step=step, agent=task.agent.role, kind='end',
+                              text=output, cached=cached))
+
+    def _on_stream_chunk(self, source, event):
+        """Event bus handler: attribute a token chunk to the step of this thread."""
+        step = getattr(self._current, 'step', None)
+        if step is None:
+            # Chunk from a thread that is not running one of our tasks
+            return
+        self._put(StreamChunk(step=step, agent=self._roles[step], kind='token', text=event.chunk))
+
+    def __iter__(self) -> Iterator[StreamChunk]:
+        while True:
+            chunk = self._chunks.get()
+            if chunk is self._DONE:
+                break
+            yield chunk
+
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, self._chunks.get)
+            if chunk is self._DONE:
+                break
+            yield chunk
+
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,126 @@
+"""
+Digital Twin Daemon Client
+Thin HTTP client for a running `main.py serve` daemon.
+
+Deliberately imports only the standard library and config, so CLI commands
+routed through the daemon skip the crewai/litellm import cost entirely.
+"""
+
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+# Header carrying the daemon's per-start token (see TwinServer.authorize)
+TOKEN_HEADER = "X-Twin-Token"
+
+
+class TwinClient:
+    """
+    Talks to the daemon over localhost HTTP.
+    Mirrors the KarloDigitalTwin methods the CLI uses, so it can stand in for it.
+    """
+
+    def __init__(self, host: str = Config.DAEMON_HOST, port: int = Config.DAEMON_PORT,
+                 timeout: float = Config.DAEMON_REQUEST_TIMEOUT, token: Optional[str] = None):
+        """
+        Initialize the client.
+
+        Args:
+            host: Daemon host
+            port: Daemon port
+            timeout: Seconds to wait for a response (pipelines can take minutes)
+            token: Daemon token from its state file (required for POST requests)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.token = token
+
+    @property
+    def url(self) -> str:
+        """Base URL of the daemon."""
+        return f"http://{self.host}:{self.port}"
+
+    @classmethod
+    def discover(cls) -> Optional["TwinClient"]:
+        """
+        Find a running daemon via its state file.
+
+        Returns:
+            Connected client, or None if no healthy daemon is running
+        """
+        try:
+            with open(Config.DAEMON_STATE_FILE) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        client = cls(host=state.get("host", Config.DAEMON_HOST),
+                     port=state.get("port", Config.DAEMON_PORT),
+                     token=state.get("token"))
+        return client if client.is_alive() else None
+
+    def is_alive(self) -> bool:
+        """Check whether the daemon answers its health endpoint."""
+        try:
+            return self._request("GET", "/health", timeout=0.5).get("status") == "ok"
+        except RuntimeError:
+            return False
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None,
+                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send a JSON request and decode the JSON response."""
+        data = json.dumps(payload or {}).encode("utf-8") if method == "POST" else None
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers[TOKEN_HEADER] = self.token
+        request = urllib.request.Request(self.url + path, data=data, method=method, headers=headers)
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read().decode("utf-8")).get("error", str(e))
+            except ValueError:
+                message = str(e)
+            raise RuntimeError(f"Digital twin daemon error: {message}")
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise RuntimeError(f"Digital twin daemon unreachable at {self.url}: {e}")
+
+    def health(self) -> Dict[str, Any]:
+        """Daemon status (pid, uptime, requests served)."""
+        return self._request("GET", "/health")
+
+    def introduce(self) -> Dict[str, str]:
+        """Full introduction from all agents."""
+        return self._request("POST", "/introduce")
+
+    def analyze(self, topic: Optional[str] = None) -> Dict[str, Any]:
+        """Run the 4-step analysis pipeline on the daemon."""
+        return self._request("POST", "/analyze", {"topic": topic})
+
+    def campaign(self, product: str) -> Dict[str, Any]:
+        """Generate a campaign on the daemon."""
+        return self._request("POST", "/campaign", {"product": product})
+
+    def about_me(self) -> str:
+        """Karlo's background."""
+        return self._request("POST", "/about")["result"]
+
+    def quick_take(self, query: str) -> str:
+        """Quick trend analysis."""
+        return self._request("POST", "/trend", {"query": query})["result"]
+
+    def podcast_transcript(self, topic: str, rounds: int = 2) -> Dict[str, Any]:
+        """Text-only podcast discussion (no audio)."""
+        return self._request("POST", "/podcast-transcript", {"topic": topic, "rounds": rounds})
+
+    def shutdown(self):
+        """Ask the daemon to stop."""
+        self._request("POST", "/shutdown")
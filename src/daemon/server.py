@@ -0,0 +1,302 @@
+"""
+Digital Twin Daemon
+Keeps warm KarloDigitalTwin instances in memory and serves them over localhost HTTP.
+
+Endpoints (JSON in, JSON out):
+    GET  /health               - status, pid, uptime, requests served
+    POST /introduce            - agent introductions
+    POST /about                - Karlo's background
+    POST /analyze              - {"topic": ...} full 4-step pipeline
+    POST /campaign             - {"product": ...} full 4-step pipeline
+    POST /trend                - {"query": ...} quick analysis
+    POST /podcast-transcript   - {"topic": ..., "rounds": ...} text-only podcast
+    POST /shutdown             - stop the daemon
+
+POST requests must send Content-Type: application/json (so a browser has to
+preflight them, which the daemon never answers) and the token from the state
+file in the X-Twin-Token header. The state file is readable only by its owner.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict
+import hmac
+import json
+import queue
+import secrets
+import threading
+import time
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.agents.registry import AgentRegistry
+from src.crew.instrumentation import get_instrumentation
+from src.daemon.client import TOKEN_HEADER
+from src.crew.marketing_crew import KarloDigitalTwin
+from config import Config
+
+
+class RequestError(Exception):
+    """Client mistake in a request: bad headers (400/401/413/415), unknown endpoint (404) or bad payload (400)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TwinServer:
+    """
+    HTTP daemon around a pool of warm digital twins.
+    Each pooled twin has its own agent registry, so concurrent requests never
+    share agent instances; LLM clients and tools are shared process-wide.
+    """
+
+    # Payload fields each endpoint cannot run without
+    REQUIRED_FIELDS: Dict[str, tuple] = {
+        "/campaign": ("product",),
+        "/trend": ("query",),
+        "/podcast-transcript": ("topic",),
+    }
+
+    # Fields that must be non-empty strings; optional ones may also be null
+    TEXT_FIELDS: Dict[str, tuple] = {
+        "/analyze": ("topic",),
+        "/campaign": ("product",),
+        "/trend": ("query",),
+        "/podcast-transcript": ("topic",),
+    }
+
+    MAX_ROUNDS = 10  # Bounds the LLM calls one /podcast-transcript request can start
+    MAX_BODY_BYTES = 64 * 1024  # Payloads are a few short fields
+
+    def __init__(self, host: str = Config.DAEMON_HOST, port: int = Config.DAEMON_PORT,
+                 workers: int = Config.DAEMON_WORKERS):
+        """
+        Initialize the daemon (does not start listening yet).
+
+        Args:
+            host: Interface to bind (keep it on localhost)
+            port: TCP port
+            workers: Number of pooled twins, i.e. requests served concurrently
+        """
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.started_at = time.time()
+        self.token = secrets.token_urlsafe(32)  # Shared with clients through the state file only
+        self.requests_served = 0
+        self._served_lock = threading.Lock()  # Requests run on ThreadingHTTPServer threads
+        self._pool = [KarloDigitalTwin(registry=AgentRegistry()) for _ in range(self.workers)]
+        self._twins = queue.Queue()
+        self._httpd = None
+
+        for twin in self._pool:
+            self._twins.put(twin)
+
+    def warm_up(self):
+        """Build every agent up front so the first request pays no construction cost."""
+        for twin in self._pool:
+            for use_lite in (True, False):
+                for persona in AgentRegistry.PERSONAS:
+                    twin.registry.get(persona, use_lite=use_lite)
+
+    def _with_twin(self, fn: Callable[[KarloDigitalTwin], Any]) -> Any:
+        """Borrow a twin from the pool for the duration of one request."""
+        twin = self._twins.get()
+        try:
+            return fn(twin)
+        finally:
+            self._twins.put(twin)
+
+    def _podcast_transcript(self, twin: KarloDigitalTwin, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a text-only podcast discussion with the twin's registry."""
+        # Voice stack needs PortAudio; import only when this endpoint is used
+        from src.voice.podcast_orchestrator import PodcastOrchestrator
+
+        orchestrator = PodcastOrchestrator(use_lite=False, registry=twin.registry, voice=False)
+        return orchestrator.run_discussion(payload["topic"], rounds=payload.get("rounds", 2))
+
+    def _validate(self, path: str, payload: Dict[str, Any]):
+        """
+        Check an endpoint's payload fields (presence, type and range).
+
+        Raises:
+            RequestError: 400 naming the first bad field
+        """
+        required = self.REQUIRED_FIELDS.get(path, ())
+        for field in required:
+            if field not in payload:
+                raise RequestError(400, f"Missing field: {field}")
+
+        for field in self.TEXT_FIELDS.get(path, ()):
+            value = payload.get(field)
+            if value is None and field not in required:
+                continue
+            if not isinstance(value, str) or not value.strip():
+                raise RequestError(400, f"Field {field} must be a non-empty string")
+
+        if path == "/podcast-transcript":
+            rounds = payload.get("rounds", 2)
+            # bool is an int subclass, but true/false is not a round count
+            if isinstance(rounds, bool) or not isinstance(rounds, int) or not 1 <= rounds <= self.MAX_ROUNDS:
+                raise RequestError(400, f"Field rounds must be an integer from 1 to {self.MAX_ROUNDS}")
+
+    def handle(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch one request.
+
+        Args:
+            path: Endpoint path
+            payload: Decoded JSON body
+
+        Returns:
+            JSON-serializable response
+
+        Raises:
+            RequestError: Unknown endpoint or invalid payload field
+        """
+        routes = {
+            "/introduce": lambda t: t.introduce(),
+            "/about": lambda t: {"result": t.about_me()},
+            "/analyze": lambda t: t.analyze(payload.get("topic")),
+            "/campaign": lambda t: t.campaign(payload["product"]),
+            "/trend": lambda t: {"result": t.quick_take(payload["query"])},
+            "/podcast-transcript": lambda t: self._podcast_transcript(t, payload),
+        }
+
+        if not isinstance(payload, dict):
+            raise RequestError(400, "Request body must be a JSON object")
+        if path not in routes:
+            raise RequestError(404, f"Unknown endpoint: {path}")
+        # Checked before dispatch: a KeyError or TypeError from inside a run is a server bug, not a bad request
+        self._validate(path, payload)
+
+        # Each request is its own metrics run; the client's run for the command records nothing
+        with get_instrumentation().scoped_run(path.lstrip("/")):
+            result = self._with_twin(routes[path])
+        with self._served_lock:
+            self.requests_served += 1
+        return result
+
+    def authorize(self, headers) -> None:
+        """
+        Check a POST request's headers before its body is decoded.
+
+        Args:
+            headers: Request headers
+
+        Raises:
+            RequestError: Not a JSON request (415) or wrong/missing token (401)
+        """
+        content_type = (headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            raise RequestError(415, "Content-Type must be application/json")
+        if not hmac.compare_digest(headers.get(TOKEN_HEADER) or "", self.token):
+            raise RequestError(401, f"Missing or invalid {TOKEN_HEADER} header")
+
+    def content_length(self, headers) -> int:
+        """
+        Size of a POST body, checked before it is read.
+
+        Args:
+            headers: Request headers
+
+        Returns:
+            Bytes to read (0 without a Content-Length header)
+
+        Raises:
+            RequestError: Malformed or negative length (400) or body over MAX_BODY_BYTES (413)
+        """
+        try:
+            length = int(headers.get("Content-Length") or 0)
+        except ValueError:
+            raise RequestError(400, "Content-Length must be an integer")
+        if length < 0:
+            raise RequestError(400, "Content-Length must not be negative")
+        if length > self.MAX_BODY_BYTES:
+            raise RequestError(413, f"Request body over {self.MAX_BODY_BYTES} bytes")
+        return length
+
+    def health(self) -> Dict[str, Any]:
+        """Daemon status."""
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started_at,
+            "workers": self.workers,
+            "requests_served": self.requests_served,
+        }
+
+    def serve_forever(self):
+        """Listen until shutdown() or Ctrl+C, advertising the address in the state file."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: Dict[str, Any]):
+                data = json.dumps(body, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path == "/health":
+                    self._send(200, server.health())
+                else:
+                    self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+
+            def do_POST(self):
+                try:
+                    server.authorize(self.headers)
+                    length = server.content_length(self.headers)
+                except RequestError as e:
+                    # The body was not read, so the connection cannot carry another request
+                    self.close_connection = True
+                    self._send(e.status, {"error": str(e)})
+                    return
+
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send(400, {"error": "Request body must be JSON"})
+                    return
+
+                if self.path == "/shutdown":
+                    self._send(200, {"status": "stopping"})
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    return
+
+                try:
+                    self._send(200, server.handle(self.path, payload))
+                except RequestError as e:
+                    self._send(e.status, {"error": str(e)})
+                except Exception as e:
+                    self._send(500, {"error": str(e)})
+
+            def log_message(self, format, *args):
+                # Keep the daemon console quiet; crews already log verbosely
+                pass
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+
+        os.makedirs(os.path.dirname(Config.DAEMON_STATE_FILE), exist_ok=True)
+        # The token is the only credential: owner-only, even if a stale file had looser permissions
+        fd = os.open(Config.DAEMON_STATE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"host": self.host, "port": self.port, "pid": os.getpid(),
+                       "token": self.token}, f)
+
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+            if os.path.exists(Config.DAEMON_STATE_FILE):
+                os.remove(Config.DAEMON_STATE_FILE)
+
+    def shutdown(self):
+        """Stop serving (safe to call from a request thread)."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
@@ -60,7 +60,8 @@ class PodcastTasks:
         )
 
     @staticmethod
-    def create_response_task(agent, topic: str, previous_statement: str = None) -> Task:
+    def create_response_task(agent, topic: str, previous_statement: str = None,
+                             discussion: str = None) -> Task:
         """
         Create a task for an agent to respond to previous discussion points.
 
@@ -68,6 +69,7 @@ class PodcastTasks:
             agent: The CrewAI agent
             topic: The discussion topic
             previous_statement: What was said before (optional)
+            discussion: The discussion so far from DiscussionMemory (replaces previous_statement)
 
         Returns:
             Task for the agent
@@ -82,7 +84,10 @@ class PodcastTasks:
             focus = "provide your perspective"
 
         context_note = ""
-        if previous_statement:
+        if discussion:
+            context_note = (f"\n\nThe discussion so far:\n{discussion}\n\n"
+                            "Respond to the most recent point. You may refer back to earlier ones.")
+        elif previous_statement:
             context_note = f"\n\nResponding to the previous point: \"{previous_statement[:200]}...\""
 
         description = f"""Continue the podcast discussion about {topic}.{context_note}
@@ -111,13 +116,14 @@ class PodcastTasks:
         )
 
     @staticmethod
-    def create_conclusion_task(agent, topic: str) -> Task:
+    def create_conclusion_task(agent, topic: str, discussion: str = None) -> Task:
         """
         Create a task for an agent to provide a concluding thought.
 
         Args:
             agent: The CrewAI agent
             topic: The discussion topic
+            discussion: The discussion so far from DiscussionMemory (optional)
 
         Returns:
             Task for the agent
@@ -131,7 +137,9 @@ class PodcastTasks:
         else:
             focus = "memorable final thought"
 
-        description = f"""Provide your CLOSING THOUGHT on {topic} for this podcast episode.
+        context_note = f"\n\nThe discussion so far:\n{discussion}" if discussion else ""
+
+        description = f"""Provide your CLOSING THOUGHT on {topic} for this podcast episode.{context_note}
 
         Your conclusion should offer a {focus}.
 
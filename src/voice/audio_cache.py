@@ -0,0 +1,227 @@
+"""
+Persistent TTS Audio Cache
+Content-addressed, on-disk cache of synthesized speech shared across runs.
+
+Entries hold decoded, already-resampled PCM as raw float32 files, so a hit
+skips the Edge TTS round trip, the MP3 decode and the resample and is served
+as a read-only memory map. A small SQLite index next to the files tracks
+sizes and last use for LRU eviction and hit counts.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+
+class AudioCache:
+    """Raw float32 PCM files with an SQLite index, LRU size limit and hit/miss counters."""
+
+    DTYPE = np.float32
+    SUFFIX = ".f32"
+
+    def __init__(self,
+                 directory: str = Config.TTS_CACHE_DIR,
+                 max_mb: float = Config.TTS_CACHE_MAX_MB):
+        """
+        Initialize the audio cache.
+
+        Args:
+            directory: Folder holding the PCM files and index (created on first use)
+            max_mb: Maximum total size of cached audio in megabytes
+        """
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.index_path = os.path.join(directory, "index.sqlite")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS clips (
+                    key TEXT PRIMARY KEY,
+                    voice TEXT NOT NULL,
+                    sample_rate INTEGER NOT NULL,
+                    bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection (safe to use from any thread): one transaction, then closed."""
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with conn:  # Commits, or rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def _file(self, key: str) -> str:
+        """Path of the PCM file for a key."""
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    @staticmethod
+    def make_key(text: str, voice: str, speed: float, sample_rate: int, engine: str = "edge-tts") -> str:
+        """
+        Build the content-addressed key for a synthesis request.
+
+        Args:
+            text: Text to synthesize
+            voice: Engine voice name (e.g. en-US-AvaNeural)
+            speed: Speech speed multiplier
+            sample_rate: Output sample rate of the cached PCM
+            engine: TTS backend name (engines never share entries)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = {
+            "engine": engine,
+            "text": text,
+            "voice": voice,
+            "speed": round(speed, 3),
+            "sample_rate": sample_rate,
+        }
+        blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Look up cached audio.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Read-only memory-mapped samples, or None on miss
+        """
+        path = self._file(key)
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT bytes FROM clips WHERE key = ?", (key,)).fetchone()
+
+            if row is None or not os.path.exists(path):
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE clips SET last_used_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+                (time.time(), key)
+            )
+            self.hits += 1
+
+        if row[0] == 0:
+            return np.zeros(0, dtype=self.DTYPE)
+        try:
+            return np.memmap(path, dtype=self.DTYPE, mode='r')
+        except (FileNotFoundError, ValueError):
+            # Evicted (or truncated) by another process after the lookup
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+    def put(self, key: str, audio: np.ndarray, voice: str = "", sample_rate: int = 0):
+        """
+        Store audio and evict least recently used clips beyond the size limit.
+
+        Args:
+            key: Key from make_key()
+            audio: Mono samples
+            voice: Voice name (informational)
+            sample_rate: Sample rate (informational)
+        """
+        data = np.ascontiguousarray(audio, dtype=self.DTYPE).ravel()
+        path = self._file(key)
+
+        # Write then rename so readers never map a half-written file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data.tofile(temp_path)
+        os.replace(temp_path, path)
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO clips "
+                "(key, voice, sample_rate, bytes, created_at, last_used_at, hit_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, voice, sample_rate, data.nbytes, now, now)
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used clips until the total fits in max_bytes."""
+        rows = conn.execute("SELECT key, bytes FROM clips ORDER BY last_used_at DESC").fetchall()
+        total = 0
+        for key, size in rows:
+            total += size
+            if total > self.max_bytes:
+                conn.execute("DELETE FROM clips WHERE key = ?", (key,))
+                if os.path.exists(self._file(key)):
+                    os.remove(self._file(key))
+
+    def clear(self):
+        """Remove every cached clip."""
+        with self._lock, self._connect() as conn:
+            for (key,) in conn.execute("SELECT key FROM clips").fetchall():
+                if os.path.exists(self._file(key)):
+                    os.remove(self._file(key))
+            conn.execute("DELETE FROM clips")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with this process' hits/misses and on-disk totals
+        """
+        with self._lock, self._connect() as conn:
+            entries, size, lifetime_hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0), COALESCE(SUM(hit_count), 0) FROM clips"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "lifetime_hits": lifetime_hits,
+            "path": self.directory,
+        }
+
+
+_shared_cache: Optional[AudioCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_audio_cache() -> Optional[AudioCache]:
+    """
+    Get the process-wide audio cache.
+
+    Returns:
+        Shared AudioCache, or None when caching is disabled (--no-cache)
+    """
+    global _shared_cache
+
+    if not Config.TTS_CACHE_ENABLED:
+        return None
+
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = AudioCache()
+        return _shared_cache
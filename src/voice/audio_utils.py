@@ -1,18 +1,190 @@
 """
 Audio utilities for recording and playback.
-Handles microphone input and speaker output.
+Handles microphone input and speaker output, and rendering to audio files.
 """
 
-import sounddevice as sd
 import soundfile as sf
 import numpy as np
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+import atexit
+import queue
 import tempfile
 import os
 import sys
 import threading
+import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from config import Config
+from src.crew.instrumentation import get_instrumentation
+from .resampler import get_resampler
+from .vad import SPEECH_END, VoiceActivityDetector
+
+# PortAudio is only needed for live recording/playback; rendering to files works without it
+try:
+    import sounddevice as sd
+    AUDIO_DEVICE_ERROR = ""
+except OSError as e:
+    sd = None
+    AUDIO_DEVICE_ERROR = str(e)
+
+
+def _require_audio_device():
+    """Raise if live audio I/O is unavailable (PortAudio missing)."""
+    if sd is None:
+        raise RuntimeError(f"Audio device support not available: {AUDIO_DEVICE_ERROR}")
+
+
+class CaptureBuffer:
+    """
+    Preallocated float32 capture buffer for audio callbacks.
+
+    Blocks are copied into one contiguous array, so write() is a slice
+    assignment and nothing else. Once the buffer is half full a background
+    thread doubles it ahead of need; past memory_seconds it moves the samples
+    once to a sparse memory-mapped temp file sized for max_seconds, keeping
+    resident memory flat for long sessions. Allocation, copying and file
+    creation therefore never run on the audio thread. The buffer is reused
+    across recordings until close() releases it and stops the grower thread.
+    """
+
+    def __init__(self, channels: int = Config.AUDIO_CHANNELS,
+                 sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                 initial_seconds: float = Config.RECORDING_BUFFER_SECONDS,
+                 memory_seconds: float = Config.RECORDING_MEMORY_SECONDS,
+                 max_seconds: float = Config.RECORDING_MAX_SECONDS):
+        """
+        Initialize the capture buffer.
+
+        Args:
+            channels: Number of audio channels
+            sample_rate: Audio sample rate in Hz
+            initial_seconds: Capacity allocated up front
+            memory_seconds: Largest capacity kept in RAM before switching to a memory map
+            max_seconds: Hard limit; write() returns False once it is reached
+        """
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.initial_frames = min(int(initial_seconds * sample_rate), int(max_seconds * sample_rate))
+        self.memory_frames = int(memory_seconds * sample_rate)
+        self.max_frames = int(max_seconds * sample_rate)
+        self.length = 0
+        self._map_path: Optional[str] = None
+        self._data = np.zeros((self.initial_frames, channels), dtype=np.float32)
+        self._lock = threading.Lock()  # write() vs. the grower's final swap
+        self._grow_wanted = threading.Event()
+        self._closed = False  # Set by close(); the grower exits on its next wake-up
+        self._generation = 0  # Bumped by reset(), so a grow spanning two recordings is dropped
+        self._grower_thread = threading.Thread(target=self._grower, daemon=True)
+        self._grower_thread.start()
+
+    @property
+    def capacity(self) -> int:
+        """Frames that fit without growing."""
+        return len(self._data)
+
+    @property
+    def seconds(self) -> float:
+        """Seconds of audio captured."""
+        return self.length / self.sample_rate
+
+    def _grower(self):
+        """Background thread: enlarge the buffer whenever write() crosses the watermark, until close()."""
+        while True:
+            self._grow_wanted.wait()
+            self._grow_wanted.clear()
+            if self._closed:
+                return
+            try:
+                self._grow()
+            except Exception as e:
+                print(f"⚠️  Capture buffer growth failed: {e}")
+
+    def _grow(self):
+        """Double the capacity in RAM, or move to a memory map (grower thread only)."""
+        old = self._data
+        capacity = min(max(2 * len(old), self.sample_rate), self.max_frames)
+        if capacity <= len(old):
+            return
+
+        map_path = None
+        if capacity <= self.memory_frames or self._map_path is not None:
+            grown = np.zeros((capacity, self.channels), dtype=np.float32)
+        else:
+            # Long recording: one sparse file sized for the hard limit, never grown again
+            fd, map_path = tempfile.mkstemp(suffix='.f32')
+            os.close(fd)
+            grown = np.memmap(map_path, dtype=np.float32, mode='w+',
+                              shape=(self.max_frames, self.channels))
+
+        # Bulk copy while the callback keeps writing; only the tail is copied under the lock
+        with self._lock:
+            generation = self._generation
+            copied = self.length
+        grown[:copied] = old[:copied]
+        with self._lock:
+            if self._data is not old or self._generation != generation:
+                # reset() started a new recording (or close() replaced the buffer) meanwhile
+                if map_path is not None:
+                    del grown
+                    os.remove(map_path)
+                return
+            grown[copied:self.length] = old[copied:self.length]
+            self._data = grown
+            if map_path is not None:
+                self._map_path = map_path
+
+    def write(self, block: np.ndarray) -> bool:
+        """
+        Append a block of frames (safe to call from an audio callback).
+
+        Args:
+            block: Array of shape (frames, channels)
+
+        Returns:
+            False if the buffer is full and the block was truncated
+        """
+        frames = len(block)
+        with self._lock:
+            fits = min(frames, self.capacity - self.length)
+            self._data[self.length:self.length + fits] = block[:fits]
+            self.length += fits
+            if self.length * 2 > self.capacity and self.capacity < self.max_frames:
+                self._grow_wanted.set()
+        return fits == frames
+
+    def view(self) -> np.ndarray:
+        """
+        Zero-copy view of the captured frames.
+
+        Valid until the next reset(); copy it to keep it across recordings.
+        """
+        return self._data[:self.length]
+
+    def reset(self):
+        """Start a new recording, keeping the allocated capacity in RAM."""
+        with self._lock:
+            self.length = 0
+            self._generation += 1
+            if self._map_path is not None:
+                self._release_map()
+                self._data = np.zeros((self.initial_frames, self.channels), dtype=np.float32)
+
+    def close(self):
+        """Stop the grower thread and release the samples and memory-mapped file (writes then return False)."""
+        with self._lock:
+            self._closed = True
+            self._release_map()
+            self._data = np.zeros((0, self.channels), dtype=np.float32)
+            self.length = 0
+        self._grow_wanted.set()
+
+    def _release_map(self):
+        """Drop the memory map and delete its file (caller holds the lock)."""
+        if self._map_path is not None:
+            self._data = np.zeros((0, self.channels), dtype=np.float32)
+            if os.path.exists(self._map_path):
+                os.remove(self._map_path)
+            self._map_path = None
 
 
 class AudioRecorder:
@@ -29,50 +201,74 @@ class AudioRecorder:
         Args:
             sample_rate: Audio sample rate in Hz
             channels: Number of audio channels (1=mono, 2=stereo)
-            silence_threshold: RMS threshold below which audio is considered silence
-            silence_duration: Seconds of silence before stopping recording
+            silence_threshold: Minimum RMS treated as speech (the VAD adapts above it)
+            silence_duration: Seconds of silence after speech before stopping recording
         """
+        _require_audio_device()
         self.sample_rate = sample_rate
         self.channels = channels
         self.silence_threshold = silence_threshold
         self.silence_duration = silence_duration
         self.is_recording = False
-        self.audio_data = []
+        self.buffer = CaptureBuffer(channels=channels, sample_rate=sample_rate)
+        self.vad = VoiceActivityDetector(sample_rate=sample_rate,
+                                         min_threshold=silence_threshold,
+                                         hangover=silence_duration)
+        # Same detector with a short hangover: finds pauses to cut segments at
+        self.segmenter = VoiceActivityDetector(sample_rate=sample_rate,
+                                               min_threshold=silence_threshold,
+                                               hangover=Config.STT_SEGMENT_PAUSE)
+
+    def _speech_audio(self) -> np.ndarray:
+        """
+        Captured audio trimmed to the detected speech plus VAD_PRE_ROLL padding.
+
+        Returns the whole capture when no speech was detected.
+        """
+        audio = self.buffer.view()
+        start, end = self.vad.speech_span(len(audio), int(Config.VAD_PRE_ROLL * self.sample_rate))
+        return audio[start:end]
 
     def record(self, duration: Optional[float] = None, auto_stop: bool = True) -> np.ndarray:
         """
         Record audio from microphone.
 
+        With auto_stop, recording ends once speech has been followed by
+        silence_duration of silence (or nobody spoke within
+        RECORDING_START_TIMEOUT), and the result is trimmed to the speech.
+
         Args:
             duration: Maximum recording duration in seconds (None = unlimited)
             auto_stop: Automatically stop on silence detection
 
         Returns:
-            Numpy array of recorded audio samples
+            Numpy array of recorded audio samples (a view into the capture
+            buffer, valid until the next recording)
         """
-        self.audio_data = []
+        self.buffer.reset()
+        self.vad.reset()
         self.is_recording = True
-        silence_counter = 0
+        stop_event = threading.Event()
+        start_timeout = Config.RECORDING_START_TIMEOUT * self.sample_rate
 
         def callback(indata, frames, time, status):
             if status:
                 print(f"Recording status: {status}")
 
-            # Store audio data
-            self.audio_data.append(indata.copy())
+            # Store audio data (copied into the preallocated buffer)
+            if not self.buffer.write(indata):
+                stop_event.set()
 
-            # Silence detection
+            # Voice activity detection (allocation-free)
             if auto_stop:
-                rms = np.sqrt(np.mean(indata**2))
-                if rms < self.silence_threshold:
-                    nonlocal silence_counter
-                    silence_counter += frames / self.sample_rate
-                else:
-                    silence_counter = 0
+                if self.vad.process(indata) == SPEECH_END:
+                    stop_event.set()
+                elif not self.vad.heard_speech and self.vad.frames_seen >= start_timeout:
+                    stop_event.set()
 
-                # Stop if enough silence detected
-                if silence_counter >= self.silence_duration:
-                    raise sd.CallbackStop()
+            # Stopping the stream alone would leave record() waiting
+            if stop_event.is_set():
+                raise sd.CallbackStop()
 
         try:
             with sd.InputStream(
@@ -81,23 +277,21 @@ class AudioRecorder:
                 callback=callback,
                 dtype='float32'
             ):
-                if duration:
-                    sd.sleep(int(duration * 1000))
-                else:
-                    # Wait until stopped by silence or user interrupt
-                    while self.is_recording:
-                        sd.sleep(100)
+                # Wait until stopped by silence, the start timeout, a full buffer,
+                # the duration limit or user interrupt
+                deadline = time.monotonic() + duration if duration else None
+                while not stop_event.is_set():
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    sd.sleep(100)
 
         except (KeyboardInterrupt, sd.CallbackStop):
             pass
         finally:
             self.is_recording = False
+            stop_event.set()
 
-        # Concatenate all recorded chunks
-        if self.audio_data:
-            return np.concatenate(self.audio_data, axis=0)
-        else:
-            return np.array([])
+        return self._speech_audio() if auto_stop else self.buffer.view()
 
     def record_to_file(self, output_path: Optional[str] = None, **kwargs) -> str:
         """
@@ -126,18 +320,24 @@ class AudioRecorder:
         """
         Record audio until user presses Enter.
 
+        The VAD runs alongside so leading and trailing silence are trimmed.
+
         Returns:
-            Numpy array of recorded audio samples
+            Numpy array of recorded audio samples (a view into the capture
+            buffer, valid until the next recording)
         """
-        self.audio_data = []
+        self.buffer.reset()
+        self.vad.reset()
         self.is_recording = True
         stop_event = threading.Event()
 
         def callback(indata, frames, time, status):
             if status:
                 print(f"Recording status: {status}")
-            # Store audio data
-            self.audio_data.append(indata.copy())
+            # Store audio data (copied into the preallocated buffer)
+            if not self.buffer.write(indata):
+                stop_event.set()
+            self.vad.process(indata)
             # Check if stop requested
             if stop_event.is_set():
                 raise sd.CallbackStop()
@@ -172,22 +372,110 @@ class AudioRecorder:
 
         print("✓ Recording stopped.")
 
-        # Concatenate all recorded chunks
-        if self.audio_data:
-            return np.concatenate(self.audio_data, axis=0)
-        else:
-            return np.array([])
+        return self._speech_audio()
+
+    def record_segments(self, min_segment: float = Config.STT_SEGMENT_MIN_SECONDS) -> Iterator[np.ndarray]:
+        """
+        Record until user presses Enter, yielding speech segments as they end.
+
+        A segment is cut in the middle of each pause of STT_SEGMENT_PAUSE
+        once it is at least min_segment long, so earlier segments can be
+        transcribed while the user keeps talking. The last segment is
+        yielded after Enter. Segments are contiguous and trimmed like
+        record_manual().
+
+        Args:
+            min_segment: Shortest segment in seconds (short ones hurt accuracy)
+
+        Yields:
+            Copies of consecutive segments of the recording
+        """
+        self.buffer.reset()
+        self.vad.reset()
+        self.segmenter.reset()
+        self.is_recording = True
+        stop_event = threading.Event()
+        pauses: queue.Queue = queue.Queue()
+        pad = int(Config.VAD_PRE_ROLL * self.sample_rate)
+        cut_offset = min(pad, int(Config.STT_SEGMENT_PAUSE * self.sample_rate) // 2)
+
+        def callback(indata, frames, time, status):
+            if status:
+                print(f"Recording status: {status}")
+            # Store audio data (copied into the preallocated buffer)
+            if not self.buffer.write(indata):
+                stop_event.set()
+            self.vad.process(indata)
+            if self.segmenter.process(indata) == SPEECH_END:
+                pauses.put(self.segmenter.speech_end_frame + cut_offset)
+            # Check if stop requested
+            if stop_event.is_set():
+                raise sd.CallbackStop()
+
+        def wait_for_enter():
+            """Wait for Enter key press."""
+            input()  # This blocks until Enter is pressed
+            stop_event.set()
+
+        enter_thread = threading.Thread(target=wait_for_enter, daemon=True)
+        enter_thread.start()
+
+        print("🎙️  Recording... Press ENTER when done speaking.")
+
+        start: Optional[int] = None
+        min_frames = int(min_segment * self.sample_rate)
+        try:
+            with sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                callback=callback,
+                dtype='float32'
+            ):
+                while not stop_event.is_set():
+                    try:
+                        cut = pauses.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+
+                    if start is None:
+                        start = max(0, self.segmenter.first_speech_frame - pad)
+                    if cut - start >= min_frames:
+                        # Copy: the buffer may be reallocated as capture continues
+                        yield self.buffer.view()[start:cut].copy()
+                        start = cut
+
+        except (KeyboardInterrupt, sd.CallbackStop):
+            pass
+        finally:
+            self.is_recording = False
+            stop_event.set()
+
+        print("✓ Recording stopped.")
+
+        # Remainder up to the end of speech (everything if no speech was detected)
+        audio = self.buffer.view()
+        speech_start, speech_end = self.vad.speech_span(len(audio), pad)
+        start = speech_start if start is None else start
+        if speech_end > start:
+            yield audio[start:speech_end].copy()
 
     def stop(self):
         """Stop recording."""
         self.is_recording = False
 
+    def close(self):
+        """Release the capture buffer and its grower thread (the recorder cannot record afterwards)."""
+        self.buffer.close()
+
     @staticmethod
     def test_microphone():
         """Test microphone by recording and playing back a short sample."""
         print("Testing microphone... Speak for 3 seconds.")
         recorder = AudioRecorder()
-        audio = recorder.record(duration=3, auto_stop=False)
+        try:
+            audio = recorder.record(duration=3, auto_stop=False).copy()
+        finally:
+            recorder.close()
 
         print(f"Recorded {len(audio)} samples")
         print(f"Duration: {len(audio) / Config.AUDIO_SAMPLE_RATE:.2f} seconds")
@@ -202,16 +490,143 @@ class AudioRecorder:
 
 
 class AudioPlayer:
-    """Plays audio through speakers."""
-
-    def __init__(self, sample_rate: int = Config.AUDIO_SAMPLE_RATE):
+    """
+    Plays audio through speakers on one persistent output stream.
+
+    The stream is opened on first use and stays open for the session; audio
+    is queued as chunks (bounded, so producers block rather than run far
+    ahead) and pulled by the PortAudio callback, which plays silence while
+    idle. Consecutive clips therefore play back to back with no device
+    open/close between speakers. Use get_audio_player() to share one player.
+    """
+
+    def __init__(self, sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                 block_size: int = Config.PLAYBACK_BLOCK_SIZE,
+                 max_queued: int = Config.PLAYBACK_QUEUE_CHUNKS):
         """
         Initialize audio player.
 
         Args:
             sample_rate: Audio sample rate in Hz
+            block_size: Frames per device callback (latency vs. robustness)
+            max_queued: Chunks that may wait for playback before enqueue() blocks
         """
+        _require_audio_device()
         self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.frames_played = 0   # Audio frames sent to the device (silence excluded)
+        self.underruns = 0       # Times playback starved mid-stream or the device underflowed
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queued))
+        self._current: Optional[np.ndarray] = None  # Chunk being played (callback thread only)
+        self._offset = 0
+        self._feeding = 0         # play_stream() calls still producing chunks (changed under _feeding_lock)
+        self._feeding_lock = threading.Lock()  # Producers on several threads share the player; readers need no lock
+        self._starved = False
+        self._discard = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self.interrupted = threading.Event()  # Set by interrupt(): audio is rejected until resume()
+        self.silenced_at: Optional[float] = None  # perf_counter() when the callback cut playback
+        self._stream = None
+        self._stream_lock = threading.Lock()
+
+    @property
+    def position(self) -> float:
+        """Seconds of audio played since the player was created."""
+        return self.frames_played / self.sample_rate
+
+    @property
+    def is_playing(self) -> bool:
+        """True while queued audio remains."""
+        return not self._idle.is_set()
+
+    @property
+    def output_latency(self) -> float:
+        """Seconds between the callback and the speaker (device buffering)."""
+        return self._stream.latency if self._stream is not None else 0.0
+
+    def _ensure_stream(self):
+        """Open and start the output stream on first use."""
+        with self._stream_lock:
+            if self._stream is None:
+                self._stream = sd.OutputStream(
+                    samplerate=self.sample_rate,
+                    channels=1,
+                    dtype='float32',
+                    blocksize=self.block_size,
+                    callback=self._callback
+                )
+                self._stream.start()
+                atexit.register(self.close)
+
+    def _callback(self, outdata, frames, time_info, status):
+        """Fill the device buffer from the queue (silence when there is nothing)."""
+        if status.output_underflow:
+            self.underruns += 1
+
+        if self._discard.is_set():
+            self._current = None
+            self._discard.clear()
+            if self.silenced_at is None:
+                self.silenced_at = time.perf_counter()
+
+        filled = 0
+        while filled < frames:
+            if self._current is None:
+                try:
+                    self._current = self._queue.get_nowait()
+                    self._offset = 0
+                except queue.Empty:
+                    break
+
+            take = min(frames - filled, len(self._current) - self._offset)
+            outdata[filled:filled + take, 0] = self._current[self._offset:self._offset + take]
+            filled += take
+            self._offset += take
+            if self._offset >= len(self._current):
+                self._current = None
+
+        if filled < frames:
+            outdata[filled:] = 0
+            # A producer is still streaming but fell behind the device
+            if self._feeding and (filled or self.frames_played) and not self._starved:
+                self.underruns += 1
+                self._starved = True
+            if self._current is None and self._queue.empty() and not self._feeding:
+                self._idle.set()
+        else:
+            self._starved = False
+
+        self.frames_played += filled
+
+    def enqueue(self, audio: np.ndarray):
+        """
+        Queue audio for playback without waiting for it to play.
+
+        Blocks only while the queue is full.
+
+        Args:
+            audio: Numpy array of audio samples
+        """
+        chunk = np.ascontiguousarray(audio, dtype=np.float32)
+        if chunk.ndim > 1:
+            chunk = chunk.mean(axis=1) if chunk.shape[1] > 1 else chunk[:, 0]
+        if not len(chunk) or self.interrupted.is_set():
+            return
+
+        self._ensure_stream()
+        self._queue.put(chunk)
+        # After the put: the callback re-marks idle on its next pass if it already drained it
+        self._idle.clear()
+        if self.interrupted.is_set():
+            # Interrupted while waiting for queue space
+            self.stop()
+
+    def wait(self):
+        """Block until everything queued has played."""
+        while not self._idle.wait(timeout=0.1):
+            if self._stream is None:
+                return
 
     def play(self, audio: np.ndarray, blocking: bool = True):
         """
@@ -221,26 +636,120 @@ class AudioPlayer:
             audio: Numpy array of audio samples
             blocking: If True, wait for playback to finish
         """
-        sd.play(audio, self.sample_rate)
-        if blocking:
-            sd.wait()
+        if not blocking:
+            self.enqueue(audio)
+            return
+
+        with get_instrumentation().span('playback', 'clip'):
+            self.enqueue(audio)
+            self.wait()
+
+    def play_stream(self, chunks: Iterable[np.ndarray]) -> Optional[float]:
+        """
+        Play audio chunks back to back as they are produced (gapless).
+
+        Playback starts with the first chunk while later chunks are still
+        being produced. Blocks until the last chunk has played.
+
+        Args:
+            chunks: Iterable of audio sample arrays (e.g. EdgeTTS.synthesize_stream)
+
+        Returns:
+            Seconds until the first chunk was available, or None if there was none
+        """
+        started_at = time.time()
+        first_audio = None
+
+        with self._feeding_lock:
+            self._feeding += 1
+        try:
+            for chunk in chunks:
+                if self.interrupted.is_set():
+                    break
+                if first_audio is None:
+                    first_audio = time.time() - started_at
+                self.enqueue(chunk)
+        finally:
+            with self._feeding_lock:
+                self._feeding -= 1
+
+        if first_audio is not None:
+            self.wait()
+            # Queue time: waiting for the first chunk
+            get_instrumentation().record('playback', 'stream', time.time() - started_at, queue=first_audio)
+        return first_audio
+
+    def _file_chunks(self, file_path: str, seconds: float = 0.5) -> Iterator[np.ndarray]:
+        """Decode a file incrementally, resampled to the player's rate."""
+        with sf.SoundFile(file_path) as audio_file:
+            converter = get_resampler(audio_file.samplerate, self.sample_rate).stream()
+            for block in audio_file.blocks(blocksize=int(seconds * audio_file.samplerate),
+                                           dtype='float32', always_2d=True):
+                yield converter.process(block.mean(axis=1))
+            yield converter.flush()
 
     def play_file(self, file_path: str, blocking: bool = True):
         """
-        Play audio from file.
+        Play audio from file, decoding it as it plays.
 
         Args:
             file_path: Path to audio file
             blocking: If True, wait for playback to finish
         """
-        audio, sample_rate = sf.read(file_path)
-        sd.play(audio, sample_rate)
         if blocking:
-            sd.wait()
+            self.play_stream(self._file_chunks(file_path))
+        else:
+            threading.Thread(target=self.play_stream, args=(self._file_chunks(file_path),),
+                             daemon=True).start()
 
     def stop(self):
-        """Stop audio playback."""
-        sd.stop()
+        """Stop audio playback, dropping queued audio (the stream stays open)."""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._discard.set()
+        if not self._feeding:
+            self._idle.set()
+
+    def interrupt(self):
+        """
+        Cut playback at the next device callback and reject audio until resume().
+
+        Safe to call from an audio callback (barge-in). silenced_at records
+        when the output actually went silent.
+        """
+        self.silenced_at = None
+        self.interrupted.set()
+        self.stop()
+
+    def resume(self):
+        """Accept audio again after interrupt()."""
+        self.interrupted.clear()
+
+    def close(self):
+        """Stop playback and close the output stream."""
+        self.stop()
+        with self._stream_lock:
+            if self._stream is not None:
+                self._stream.stop()
+                self._stream.close()
+                self._stream = None
+        self._idle.set()
+
+    def stats(self) -> dict:
+        """
+        Get playback counters.
+
+        Returns:
+            Dictionary with position (seconds), underruns and queued chunks
+        """
+        return {
+            'position': round(self.position, 3),
+            'underruns': self.underruns,
+            'queued_chunks': self._queue.qsize(),
+        }
 
     @staticmethod
     def test_speaker():
@@ -256,5 +765,156 @@ class AudioPlayer:
 
         player = AudioPlayer(sample_rate)
         player.play(audio, blocking=True)
+        player.close()
 
         print("✓ Speaker test complete!")
+
+
+_shared_player: Optional[AudioPlayer] = None
+_shared_player_lock = threading.Lock()
+
+
+def get_audio_player() -> AudioPlayer:
+    """
+    Get the process-wide player, so one output stream serves the whole session.
+
+    Returns:
+        Shared AudioPlayer
+    """
+    global _shared_player
+
+    with _shared_player_lock:
+        if _shared_player is None:
+            _shared_player = AudioPlayer()
+        return _shared_player
+
+
+class AudioFileWriter:
+    """
+    Drop-in replacement for AudioPlayer that renders to a single audio file.
+
+    Every play()/play_stream() call is one speaker turn. Turns are separated
+    by a silent gap or, when crossfade is set, overlapped with a crossfade.
+    Samples are written as they arrive; only the crossfade tail of the
+    previous turn is held in memory, so episode length does not matter.
+    No sound device is needed.
+    """
+
+    def __init__(self, output_path: str,
+                 sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                 gap: float = Config.RENDER_GAP_SECONDS,
+                 crossfade: float = Config.RENDER_CROSSFADE_SECONDS):
+        """
+        Open the output file.
+
+        Args:
+            output_path: Destination file; format from the extension (.wav, .flac, .ogg)
+            sample_rate: Audio sample rate in Hz
+            gap: Seconds of silence between speakers (ignored when crossfading)
+            crossfade: Seconds by which consecutive speakers overlap (0 = no crossfade)
+        """
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.output_path = output_path
+        self.sample_rate = sample_rate
+        self.gap_samples = int(max(0.0, gap) * sample_rate)
+        self.crossfade_samples = int(max(0.0, crossfade) * sample_rate)
+        self.frames_written = 0
+        self.turns = 0
+        self._tail = np.zeros(0, dtype=np.float32)  # End of the previous turn, held for the crossfade
+        self._file = sf.SoundFile(output_path, mode='w', samplerate=sample_rate, channels=1)
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio written so far."""
+        return self.frames_written / self.sample_rate
+
+    def _write(self, samples: np.ndarray):
+        """Append samples to the file."""
+        if len(samples):
+            self._file.write(samples)
+            self.frames_written += len(samples)
+
+    def _append(self, samples: np.ndarray):
+        """Write a turn's samples, holding back the last crossfade_samples."""
+        if not self.crossfade_samples:
+            self._write(samples)
+            return
+
+        buffered = np.concatenate([self._tail, samples])
+        split = max(0, len(buffered) - self.crossfade_samples)
+        self._write(buffered[:split])
+        self._tail = buffered[split:]
+
+    def _crossfade(self, head: np.ndarray) -> np.ndarray:
+        """Blend the held tail of the previous turn into the head of the next one."""
+        overlap = min(len(self._tail), len(head))
+        fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+        mixed = self._tail[len(self._tail) - overlap:] * (1.0 - fade_in) + head[:overlap] * fade_in
+        blended = np.concatenate([self._tail[:len(self._tail) - overlap], mixed, head[overlap:]])
+        self._tail = np.zeros(0, dtype=np.float32)
+        return blended
+
+    def play_stream(self, chunks: Iterable[np.ndarray]) -> Optional[float]:
+        """
+        Render one speaker turn from audio chunks (same interface as AudioPlayer).
+
+        Args:
+            chunks: Iterable of audio sample arrays
+
+        Returns:
+            Seconds until the first chunk was available, or None if there was none
+        """
+        started_at = time.time()
+        first_audio = None
+        mixing = self.turns > 0 and self.crossfade_samples > 0 and len(self._tail) > 0
+        head = np.zeros(0, dtype=np.float32)
+
+        if self.turns > 0 and not self.crossfade_samples:
+            self._write(np.zeros(self.gap_samples, dtype=np.float32))
+
+        for chunk in chunks:
+            if first_audio is None:
+                first_audio = time.time() - started_at
+            chunk = np.asarray(chunk, dtype=np.float32).ravel()
+
+            if mixing:
+                # Collect enough of the new turn to cover the crossfade
+                head = np.concatenate([head, chunk])
+                if len(head) < self.crossfade_samples:
+                    continue
+                chunk = self._crossfade(head)
+                mixing = False
+
+            self._append(chunk)
+
+        if mixing:
+            self._append(self._crossfade(head))
+
+        self.turns += 1
+        return first_audio
+
+    def play(self, audio: np.ndarray, blocking: bool = True):
+        """
+        Render one speaker turn (same interface as AudioPlayer).
+
+        Args:
+            audio: Numpy array of audio samples
+            blocking: Ignored; writing always completes before returning
+        """
+        self.play_stream([audio])
+
+    def close(self):
+        """Write the held tail and close the file."""
+        if not self._file.closed:
+            self._write(self._tail)
+            self._tail = np.zeros(0, dtype=np.float32)
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,286 @@
+"""
+Speech Backends
+Engines behind EdgeTTS and WhisperSTT, selectable with TTS_BACKEND / STT_BACKEND.
+
+EdgeTTS and WhisperSTT keep everything engine independent (voices, caching,
+resampling, streaming, upload preprocessing) and talk to a backend only to
+turn text into encoded audio or encoded audio into text:
+
+    TTS:  await backend.synthesize(text, voice, rate) -> audio file bytes
+    STT:  backend.transcribe(filename, data, language) -> text
+
+'edge' and 'openai' are the cloud services. 'local' engines run in process
+with no network: synthetic speech whose length follows the text, and
+transcripts derived from the audio, each after a configurable delay. They
+are deterministic, so podcast and interactive runs can be benchmarked on
+offline machines.
+"""
+
+from typing import Any, Dict, Protocol
+import asyncio
+import hashlib
+import io
+import time
+import edge_tts
+import numpy as np
+import soundfile as sf
+from openai import OpenAI
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+
+class TTSBackend(Protocol):
+    """Text to encoded audio."""
+
+    name: str  # Part of the audio cache key
+
+    async def synthesize(self, text: str, voice: str, rate: str) -> bytes:
+        """
+        Synthesize one text.
+
+        Args:
+            text: Text to speak
+            voice: Engine voice name (e.g. en-US-AvaNeural)
+            rate: Speed as a signed percentage (e.g. "+10%")
+
+        Returns:
+            Encoded audio in any format soundfile can read
+        """
+        ...
+
+
+class STTBackend(Protocol):
+    """Encoded audio to text."""
+
+    name: str
+
+    def transcribe(self, filename: str, data: bytes, language: str = "en") -> str:
+        """
+        Transcribe one recording.
+
+        Args:
+            filename: Name whose extension gives the format
+            data: Encoded audio
+            language: Language code
+
+        Returns:
+            Transcribed text
+        """
+        ...
+
+    def transcribe_verbose(self, filename: str, data: bytes, language: str = "en") -> Dict[str, Any]:
+        """
+        Transcribe with word timestamps.
+
+        Returns:
+            Dictionary with text, duration and words
+        """
+        ...
+
+
+class EdgeTTSBackend:
+    """Microsoft Edge TTS service."""
+
+    name = "edge-tts"
+
+    async def synthesize(self, text: str, voice: str, rate: str) -> bytes:
+        """Stream the MP3 from Edge TTS into memory."""
+        communicate = edge_tts.Communicate(text, voice, rate=rate)
+        buffer = io.BytesIO()
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                buffer.write(chunk["data"])
+        return buffer.getvalue()
+
+
+class OpenAIWhisperBackend:
+    """OpenAI Whisper API."""
+
+    name = "openai-whisper"
+
+    def __init__(self, api_key: str = None):
+        """
+        Initialize the OpenAI client.
+
+        Args:
+            api_key: OpenAI API key (defaults to Config.OPENAI_API_KEY)
+        """
+        api_key = api_key or Config.OPENAI_API_KEY
+
+        if not api_key:
+            raise ValueError(
+                "OpenAI API key not found! "
+                "Please set OPENAI_API_KEY in your .env file."
+            )
+
+        self.client = OpenAI(api_key=api_key)
+
+    def transcribe(self, filename: str, data: bytes, language: str = "en") -> str:
+        """Plain-text transcription."""
+        transcript = self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(filename, data),
+            language=language,
+            response_format="text"
+        )
+        return transcript.strip()
+
+    def transcribe_verbose(self, filename: str, data: bytes, language: str = "en") -> Dict[str, Any]:
+        """Transcription with word-level timestamps."""
+        transcript = self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(filename, data),
+            language=language,
+            response_format="verbose_json",
+            timestamp_granularities=["word"]
+        )
+        return {
+            "text": transcript.text,
+            "duration": transcript.duration,
+            "words": transcript.words if hasattr(transcript, 'words') else []
+        }
+
+
+class LocalTTSBackend:
+    """In-process stand-in: deterministic voiced tones, about as long as real speech."""
+
+    name = "local-tts"
+
+    def __init__(self,
+                 latency: float = Config.LOCAL_TTS_LATENCY,
+                 words_per_minute: float = 160.0,
+                 sample_rate: int = Config.AUDIO_SAMPLE_RATE):
+        """
+        Initialize the stand-in engine.
+
+        Args:
+            latency: Seconds each request takes before returning
+            words_per_minute: Speaking rate at speed 1.0
+            sample_rate: Sample rate of the generated audio
+        """
+        self.latency = latency
+        self.words_per_minute = words_per_minute
+        self.sample_rate = sample_rate
+
+    def render(self, text: str, voice: str, rate: str = "+0%") -> np.ndarray:
+        """Generate the samples for a request (same input, same output)."""
+        speed = 1.0 + int(rate.rstrip('%')) / 100
+        words = max(1, len(text.split()))
+        seconds = words * 60.0 / (self.words_per_minute * max(speed, 0.1))
+
+        # Each voice gets its own pitch
+        digest = hashlib.sha256(voice.encode("utf-8")).digest()
+        pitch = 100.0 + digest[0] % 120
+
+        t = np.arange(int(seconds * self.sample_rate), dtype=np.float32) / self.sample_rate
+        phase = 2 * np.pi * pitch * t
+        voiced = np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.25 * np.sin(3 * phase)
+        syllables = np.clip(np.sin(2 * np.pi * 2.5 * speed * t), 0, None)
+        return (0.15 * voiced * syllables).astype(np.float32)
+
+    async def synthesize(self, text: str, voice: str, rate: str) -> bytes:
+        """Wait the configured latency, then return the rendering as WAV bytes."""
+        await asyncio.sleep(self.latency)
+        buffer = io.BytesIO()
+        sf.write(buffer, self.render(text, voice, rate), self.sample_rate, format='WAV', subtype='PCM_16')
+        return buffer.getvalue()
+
+
+class LocalSTTBackend:
+    """In-process stand-in: fixed or duration-based transcripts."""
+
+    name = "local-stt"
+
+    def __init__(self,
+                 latency: float = Config.LOCAL_STT_LATENCY,
+                 transcript: str = Config.LOCAL_STT_TRANSCRIPT):
+        """
+        Initialize the stand-in engine.
+
+        Args:
+            latency: Seconds each request takes before returning
+            transcript: Text returned for every recording ('' = describe the audio)
+        """
+        self.latency = latency
+        self.transcript = transcript
+
+    def _duration(self, data: bytes) -> float:
+        """Length of the uploaded audio in seconds."""
+        info = sf.info(io.BytesIO(data))
+        return info.frames / info.samplerate
+
+    def transcribe(self, filename: str, data: bytes, language: str = "en") -> str:
+        """Wait the configured latency, then return the transcript."""
+        time.sleep(self.latency)
+        if self.transcript:
+            return self.transcript
+        return f"Local transcript of {self._duration(data):.1f} seconds of audio."
+
+    def transcribe_verbose(self, filename: str, data: bytes, language: str = "en") -> Dict[str, Any]:
+        """Transcript with words spread evenly over the audio."""
+        text = self.transcribe(filename, data, language)
+        duration = self._duration(data)
+        words = text.split()
+        step = duration / len(words) if words else 0.0
+        return {
+            "text": text,
+            "duration": duration,
+            "words": [
+                {"word": word, "start": round(i * step, 3), "end": round((i + 1) * step, 3)}
+                for i, word in enumerate(words)
+            ]
+        }
+
+
+TTS_BACKENDS = {
+    'edge': EdgeTTSBackend,
+    'local': LocalTTSBackend,
+}
+
+STT_BACKENDS = {
+    'openai': OpenAIWhisperBackend,
+    'local': LocalSTTBackend,
+}
+
+
+def create_tts_backend(name: str = None) -> TTSBackend:
+    """
+    Create a TTS backend.
+
+    Args:
+        name: 'edge' or 'local' (defaults to Config.TTS_BACKEND)
+
+    Returns:
+        Backend instance
+    """
+    name = name or Config.TTS_BACKEND
+    if name not in TTS_BACKENDS:
+        raise ValueError(
+            f"Unknown TTS backend: {name}. "
+            f"Available backends: {list(TTS_BACKENDS.keys())}"
+        )
+    return TTS_BACKENDS[name]()
+
+
+def create_stt_backend(name: str = None, api_key: str = None) -> STTBackend:
+    """
+    Create an STT backend.
+
+    Args:
+        name: 'openai' or 'local' (defaults to Config.STT_BACKEND)
+        api_key: OpenAI API key for the 'openai' backend
+
+    Returns:
+        Backend instance
+    """
+    name = name or Config.STT_BACKEND
+    if name not in STT_BACKENDS:
+        raise ValueError(
+            f"Unknown STT backend: {name}. "
+            f"Available backends: {list(STT_BACKENDS.keys())}"
+        )
+    if name == 'openai':
+        return OpenAIWhisperBackend(api_key=api_key)
+    return STT_BACKENDS[name]()
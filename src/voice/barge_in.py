@@ -0,0 +1,162 @@
+"""
+Barge-in - lets the user interrupt an agent by starting to speak.
+Full-duplex playback: the microphone stays open while an agent talks.
+
+A low-latency input stream runs for the duration of playback and feeds a
+VAD. When it detects the user speaking, the audio callback interrupts the
+player directly (no thread hop), so the output goes silent within one
+output block plus device latency. Capture has been running all along,
+so the clip already holds the start of the user's speech. It continues
+until the user pauses and is returned trimmed, ready for STT.
+
+Without echo cancellation the agent's own voice reaches the microphone;
+use headphones, or raise BARGE_IN_NOISE_RATIO for open speakers.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import time
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+from .audio_utils import AudioPlayer, AudioRecorder, _require_audio_device, sd
+from .vad import SPEECH_END, SPEECH_START, VoiceActivityDetector
+
+
+class BargeInMonitor:
+    """Runs playback with the microphone open and stops it when the user talks."""
+
+    def __init__(self, player: AudioPlayer, recorder: AudioRecorder,
+                 block_size: int = Config.BARGE_IN_BLOCK_SIZE,
+                 min_speech: float = Config.BARGE_IN_MIN_SPEECH,
+                 noise_ratio: float = Config.BARGE_IN_NOISE_RATIO):
+        """
+        Initialize the monitor.
+
+        Args:
+            player: Player the agents speak through
+            recorder: Recorder whose capture buffer receives the user's speech
+            block_size: Input frames per callback (detection granularity)
+            min_speech: Seconds of speech before playback is interrupted
+            noise_ratio: Speech threshold over the noise floor (higher rejects echo)
+        """
+        _require_audio_device()
+        self.player = player
+        self.recorder = recorder
+        self.block_size = block_size
+        self.vad = VoiceActivityDetector(sample_rate=recorder.sample_rate,
+                                         min_threshold=recorder.silence_threshold,
+                                         hangover=recorder.silence_duration,
+                                         noise_ratio=noise_ratio,
+                                         min_speech=min_speech)
+        self.history: List[Dict[str, float]] = []  # Metrics of every interruption
+        self.last_metrics: Optional[Dict[str, float]] = None
+        self._stream = None
+        self._playing = False
+        self._detected_at: Optional[float] = None
+        self._detected_frame = 0
+        self._finished = False
+        self.speech_ended_at: Optional[float] = None  # perf_counter() when the interrupting speech ended
+
+    def _callback(self, indata, frames, time_info, status):
+        """Capture, detect speech, and interrupt playback from the audio thread."""
+        if not self.recorder.buffer.write(indata):
+            self._finished = True
+            raise sd.CallbackStop()
+
+        event = self.vad.process(indata)
+        if event == SPEECH_START and self._playing and self._detected_at is None:
+            self._detected_at = time.perf_counter()
+            self._detected_frame = self.vad.frames_seen
+            self.player.interrupt()
+        elif event == SPEECH_END and self._detected_at is not None:
+            self._finished = True
+            raise sd.CallbackStop()
+
+    def _record_metrics(self) -> Dict[str, float]:
+        """Latency from detection (and from speech onset) until the speaker was silent."""
+        silenced_at = self.player.silenced_at or self._detected_at
+        to_silence = silenced_at - self._detected_at + self.player.output_latency
+        detection = ((self._detected_frame - self.vad.speech_start_frame) / self.recorder.sample_rate
+                     + self._stream.latency)
+
+        metrics = {
+            'interrupt_to_silence': round(to_silence, 4),
+            'speech_to_silence': round(detection + to_silence, 4),
+        }
+        self.last_metrics = metrics
+        self.history.append(metrics)
+        return metrics
+
+    def run(self, play: Callable[[], Any]) -> Optional[np.ndarray]:
+        """
+        Call play() with the microphone open.
+
+        Args:
+            play: Blocking playback call (e.g. lambda: player.play_stream(...))
+
+        Returns:
+            The user's interrupting speech (a view into the recorder's buffer),
+            or None if playback finished uninterrupted
+        """
+        recorder = self.recorder
+        recorder.buffer.reset()
+        self.vad.reset()
+        self._detected_at = None
+        self._finished = False
+        self.player.resume()
+
+        self._stream = sd.InputStream(
+            samplerate=recorder.sample_rate,
+            channels=recorder.channels,
+            dtype='float32',
+            blocksize=self.block_size,
+            latency='low',
+            callback=self._callback
+        )
+        try:
+            with self._stream:
+                self._playing = True
+                try:
+                    play()
+                finally:
+                    self._playing = False
+
+                if self._detected_at is None:
+                    return None
+
+                self._record_metrics()
+                print(f"✋ Interrupted ({self.last_metrics['interrupt_to_silence'] * 1000:.0f} ms to silence). "
+                      "Listening...")
+
+                # Keep capturing until the user pauses (Ctrl+C stops early)
+                deadline = time.time() + Config.RECORDING_MAX_SECONDS
+                try:
+                    while not self._finished and time.time() < deadline:
+                        sd.sleep(50)
+                except KeyboardInterrupt:
+                    pass
+        finally:
+            self.player.resume()
+
+        # The VAD confirms the end of speech a hangover after it happened
+        self.speech_ended_at = time.perf_counter() - self.vad.seconds_since_speech_end()
+
+        audio = recorder.buffer.view()
+        start, end = self.vad.speech_span(len(audio), int(Config.VAD_PRE_ROLL * recorder.sample_rate))
+        return audio[start:end]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize interrupt-to-silence latency over all interruptions.
+
+        Returns:
+            Dictionary with count, mean and max seconds
+        """
+        latencies = [metrics['interrupt_to_silence'] for metrics in self.history]
+        return {
+            'count': len(latencies),
+            'mean': round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+            'max': round(max(latencies), 4) if latencies else 0.0,
+        }
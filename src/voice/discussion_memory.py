@@ -0,0 +1,199 @@
+"""
+Discussion Memory - bounded context for long spoken discussions.
+Shared by PodcastOrchestrator and InteractivePodcast.
+
+The last few turns are kept verbatim. Each older turn is folded into a
+rolling summary as one short point: the speaker and the turn's opening
+sentence. When the summary outgrows its budget, the oldest points are
+first cut to half length and then dropped. context() renders the summary
+and the recent turns within a per-turn token budget. Prompt size therefore
+stays flat however many rounds an episode runs, while agents can still
+refer back to earlier points. No LLM calls are involved, so memory adds no
+latency or cost to a turn.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import re
+import threading
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def clip_words(text: str, max_words: int, max_chars: Optional[int] = None) -> str:
+    """
+    Shorten text to max_words words, marking the cut with an ellipsis.
+
+    Args:
+        text: Text to shorten
+        max_words: Most words kept
+        max_chars: Most characters kept (default: 8 per word), so a single
+            long token cannot blow the budget
+
+    Returns:
+        The shortened text
+    """
+    max_chars = 8 * max_words if max_chars is None else max_chars
+    words = text.split()
+    whole = len(words) <= max_words
+    clipped = " ".join(words[:max_words])
+    if len(clipped) > max_chars:
+        clipped, whole = clipped[:max_chars], False
+    return clipped if whole else clipped.rstrip(",;:") + "..."
+
+
+class DiscussionMemory:
+    """Last K turns verbatim plus a compact summary of everything before them."""
+
+    EARLIER = "Earlier in the discussion:\n"
+    RECENT = "Most recently:\n"
+
+    def __init__(self,
+                 recent_turns: int = Config.DISCUSSION_RECENT_TURNS,
+                 prompt_tokens: int = Config.DISCUSSION_PROMPT_TOKENS,
+                 summary_tokens: int = Config.DISCUSSION_SUMMARY_TOKENS,
+                 point_words: int = Config.DISCUSSION_POINT_WORDS):
+        """
+        Initialize the memory.
+
+        Args:
+            recent_turns: Turns kept verbatim
+            prompt_tokens: Most tokens context() returns
+            summary_tokens: Most tokens the summary of older turns may hold
+            point_words: Words kept per summarized turn
+        """
+        self.recent_turns = max(1, recent_turns)
+        self.prompt_tokens = prompt_tokens
+        self.summary_tokens = summary_tokens
+        self.point_words = point_words
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget the discussion (start of a new episode)."""
+        with self._lock:
+            self._recent: Deque[Tuple[str, str]] = deque()
+            self._points: List[Tuple[str, bool]] = []  # (point, already shortened)
+            self._summary_size = 0
+            self.turns = 0
+            self.dropped_points = 0
+            self.last_context_tokens = 0
+            self.max_context_tokens = 0
+
+    def add(self, speaker: str, text: str):
+        """
+        Record a turn.
+
+        Args:
+            speaker: Name shown to the agents (e.g. "Philosopher")
+            text: What was said
+        """
+        text = text.strip()
+        if not text:
+            return
+
+        with self._lock:
+            self.turns += 1
+            self._recent.append((speaker, text))
+            while len(self._recent) > self.recent_turns:
+                self._summarize(*self._recent.popleft())
+
+    def _summarize(self, speaker: str, text: str):
+        """Fold one turn into the summary, keeping it within summary_tokens."""
+        first_sentence = SENTENCE_END.split(text, maxsplit=1)[0]
+        point = f"{speaker}: {clip_words(first_sentence, self.point_words)}"
+        self._points.append((point, False))
+        self._summary_size += estimate_tokens(point)
+
+        while self._summary_size > self.summary_tokens and self._points:
+            # Oldest full-length point is cut in half; when none is left, the oldest goes
+            index = next((i for i, (_, short) in enumerate(self._points) if not short), None)
+            if index is not None and index < len(self._points) - 1:
+                old, _ = self._points[index]
+                new = clip_words(old, max(4, self.point_words // 2))
+                self._points[index] = (new, True)
+                self._summary_size += estimate_tokens(new) - estimate_tokens(old)
+            else:
+                old, _ = self._points.pop(0)
+                self._summary_size -= estimate_tokens(old)
+                self.dropped_points += 1
+
+    def context(self, max_tokens: Optional[int] = None) -> str:
+        """
+        Render the discussion so far for a prompt.
+
+        Recent turns take precedence (newest first); the summary gets what
+        is left of the budget, losing its oldest points first.
+
+        Args:
+            max_tokens: Token budget (defaults to prompt_tokens)
+
+        Returns:
+            Summary and recent turns as text ('' before the first turn)
+        """
+        budget = max_tokens or self.prompt_tokens
+        budget -= estimate_tokens(self.EARLIER + self.RECENT)  # Section headers
+
+        with self._lock:
+            recent, used = [], 0
+            for speaker, text in reversed(self._recent):
+                line = f'{speaker}: "{text}"'
+                cost = estimate_tokens(line)
+                if used + cost > budget:
+                    if not recent:
+                        # The latest turn always appears, shortened to the budget
+                        line = clip_words(line, max(1, budget * 3 // 4),
+                                          max_chars=max(1, budget * 4 - 4)) + '"'
+                        recent.append(line)
+                        used += estimate_tokens(line)
+                    break
+                recent.append(line)
+                used += cost
+            recent.reverse()
+
+            points = []
+            for point, _ in reversed(self._points):
+                line = f"- {point}"
+                cost = estimate_tokens(line)
+                if used + cost > budget:
+                    break
+                points.append(line)
+                used += cost
+            points.reverse()
+
+            sections = []
+            if points:
+                sections.append(self.EARLIER + "\n".join(points))
+            if recent:
+                sections.append(self.RECENT + "\n".join(recent))
+            rendered = "\n\n".join(sections)
+
+            self.last_context_tokens = estimate_tokens(rendered)
+            self.max_context_tokens = max(self.max_context_tokens, self.last_context_tokens)
+            return rendered
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get memory counters.
+
+        Returns:
+            Dictionary with turns, summary points, dropped points and
+            last/max context size in tokens
+        """
+        with self._lock:
+            return {
+                'turns': self.turns,
+                'summary_points': len(self._points),
+                'dropped_points': self.dropped_points,
+                'last_context_tokens': self.last_context_tokens,
+                'max_context_tokens': self.max_context_tokens,
+            }
@@ -1,23 +1,30 @@
 """
 Interactive Podcast Orchestrator - User participates in multi-agent discussions.
 Allows user to speak and choose who speaks next in real-time.
+With barge-in enabled the user can also talk over an agent to interrupt it.
+Hands-free mode replaces the keyboard: the user's pauses end their turn
+and a keyword router picks the agent who answers. With speculation, every
+agent's reply is generated while the user is still choosing. Agents see
+the discussion through a bounded DiscussionMemory.
 """
 
 from crewai import Crew, Process
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import sys
 import os
-import tempfile
-import soundfile as sf
+import threading
+import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.agents.philosopher import ZeitgeistPhilosopher
-from src.agents.architect import CynicalContentArchitect
-from src.agents.optimizer import BrutalistOptimizer
+from src.agents.registry import AgentRegistry, get_agent_registry
 from src.tasks.podcast_tasks import PodcastTasks
 from .tts import EdgeTTS
 from .stt import WhisperSTT
-from .audio_utils import AudioPlayer, AudioRecorder
+from .audio_utils import AudioRecorder, get_audio_player
+from .barge_in import BargeInMonitor
+from .discussion_memory import DiscussionMemory
+from .speculation import SpeculativeResponder
+from .turn_router import TurnRouter
 from config import Config
 
 
@@ -27,25 +34,23 @@ class InteractivePodcast:
     User chooses who speaks next and can contribute via voice.
     """
 
-    def __init__(self, use_lite: bool = False):
+    def __init__(self, use_lite: bool = False, registry: Optional[AgentRegistry] = None,
+                 barge_in: bool = Config.BARGE_IN_ENABLED,
+                 speculate: bool = Config.SPECULATION_ENABLED):
         """
         Initialize interactive podcast.
 
         Args:
             use_lite: If True, use lite model for agents
+            registry: Agent registry to draw agents from (default: process-wide)
+            barge_in: If True, listen while agents speak and let the user interrupt
+            speculate: If True, generate every agent's reply while the user chooses
         """
-        # Set OpenAI API key for CrewAI
-        os.environ['OPENAI_API_KEY'] = Config.OPENROUTER_API_KEY
-
-        # Initialize agents in podcast mode (no tools, not verbose)
-        self.philosopher = ZeitgeistPhilosopher().create(use_lite=use_lite)
-        self.architect = CynicalContentArchitect().create(use_lite=use_lite)
-        self.optimizer = BrutalistOptimizer().create(use_lite=use_lite, podcast_mode=True)
-
-        # Set verbose=False for all agents
-        self.philosopher.verbose = False
-        self.architect.verbose = False
-        self.optimizer.verbose = False
+        # Podcast-mode agents (no optimizer tools, not verbose), shared via the registry
+        registry = registry or get_agent_registry()
+        self.philosopher = registry.get('philosopher', use_lite=use_lite, podcast_mode=True)
+        self.architect = registry.get('architect', use_lite=use_lite, podcast_mode=True)
+        self.optimizer = registry.get('optimizer', use_lite=use_lite, podcast_mode=True)
 
         # Task factory
         self.tasks = PodcastTasks()
@@ -53,7 +58,7 @@ class InteractivePodcast:
         # Voice synthesis and recording
         try:
             self.tts = EdgeTTS()
-            self.player = AudioPlayer()
+            self.player = get_audio_player()  # One output stream for the session
             self.stt = WhisperSTT()
             self.recorder = AudioRecorder()
             self.voice_enabled = True
@@ -61,6 +66,15 @@ class InteractivePodcast:
             print(f"⚠️  Voice features not available: {e}")
             self.voice_enabled = False
 
+        self.barge_in = None
+        if barge_in and self.voice_enabled:
+            self.barge_in = BargeInMonitor(self.player, self.recorder)
+
+        self.turn_recorder: Optional[AudioRecorder] = None  # Hands-free: shorter end-of-turn pause
+        self.speculate = speculate
+        self.first_audio_at: Optional[float] = None  # perf_counter() of the last agent turn's first audio
+        self.memory = DiscussionMemory()  # What agents see of the discussion (reset for every session)
+
         # Agent mapping
         self.agents = {
             '2': ('philosopher', self.philosopher, '🧐 Zeitgeist Philosopher'),
@@ -68,7 +82,10 @@ class InteractivePodcast:
             '4': ('optimizer', self.optimizer, '📊 Brutalist Optimizer'),
         }
 
-    def speak_text(self, text: str, speaker: str, is_user: bool = False):
+        # Agents hold executor state: one reply per agent at a time (speculation runs them in parallel)
+        self._agent_locks = {name: threading.Lock() for name, _, _ in self.agents.values()}
+
+    def speak_text(self, text: str, speaker: str, is_user: bool = False) -> Optional[str]:
         """
         Synthesize and play speech.
 
@@ -76,9 +93,13 @@ class InteractivePodcast:
             text: Text to speak
             speaker: Name/role of speaker
             is_user: If True, this is user's contribution (don't synthesize)
+
+        Returns:
+            Transcript of the user's interruption (barge-in), else None
         """
         print(f"\n{speaker}:")
         print(f"  {text}\n")
+        self.first_audio_at = None
 
         if self.voice_enabled and not is_user:
             try:
@@ -90,14 +111,35 @@ class InteractivePodcast:
                         break
 
                 if agent_name:
-                    # Synthesize speech
-                    audio = self.tts.speak_as_agent(text, agent_name)
-                    # Play audio
-                    self.player.play(audio, blocking=True)
+                    def play():
+                        started = time.perf_counter()
+                        # Synthesize speech
+                        if Config.TTS_STREAMING:
+                            # Playback starts with the first synthesized sentence
+                            first_audio = self.player.play_stream(self.tts.speak_as_agent_stream(text, agent_name))
+                        else:
+                            audio = self.tts.speak_as_agent(text, agent_name)
+                            first_audio = time.perf_counter() - started
+                            self.player.play(audio, blocking=True)
+
+                        if first_audio is not None:
+                            self.first_audio_at = started + first_audio + self.player.output_latency
+
+                    if self.barge_in is None:
+                        play()
+                        return None
+
+                    # Full duplex: the user's speech stops playback and is transcribed
+                    speech = self.barge_in.run(play)
+                    if speech is not None:
+                        print("🔄 Transcribing...")
+                        return self.stt.transcribe_audio(speech, self.recorder.sample_rate)
 
             except Exception as e:
                 print(f"⚠️  Voice playback failed: {e}")
 
+        return None
+
     def record_user_input(self) -> str:
         """
         Record user's voice input and transcribe.
@@ -110,22 +152,17 @@ class InteractivePodcast:
             return input("> ")
 
         try:
+            if Config.STT_STREAMING:
+                # Segments are transcribed while the user keeps talking
+                return self.stt.transcribe_stream(self.recorder.record_segments(),
+                                                  self.recorder.sample_rate)
+
             # Record audio with manual stop
             audio = self.recorder.record_manual()
 
-            # Save to temp file for transcription
-            fd, temp_path = tempfile.mkstemp(suffix='.wav')
-            os.close(fd)
-            sf.write(temp_path, audio, Config.AUDIO_SAMPLE_RATE)
-
-            # Transcribe
+            # Transcribe (trimmed, downsampled and compressed in memory)
             print("🔄 Transcribing...")
-            text = self.stt.transcribe(temp_path)
-
-            # Clean up
-            os.remove(temp_path)
-
-            return text
+            return self.stt.transcribe_audio(audio, self.recorder.sample_rate)
 
         except Exception as e:
             print(f"⚠️  Voice recording failed: {e}")
@@ -145,8 +182,13 @@ class InteractivePodcast:
         Returns:
             Agent's response
         """
+        return self._generate_reply(agent, agent_name, topic, previous_text)[0]
+
+    def _generate_reply(self, agent, agent_name: str, topic: str, previous_text: str) -> Tuple[str, int]:
+        """Run one agent reply and report the tokens it used."""
         # Create response task
-        task = self.tasks.create_response_task(agent, topic, previous_text)
+        task = self.tasks.create_response_task(agent, topic, previous_text,
+                                               discussion=self.memory.context())
 
         # Execute with single-agent crew
         crew = Crew(
@@ -156,8 +198,26 @@ class InteractivePodcast:
             verbose=False
         )
 
-        result = crew.kickoff()
-        return str(result).strip()
+        with self._agent_locks[agent_name]:
+            result = crew.kickoff()
+
+        text = str(result).strip()
+        usage = getattr(result, 'token_usage', None)
+        tokens = getattr(usage, 'total_tokens', 0) or len(text) // 4  # Rough estimate without usage data
+        return text, tokens
+
+    def _speculator(self, topic: str) -> Optional[SpeculativeResponder]:
+        """Speculative responder for one discussion (None when disabled)."""
+        if not self.speculate:
+            return None
+
+        agents = {name: agent for name, agent, _ in self.agents.values()}
+        return SpeculativeResponder(
+            lambda agent_name, previous_text: self._generate_reply(
+                agents[agent_name], agent_name, topic, previous_text),
+            workers=len(agents),
+            version=lambda: self.memory.turns  # Replies embed the discussion memory of their time
+        )
 
     def run_interactive_discussion(self, topic: str) -> Dict[str, Any]:
         """
@@ -176,11 +236,22 @@ class InteractivePodcast:
         print("Welcome! You'll be participating in this discussion.")
         print("After each person speaks, you choose who speaks next.\n")
 
+        self.memory.reset()
         transcript = []
         previous_text = f"Let's discuss: {topic}"
+        previous_speaker = None
+        speculator = self._speculator(topic)
+        router = TurnRouter([name for name, _, _ in self.agents.values()])
+        response_times = []
 
         # Main discussion loop
         while True:
+            if speculator is not None:
+                # Replies start while the user reads the menu, likeliest pick first
+                likely = router.route(previous_text, previous_speaker=previous_speaker)
+                order = [likely] + [name for name in router.waiting if name != likely]
+                speculator.start(previous_text, [name for name in order if name != TurnRouter.END])
+
             # Show menu
             print("\n" + "-" * 80)
             print("Who speaks next?")
@@ -202,11 +273,10 @@ class InteractivePodcast:
                 user_text = self.record_user_input()
 
                 if user_text.strip():
+                    if speculator is not None:
+                        speculator.discard()
                     self.speak_text(user_text, "👤 You (Karlo)", is_user=True)
-                    transcript.append({
-                        'speaker': 'user',
-                        'text': user_text
-                    })
+                    self._record(transcript, 'user', user_text)
                     previous_text = user_text
                 else:
                     print("⚠️  No input received. Try again.")
@@ -217,24 +287,193 @@ class InteractivePodcast:
 
                 print(f"\n⏳ {display_name} is thinking...\n")
 
-                response = self.get_agent_response(agent, agent_name, topic, previous_text)
+                chosen_at = time.perf_counter()
+                if speculator is not None:
+                    response = speculator.take(agent_name, previous_text)
+                    speculator.discard()
+                else:
+                    response = self.get_agent_response(agent, agent_name, topic, previous_text)
+                ready_at = time.perf_counter()
 
-                self.speak_text(response, display_name)
-                transcript.append({
-                    'speaker': agent_name,
-                    'text': response
-                })
+                interruption = self.speak_text(response, display_name)
+                # Choice to first audio (to the text when there is no voice)
+                response_times.append((self.first_audio_at or ready_at) - chosen_at)
+                self._record(transcript, agent_name, response, interrupted=interruption is not None)
                 previous_text = response
+                previous_speaker = agent_name
+                router.spoke(agent_name)
+
+                if interruption and interruption.strip():
+                    # The user barged in: their words answer the cut-off turn
+                    self.speak_text(interruption, "👤 You (Karlo)", is_user=True)
+                    self._record(transcript, 'user', interruption)
+                    previous_text = interruption
 
             else:
                 print("⚠️  Invalid choice. Please enter 1-5.")
 
-        return {
+        result = self._result(topic, transcript)
+        if response_times:
+            result['response_time'] = {
+                'count': len(response_times),
+                'mean': round(sum(response_times) / len(response_times), 3),
+                'max': round(max(response_times), 3),
+            }
+        if speculator is not None:
+            speculator.close()
+            result['speculation'] = speculator.stats()
+            print(f"🔮 Speculation: {speculator.hits} replies ready in advance, "
+                  f"{speculator.wasted_tokens} tokens unused (budget {speculator.token_budget})")
+        return result
+
+    def close(self):
+        """Release the session's recorders (their capture buffers and grower threads)."""
+        for recorder in (getattr(self, 'recorder', None), self.turn_recorder):
+            if recorder is not None:
+                recorder.close()
+        self.turn_recorder = None
+
+    def listen_for_turn(self) -> Tuple[str, Optional[float]]:
+        """
+        Record until the user pauses for HANDS_FREE_TURN_PAUSE, then transcribe.
+
+        Returns:
+            (transcript, perf_counter() when speech ended); ('', None) if nobody spoke
+        """
+        if self.turn_recorder is None:
+            self.turn_recorder = AudioRecorder(silence_duration=Config.HANDS_FREE_TURN_PAUSE)
+        recorder = self.turn_recorder
+
+        print("🎙️  Listening... (say \"end discussion\" to finish)")
+        audio = recorder.record()
+        if not recorder.vad.heard_speech:
+            return "", None
+
+        # The VAD confirms the end of speech a pause after it happened
+        speech_end = time.perf_counter() - recorder.vad.seconds_since_speech_end()
+
+        print("🔄 Transcribing...")
+        return self.stt.transcribe_audio(audio, recorder.sample_rate), speech_end
+
+    def run_hands_free(self, topic: str, max_turns: int = Config.HANDS_FREE_MAX_TURNS) -> Dict[str, Any]:
+        """
+        Run an interactive discussion without keyboard input.
+
+        An agent chosen by the TurnRouter opens, then the loop alternates:
+        listen until the user pauses, transcribe, route to an agent, speak.
+        If the user stays silent the agents carry on; after
+        HANDS_FREE_IDLE_TURNS silent turns in a row the session ends.
+
+        Args:
+            topic: The topic to discuss
+            max_turns: Maximum agent turns
+
+        Returns:
+            Dictionary with discussion transcript and turn_gap statistics
+            (user's end of speech to the answering agent's first audio)
+        """
+        if not self.voice_enabled:
+            print("⚠️  Hands-free mode needs voice. Falling back to the menu.")
+            return self.run_interactive_discussion(topic)
+
+        print(f"\n{'='*80}")
+        print(f"🎙️  HANDS-FREE PODCAST: {topic}")
+        print(f"{'='*80}\n")
+        print("Just talk. Pause to hand over; name an agent to ask them directly.\n")
+
+        agents = {name: (agent, display_name) for name, agent, display_name in self.agents.values()}
+        router = TurnRouter(list(agents.keys()))
+        self.memory.reset()
+        transcript = []
+        gaps = []
+        previous_text = f"Let's discuss: {topic}"
+        speaker = router.route(topic)
+        speech_end = None
+        idle_turns = 0
+
+        try:
+            for _ in range(max_turns):
+                agent, display_name = agents[speaker]
+                print(f"\n⏳ {display_name} is thinking...\n")
+                response = self.get_agent_response(agent, speaker, topic, previous_text)
+
+                interruption = self.speak_text(response, display_name)
+                if speech_end is not None and self.first_audio_at is not None:
+                    gaps.append(self.first_audio_at - speech_end)
+                    print(f"⏱️  {gaps[-1]:.2f}s from your last word to the first audio")
+
+                router.spoke(speaker)
+                self._record(transcript, speaker, response, interrupted=interruption is not None)
+                previous_text = response
+
+                # User's turn: an interruption already is one
+                if interruption is not None:
+                    user_text, speech_end = interruption, self.barge_in.speech_ended_at
+                else:
+                    user_text, speech_end = self.listen_for_turn()
+
+                if not user_text.strip():
+                    idle_turns += 1
+                    if idle_turns >= Config.HANDS_FREE_IDLE_TURNS:
+                        print("\n✅ No one spoke. Discussion ended.\n")
+                        break
+                    speech_end = None
+                    speaker = router.route("", previous_speaker=speaker)
+                    continue
+
+                idle_turns = 0
+                self.speak_text(user_text, "👤 You (Karlo)", is_user=True)
+                self._record(transcript, 'user', user_text)
+
+                speaker = router.route(user_text, previous_speaker=speaker)
+                if speaker == TurnRouter.END:
+                    print("\n✅ Discussion ended.\n")
+                    break
+                previous_text = user_text
+
+        except KeyboardInterrupt:
+            print("\n✅ Discussion ended.\n")
+
+        result = self._result(topic, transcript)
+        if gaps:
+            result['turn_gap'] = {
+                'count': len(gaps),
+                'mean': round(sum(gaps) / len(gaps), 3),
+                'max': round(max(gaps), 3),
+            }
+            print(f"⏱️  End of speech to agent audio: mean {result['turn_gap']['mean']:.2f}s, "
+                  f"max {result['turn_gap']['max']:.2f}s over {len(gaps)} turns")
+        return result
+
+    def _record(self, transcript: List[Dict[str, Any]], speaker: str, text: str,
+                interrupted: bool = False):
+        """Add a turn to the transcript and the discussion memory."""
+        transcript.append({
+            'speaker': speaker,
+            'text': text,
+            **({'interrupted': True} if interrupted else {})
+        })
+        self.memory.add('Karlo (host)' if speaker == 'user' else speaker.title(),
+                        text + (" (cut off by the host)" if interrupted else ""))
+
+    def _result(self, topic: str, transcript: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Discussion result, with barge-in latency when there were interruptions."""
+        result = {
             'topic': topic,
             'transcript': transcript,
+            'memory': self.memory.stats(),
             'status': 'completed'
         }
 
+        if self.barge_in is not None and self.barge_in.history:
+            summary = self.barge_in.summary()
+            print(f"✋ Barge-ins: {summary['count']} "
+                  f"(interrupt-to-silence mean {summary['mean'] * 1000:.0f} ms, "
+                  f"max {summary['max'] * 1000:.0f} ms)")
+            result['barge_in'] = summary
+
+        return result
+
     def save_transcript(self, discussion: Dict[str, Any], output_path: str = None):
         """
         Save discussion transcript to file.
@@ -262,7 +501,8 @@ class InteractivePodcast:
 
             for i, entry in enumerate(discussion['transcript'], 1):
                 speaker = speaker_names.get(entry['speaker'], entry['speaker'])
-                f.write(f"## Turn {i}: {speaker}\n\n")
+                interrupted = " (interrupted)" if entry.get('interrupted') else ""
+                f.write(f"## Turn {i}: {speaker}{interrupted}\n\n")
                 f.write(f"{entry['text']}\n\n")
 
         print(f"✓ Transcript saved to {output_path}")
@@ -1,20 +1,25 @@
 """
 Podcast Orchestrator - Manages multi-agent voice discussions.
-Coordinates agent responses and synthesizes speech for each contribution.
+Coordinates agent responses and synthesizes speech for each contribution,
+overlapping generation, synthesis and playback through a SpeechPipeline.
+Agents see the discussion through a bounded DiscussionMemory.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from crewai import Crew, Process
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
+import threading
+import time
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.agents.philosopher import ZeitgeistPhilosopher
-from src.agents.architect import CynicalContentArchitect
-from src.agents.optimizer import BrutalistOptimizer
+from src.agents.registry import AgentRegistry, get_agent_registry
 from src.tasks.podcast_tasks import PodcastTasks
 from .tts import EdgeTTS
-from .audio_utils import AudioPlayer
+from .audio_utils import AudioFileWriter, get_audio_player
+from .discussion_memory import DiscussionMemory
+from .speech_pipeline import SpeechPipeline, Turn
 from config import Config
 
 
@@ -24,37 +29,38 @@ class PodcastOrchestrator:
     Each agent speaks their contributions in their unique voice.
     """
 
-    def __init__(self, use_lite: bool = False):
+    def __init__(self, use_lite: bool = False, registry: Optional[AgentRegistry] = None,
+                 voice: bool = True):
         """
         Initialize podcast orchestrator.
 
         Args:
             use_lite: If True, use lite model for agents
+            registry: Agent registry to draw agents from (default: process-wide)
+            voice: If False, run text-only (no synthesis or playback)
         """
-        # Set OpenAI API key for CrewAI
-        os.environ['OPENAI_API_KEY'] = Config.OPENROUTER_API_KEY
-
-        # Initialize agents in podcast mode (no tools, not verbose)
-        self.philosopher = ZeitgeistPhilosopher().create(use_lite=use_lite)
-        self.architect = CynicalContentArchitect().create(use_lite=use_lite)
-        self.optimizer = BrutalistOptimizer().create(use_lite=use_lite, podcast_mode=True)
-
-        # Set verbose=False for all agents in podcast mode
-        self.philosopher.verbose = False
-        self.architect.verbose = False
-        self.optimizer.verbose = False
+        # Podcast-mode agents (no optimizer tools, not verbose), shared via the registry
+        registry = registry or get_agent_registry()
+        self.philosopher = registry.get('philosopher', use_lite=use_lite, podcast_mode=True)
+        self.architect = registry.get('architect', use_lite=use_lite, podcast_mode=True)
+        self.optimizer = registry.get('optimizer', use_lite=use_lite, podcast_mode=True)
 
         # Task factory
         self.tasks = PodcastTasks()
 
+        # What agents see of the discussion (reset for every episode)
+        self.memory = DiscussionMemory()
+
         # Voice synthesis
-        try:
-            self.tts = EdgeTTS()
-            self.player = AudioPlayer()
-            self.voice_enabled = True
-        except Exception as e:
-            print(f"⚠️  Voice synthesis not available: {e}")
-            self.voice_enabled = False
+        self.voice_enabled = False
+        self.tts = None
+        if voice:
+            try:
+                self.tts = EdgeTTS()
+                self.player = get_audio_player()  # One output stream for the session
+                self.voice_enabled = True
+            except Exception as e:
+                print(f"⚠️  Voice synthesis not available: {e}")
 
         # Agent-to-name mapping
         self.agent_names = {
@@ -88,20 +94,94 @@ class PodcastOrchestrator:
         if self.voice_enabled:
             try:
                 # Synthesize speech
-                audio = self.tts.speak_as_agent(text, agent_name)
-
-                # Play audio
-                self.player.play(audio, blocking=True)
+                if Config.TTS_STREAMING:
+                    # Playback starts with the first synthesized sentence
+                    self.player.play_stream(self.tts.speak_as_agent_stream(text, agent_name))
+                else:
+                    audio = self.tts.speak_as_agent(text, agent_name)
+                    self.player.play(audio, blocking=True)
 
             except Exception as e:
                 print(f"⚠️  Voice playback failed: {e}")
         else:
             print("  (Voice synthesis not available - showing text only)")
 
+    def _run_task(self, agent, task) -> str:
+        """Execute one task with a single-agent crew and return its text."""
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=False
+        )
+
+        result = crew.kickoff()
+        return str(result).strip()
+
+    def _speakers(self) -> list:
+        """Agents in speaking order."""
+        return [(self.philosopher, 'philosopher'),
+                (self.architect, 'architect'),
+                (self.optimizer, 'optimizer')]
+
+    def _remember(self, turn: Turn, text: str):
+        """Record a generated turn in the discussion memory."""
+        self.memory.add(turn.agent_name.title(), text)
+
+    def _pipeline(self) -> SpeechPipeline:
+        """Speech pipeline using this orchestrator's voice stack."""
+        return SpeechPipeline(
+            tts=self.tts if self.voice_enabled else None,
+            player=self.player if self.voice_enabled else None,
+            display_names=self.display_names,
+            on_generated=self._remember
+        )
+
+    def _discussion_turns(self, topic: str, rounds: int):
+        """Yield discussion turns; responses and conclusions read the discussion memory."""
+        self.memory.reset()
+
+        for position, (agent, agent_name) in enumerate(self._speakers()):
+            yield Turn(
+                agent_name=agent_name,
+                generate=lambda _, agent=agent: self._run_task(
+                    agent, self.tasks.create_opening_statement_task(agent, topic)),
+                header="\n🎬 ROUND 1: Opening Statements\n\n" + "-" * 80 if position == 0 else None,
+                info={'round': 1, 'type': 'opening'}
+            )
+
+        for round_num in range(2, rounds + 1):
+            for position, (agent, agent_name) in enumerate(self._speakers()):
+                # Each response reacts to the discussion so far, latest turn first of all
+                yield Turn(
+                    agent_name=agent_name,
+                    generate=lambda previous, agent=agent: self._run_task(
+                        agent, self.tasks.create_response_task(agent, topic, previous,
+                                                               discussion=self.memory.context())),
+                    after_previous=True,
+                    header=f"\n🔄 ROUND {round_num}: Discussion\n\n" + "-" * 80 if position == 0 else None,
+                    info={'round': round_num, 'type': 'response'}
+                )
+
+        for position, (agent, agent_name) in enumerate(self._speakers()):
+            # The first conclusion waits for the last response; the others run alongside it
+            yield Turn(
+                agent_name=agent_name,
+                generate=lambda _, agent=agent: self._run_task(
+                    agent, self.tasks.create_conclusion_task(agent, topic,
+                                                             discussion=self.memory.context())),
+                after_previous=position == 0,
+                header="\n🎯 FINAL THOUGHTS: Conclusions\n\n" + "-" * 80 if position == 0 else None,
+                info={'round': 'final', 'type': 'conclusion'}
+            )
+
     def run_discussion(self, topic: str, rounds: int = 3) -> Dict[str, Any]:
         """
         Run a podcast-style discussion about a topic.
 
+        The next speaker's response is generated and synthesized while the
+        current one plays (see SpeechPipeline).
+
         Args:
             topic: The topic to discuss
             rounds: Number of discussion rounds
@@ -113,116 +193,143 @@ class PodcastOrchestrator:
         print(f"🎙️  PODCAST MODE: {topic}")
         print(f"{'='*80}\n")
 
-        transcript = []
-
-        # Round 1: Opening statements
-        print("\n🎬 ROUND 1: Opening Statements\n")
-        print("-" * 80)
-
-        for agent, agent_name in [(self.philosopher, 'philosopher'),
-                                   (self.architect, 'architect'),
-                                   (self.optimizer, 'optimizer')]:
-            # Create task
-            task = self.tasks.create_opening_statement_task(agent, topic)
-
-            # Execute with single-agent crew
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
-
-            result = crew.kickoff()
-            statement = str(result).strip()
+        transcript = self._pipeline().run(self._discussion_turns(topic, rounds))
+        dead_air = SpeechPipeline.dead_air_summary(transcript)
 
-            # Speak and record
-            self.speak_text(statement, agent_name)
-            transcript.append({
-                'agent': agent_name,
-                'round': 1,
-                'type': 'opening',
-                'text': statement
-            })
+        print(f"\n{'='*80}")
+        print("✅ Podcast discussion complete!")
+        print(f"⏱️  Dead air between speakers: {dead_air['mean']:.2f}s avg, "
+              f"{dead_air['max']:.2f}s max (first voice after {dead_air['startup']:.2f}s)")
+        memory = self.memory.stats()
+        print(f"🧠 Discussion context: at most {memory['max_context_tokens']} tokens per turn "
+              f"({memory['summary_points']} earlier points summarized)")
+        print(f"{'='*80}\n")
 
-        # Round 2-N: Responses and discussion
-        for round_num in range(2, rounds + 1):
-            print(f"\n🔄 ROUND {round_num}: Discussion\n")
-            print("-" * 80)
-
-            # Get previous statements for context
-            previous_statement = transcript[-1]['text'] if transcript else None
-
-            for agent, agent_name in [(self.philosopher, 'philosopher'),
-                                       (self.architect, 'architect'),
-                                       (self.optimizer, 'optimizer')]:
-                # Create response task
-                task = self.tasks.create_response_task(agent, topic, previous_statement)
-
-                # Execute
-                crew = Crew(
-                    agents=[agent],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=False
-                )
+        return {
+            'topic': topic,
+            'transcript': transcript,
+            'rounds': rounds,
+            'dead_air': dead_air,
+            'memory': memory,
+            'status': 'completed'
+        }
 
-                result = crew.kickoff()
-                response = str(result).strip()
-
-                # Speak and record
-                self.speak_text(response, agent_name)
-                transcript.append({
-                    'agent': agent_name,
-                    'round': round_num,
-                    'type': 'response',
-                    'text': response
-                })
-
-                # Update previous statement for next agent
-                previous_statement = response
-
-        # Final round: Conclusions
-        print("\n🎯 FINAL THOUGHTS: Conclusions\n")
-        print("-" * 80)
-
-        for agent, agent_name in [(self.philosopher, 'philosopher'),
-                                   (self.architect, 'architect'),
-                                   (self.optimizer, 'optimizer')]:
-            # Create conclusion task
-            task = self.tasks.create_conclusion_task(agent, topic)
-
-            # Execute
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
+    def render_discussion(self, topic: str, output_path: str, rounds: int = 3,
+                          gap: float = Config.RENDER_GAP_SECONDS,
+                          crossfade: float = Config.RENDER_CROSSFADE_SECONDS,
+                          verbose: bool = True) -> Dict[str, Any]:
+        """
+        Run a discussion headless, rendering every turn into one audio file.
 
-            result = crew.kickoff()
-            conclusion = str(result).strip()
+        Needs no sound device and runs faster than real time: turns are
+        written as soon as they are synthesized (see AudioFileWriter).
 
-            # Speak and record
-            self.speak_text(conclusion, agent_name)
-            transcript.append({
-                'agent': agent_name,
-                'round': 'final',
-                'type': 'conclusion',
-                'text': conclusion
-            })
+        Args:
+            topic: The topic to discuss
+            output_path: Audio file to write (.wav, .flac or .ogg)
+            rounds: Number of discussion rounds
+            gap: Seconds of silence between speakers
+            crossfade: Seconds by which speakers overlap (replaces the gap when > 0)
+            verbose: If False, print nothing (used for batch rendering)
 
-        print(f"\n{'='*80}")
-        print("✅ Podcast discussion complete!")
-        print(f"{'='*80}\n")
+        Returns:
+            Dictionary with discussion transcript and metadata
+        """
+        if verbose:
+            print(f"\n{'='*80}")
+            print(f"💾 RENDERING PODCAST: {topic}")
+            print(f"{'='*80}\n")
+
+        tts = self.tts or EdgeTTS()
+        with AudioFileWriter(output_path, sample_rate=tts.sample_rate,
+                             gap=gap, crossfade=crossfade) as writer:
+            pipeline = SpeechPipeline(tts=tts, player=writer, display_names=self.display_names,
+                                      verbose=verbose, on_generated=self._remember)
+            transcript = pipeline.run(self._discussion_turns(topic, rounds))
+
+        if verbose:
+            print(f"\n{'='*80}")
+            print(f"✅ Rendered {writer.duration:.1f}s of audio to {output_path}")
+            print(f"{'='*80}\n")
 
         return {
             'topic': topic,
             'transcript': transcript,
             'rounds': rounds,
+            'output_path': output_path,
+            'duration': writer.duration,
+            'memory': self.memory.stats(),
             'status': 'completed'
         }
 
+    @classmethod
+    def render_many(cls, topics: List[str], rounds: int = 3, workers: int = Config.BATCH_WORKERS,
+                    use_lite: bool = False,
+                    on_complete: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Render discussions for many topics in parallel (headless).
+
+        Each worker thread gets its own orchestrator and agent registry
+        (agents are not safe to share between concurrent runs). All workers
+        share one EdgeTTS engine, so TTS concurrency is capped globally, and
+        the process-wide LLM rate limiter. Audio and transcript are written to
+        episode_path(topic) as each topic finishes.
+
+        Args:
+            topics: Topics to discuss
+            rounds: Discussion rounds per episode
+            workers: Number of episodes produced at the same time
+            use_lite: If True, use lite model for agents
+            on_complete: Called from the worker thread as soon as a topic finishes
+
+        Returns:
+            One result per topic, in input order. Failed topics have status
+            "failed" and an "error" message. Every result has "elapsed".
+        """
+        local = threading.local()
+        tts = EdgeTTS()
+
+        def run(topic: str) -> Dict[str, Any]:
+            start = time.time()
+            try:
+                if not hasattr(local, 'orchestrator'):
+                    local.orchestrator = cls(use_lite=use_lite, registry=AgentRegistry(), voice=False)
+                    local.orchestrator.tts = tts
+                result = local.orchestrator.render_discussion(
+                    topic, cls.episode_path(topic, '.wav'), rounds=rounds, verbose=False
+                )
+                local.orchestrator.save_transcript(result)
+            except Exception as e:
+                result = {"topic": topic, "status": "failed", "error": str(e)}
+            result["elapsed"] = time.time() - start
+
+            if on_complete:
+                on_complete(result)
+            return result
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(topics)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(run, topic): i for i, topic in enumerate(topics)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
+    @staticmethod
+    def episode_path(topic: str, extension: str = '.md') -> str:
+        """
+        Output path for a topic's podcast files.
+
+        Args:
+            topic: Discussion topic
+            extension: File extension ('.md' transcript, '.wav' audio)
+
+        Returns:
+            Path under outputs/
+        """
+        topic_slug = topic.replace(' ', '_').lower()
+        return f"outputs/podcast_{topic_slug}{extension}"
+
     def quick_takes(self, topic: str) -> Dict[str, str]:
         """
         Get quick hot takes from all agents.
@@ -237,32 +344,20 @@ class PodcastOrchestrator:
         print(f"⚡ QUICK TAKES: {topic}")
         print(f"{'='*80}\n")
 
-        hot_takes = {}
-
-        for agent, agent_name in [(self.philosopher, 'philosopher'),
-                                   (self.architect, 'architect'),
-                                   (self.optimizer, 'optimizer')]:
-            # Create hot take task
-            task = self.tasks.create_quick_take_task(agent, topic)
-
-            # Execute
-            crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
+        # Hot takes are independent, so all of them generate concurrently
+        turns = [
+            Turn(
+                agent_name=agent_name,
+                generate=lambda _, agent=agent: self._run_task(
+                    agent, self.tasks.create_quick_take_task(agent, topic))
             )
-
-            result = crew.kickoff()
-            hot_take = str(result).strip()
-
-            # Speak and record
-            self.speak_text(hot_take, agent_name)
-            hot_takes[agent_name] = hot_take
+            for agent, agent_name in self._speakers()
+        ]
+        transcript = self._pipeline().run(turns)
 
         print(f"\n{'='*80}\n")
 
-        return hot_takes
+        return {entry['agent']: entry['text'] for entry in transcript}
 
     def save_transcript(self, discussion: Dict[str, Any], output_path: str = None):
         """
@@ -273,8 +368,7 @@ class PodcastOrchestrator:
             output_path: Path to save transcript
         """
         if output_path is None:
-            topic_slug = discussion['topic'].replace(' ', '_').lower()
-            output_path = f"outputs/podcast_{topic_slug}.md"
+            output_path = self.episode_path(discussion['topic'])
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
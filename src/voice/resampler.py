@@ -0,0 +1,195 @@
+"""
+Polyphase Resampler
+Rational sample rate conversion for TTS output and STT input.
+
+A rate pair src -> dst is reduced to up/down = dst/src. The anti-aliasing
+low-pass filter for each (up, down) pair is designed once and cached, and
+samples are processed in float32 with scipy's polyphase upfirdn, so the cost
+is linear in the utterance length (unlike an FFT over the whole clip).
+StreamingResampler converts chunk by chunk with the same filter and produces
+the same samples as a one-shot conversion of the concatenated input.
+"""
+
+from functools import lru_cache
+from math import gcd
+from typing import Tuple
+import numpy as np
+from scipy.signal import firwin, resample_poly, upfirdn
+
+
+def rate_ratio(src_rate: int, dst_rate: int) -> Tuple[int, int]:
+    """Reduced (up, down) factors for converting src_rate to dst_rate."""
+    divisor = gcd(int(src_rate), int(dst_rate))
+    return int(dst_rate) // divisor, int(src_rate) // divisor
+
+
+@lru_cache(maxsize=32)
+def design_filter(up: int, down: int) -> np.ndarray:
+    """
+    Low-pass FIR filter for an up/down conversion (cached per pair).
+
+    Same design as scipy.signal.resample_poly's default: a Kaiser-windowed
+    sinc with the cutoff at the lower of the two Nyquist rates.
+
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+
+    Returns:
+        Read-only float32 filter taps (odd length, linear phase)
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0)).astype(np.float32)
+    taps.setflags(write=False)
+    return taps
+
+
+class Resampler:
+    """One-shot and streaming conversion between two sample rates."""
+
+    def __init__(self, src_rate: int, dst_rate: int):
+        """
+        Initialize the resampler (the filter is designed on first use of a rate pair).
+
+        Args:
+            src_rate: Input sample rate in Hz
+            dst_rate: Output sample rate in Hz
+        """
+        self.src_rate = int(src_rate)
+        self.dst_rate = int(dst_rate)
+        self.up, self.down = rate_ratio(src_rate, dst_rate)
+        self.taps = design_filter(self.up, self.down) if self.up != self.down else None
+
+    def output_length(self, input_length: int) -> int:
+        """Number of output samples for an input of input_length samples."""
+        return -(-input_length * self.up // self.down)
+
+    def resample(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Convert a complete clip.
+
+        Args:
+            audio: Mono samples at src_rate
+
+        Returns:
+            float32 samples at dst_rate
+        """
+        audio = np.asarray(audio, dtype=np.float32)
+        if self.taps is None:
+            return audio
+        return resample_poly(audio, self.up, self.down, window=self.taps)
+
+    def stream(self) -> "StreamingResampler":
+        """Create a stateful chunk-by-chunk converter for this rate pair."""
+        return StreamingResampler(self)
+
+
+class StreamingResampler:
+    """
+    Chunk-wise polyphase conversion.
+
+    Keeps just enough input history for the filter, so memory stays constant
+    however long the stream is. Call process() per chunk and flush() once at
+    the end to emit the filter's tail.
+    """
+
+    def __init__(self, resampler: Resampler):
+        """
+        Initialize the stream state.
+
+        Args:
+            resampler: Resampler providing the rate pair and filter
+        """
+        self.up = resampler.up
+        self.down = resampler.down
+        self.passthrough = resampler.taps is None
+        self._output_length = resampler.output_length
+
+        if not self.passthrough:
+            taps = resampler.taps * np.float32(self.up)
+            half_len = (len(taps) - 1) // 2
+            # Pad the filter so its center delay is a whole number of output samples
+            pad = -half_len % self.down
+            self.taps = np.concatenate([np.zeros(pad, dtype=np.float32), taps])
+            self.delay = (half_len + pad) // self.down
+
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_start = 0  # Absolute input index of _buffer[0], a multiple of down
+        self._received = 0      # Input samples received so far
+        self._emitted = 0       # Output samples emitted so far
+
+    def _produce(self, available: int, limit: int) -> np.ndarray:
+        """Emit outputs computable from `available` input samples, up to `limit` in total."""
+        # Filter output q needs input up to floor(q * down / up)
+        ready = (available * self.up - 1) // self.down + 1 - self.delay
+        end = min(ready, limit)
+        if end <= self._emitted:
+            return np.zeros(0, dtype=np.float32)
+
+        filtered = upfirdn(self.taps, self._buffer, self.up, self.down)
+        offset = self._buffer_start * self.up // self.down - self.delay
+        output = filtered[self._emitted - offset:end - offset].astype(np.float32, copy=False)
+        self._emitted = end
+
+        # Drop input no longer reachable by the filter, keeping the phase aligned
+        oldest_needed = ((end + self.delay) * self.down - len(self.taps) + 1) // self.up
+        new_start = max(self._buffer_start, (oldest_needed // self.down) * self.down)
+        self._buffer = self._buffer[new_start - self._buffer_start:]
+        self._buffer_start = new_start
+
+        return output
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Convert the next chunk.
+
+        Args:
+            chunk: Mono samples at the source rate
+
+        Returns:
+            float32 samples at the destination rate (may be empty for tiny chunks)
+        """
+        chunk = np.asarray(chunk, dtype=np.float32).ravel()
+        if self.passthrough:
+            return chunk
+
+        self._buffer = np.concatenate([self._buffer, chunk])
+        self._received += len(chunk)
+        return self._produce(self._received, limit=self._output_length(self._received))
+
+    def flush(self) -> np.ndarray:
+        """
+        Emit the remaining output, treating the input as ending here.
+
+        Returns:
+            float32 samples completing the stream
+        """
+        if self.passthrough:
+            return np.zeros(0, dtype=np.float32)
+
+        total = self._output_length(self._received)
+        tail = len(self.taps) // self.up + self.down + 1
+        self._buffer = np.concatenate([self._buffer, np.zeros(tail, dtype=np.float32)])
+        return self._produce(self._received + tail, limit=total)
+
+
+@lru_cache(maxsize=32)
+def get_resampler(src_rate: int, dst_rate: int) -> Resampler:
+    """Shared Resampler for a rate pair."""
+    return Resampler(src_rate, dst_rate)
+
+
+def resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """
+    Convert a clip between sample rates with a cached polyphase filter.
+
+    Args:
+        audio: Mono samples at src_rate
+        src_rate: Input sample rate in Hz
+        dst_rate: Output sample rate in Hz
+
+    Returns:
+        float32 samples at dst_rate
+    """
+    return get_resampler(src_rate, dst_rate).resample(audio)
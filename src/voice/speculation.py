@@ -0,0 +1,189 @@
+"""
+Speculative Responses - agent replies generated before anyone asks for them.
+Used by InteractivePodcast while the user is choosing who speaks next.
+
+As soon as a turn ends, every agent's reply to that turn starts in the
+background. When the user picks an agent its reply is usually finished, so
+synthesis of the picked reply starts at once. Speculation is text only:
+speech is synthesized for the picked reply alone, by the playback path and
+with its own sentence split, so no TTS is spent on replies nobody hears.
+Replies nobody picked stay in memory and are reused if the same agent is
+asked to answer the same text later, as long as the discussion context the
+reply was generated against has not changed since. Their tokens count against a
+per-session budget. When the remaining budget cannot cover another speculative reply,
+speculation stops and replies are generated on demand as before.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+import threading
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+
+class SpeculativeResponder:
+    """Runs every candidate's reply ahead of the user's choice, within a token budget."""
+
+    MAX_UNUSED = 16  # Discarded replies kept for reuse
+
+    def __init__(self, generate: Callable[[str, str], Tuple[str, int]],
+                 token_budget: int = Config.SPECULATION_TOKEN_BUDGET,
+                 token_estimate: int = Config.SPECULATION_TOKEN_ESTIMATE,
+                 workers: int = 3,
+                 version: Optional[Callable[[], int]] = None):
+        """
+        Initialize the responder.
+
+        Args:
+            generate: generate(agent_name, previous_text) -> (reply, tokens used)
+            token_budget: Tokens that may be spent on replies nobody used
+            token_estimate: Expected tokens per reply until some have been measured
+            workers: Replies generated at the same time
+            version: Returns a number that changes whenever the context
+                     generate() sees changes (e.g. DiscussionMemory.turns);
+                     replies are only reused within one version
+        """
+        self.generate = generate
+        self.version = version or (lambda: 0)
+        self.token_budget = token_budget
+        self.wasted_tokens = 0
+        self.hits = 0    # Picks served by a speculative reply
+        self.misses = 0  # Picks generated on demand
+        self._estimate = token_estimate
+        self._measured = 0
+        self._pending: Dict[Tuple[str, str, int], Future] = {}  # (agent, previous_text, version) -> reply future
+        self._unused: Dict[Tuple[str, str, int], Future] = {}   # Discarded replies, charged and kept for reuse
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="speculate")
+
+    @property
+    def budget_left(self) -> int:
+        """Tokens still available for speculation."""
+        return self.token_budget - self.wasted_tokens
+
+    def _run(self, agent_name: str, previous_text: str) -> Tuple[str, int]:
+        """Generate one reply and update the per-reply token estimate."""
+        text, tokens = self.generate(agent_name, previous_text)
+
+        with self._lock:
+            self._measured += 1
+            self._estimate += (tokens - self._estimate) / self._measured
+
+        return text, tokens
+
+    def start(self, previous_text: str, agents: Sequence[str]):
+        """
+        Begin replies to previous_text for each agent, most likely pick first.
+
+        Agents whose reply would not fit the remaining budget are skipped.
+
+        Args:
+            previous_text: What was just said
+            agents: Candidate agent names in order of likelihood
+        """
+        with self._lock:
+            # Worst case every speculative reply goes unused
+            in_flight = sum(1 for future in self._pending.values() if not future.done())
+            committed = self.wasted_tokens + in_flight * self._estimate
+
+            version = self.version()
+            for agent_name in agents:
+                key = (agent_name, previous_text, version)
+                if key in self._pending or key in self._unused:
+                    continue
+                if committed + self._estimate > self.token_budget:
+                    break
+                committed += self._estimate
+                self._pending[key] = self._pool.submit(self._run, agent_name, previous_text)
+
+    def take(self, agent_name: str, previous_text: str) -> str:
+        """
+        Get an agent's reply, from speculation when available.
+
+        Args:
+            agent_name: Agent the user picked
+            previous_text: What the agent replies to
+
+        Returns:
+            The reply text
+        """
+        key = (agent_name, previous_text, self.version())
+        with self._lock:
+            future = self._pending.pop(key, None)
+            reused = future is None and key in self._unused
+            if reused:
+                future = self._unused.pop(key)
+
+        if future is None:
+            self.misses += 1
+            return self.generate(agent_name, previous_text)[0]
+
+        try:
+            text, tokens = future.result()
+        except Exception:
+            # A failed speculation is retried on demand (and surfaces its error there)
+            self.misses += 1
+            return self.generate(agent_name, previous_text)[0]
+
+        self.hits += 1
+        if reused:
+            # Charged as wasted when discarded, but used after all
+            with self._lock:
+                self.wasted_tokens -= tokens
+        return text
+
+    def discard(self, keep_text: Optional[str] = None):
+        """
+        Give up on replies the user did not pick and charge them to the budget.
+
+        Finished replies stay cached; unstarted ones are cancelled; running
+        ones are charged when they finish.
+
+        Args:
+            keep_text: Leave replies to this text pending (still answerable)
+        """
+        dropped = []
+        with self._lock:
+            for key, future in list(self._pending.items()):
+                if key[1] == keep_text:
+                    continue
+                del self._pending[key]
+                if future.cancel():
+                    continue
+                self._unused[key] = future
+                dropped.append(future)
+
+            # Bounded: only recent turns are likely to be asked again
+            while len(self._unused) > self.MAX_UNUSED:
+                del self._unused[next(iter(self._unused))]
+
+        # Outside the lock: callbacks of finished futures run immediately
+        for future in dropped:
+            future.add_done_callback(self._charge)
+
+    def _charge(self, future: Future):
+        """Count an unused reply's tokens as wasted."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self.wasted_tokens += future.result()[1]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get speculation counters.
+
+        Returns:
+            Dictionary with hits, misses, wasted tokens and budget left
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'wasted_tokens': self.wasted_tokens,
+            'budget_left': self.budget_left,
+        }
+
+    def close(self):
+        """Stop accepting work; running replies finish in the background."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,271 @@
+"""
+Speech Pipeline - Overlaps LLM generation, speech synthesis and playback.
+Turns flow through three stages connected by bounded queues:
+
+    generation (thread pool)  ->  synthesis (1 thread)  ->  playback (caller)
+
+While turn N-1 plays, turn N is synthesized and turn N+1 is generated.
+Turns that do not depend on the previous turn's text (opening statements,
+conclusions, quick takes) are generated concurrently, so dead air between
+speakers shrinks to the playback handover. Queue sizes bound how far the
+pipeline runs ahead, which keeps memory flat for long discussions.
+With Config.TTS_STREAMING a turn starts playing as soon as its first
+sentence is synthesized.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import queue
+import threading
+import time
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+
+@dataclass
+class Turn:
+    """One contribution to a spoken discussion."""
+
+    agent_name: str  # philosopher, architect, optimizer
+    generate: Callable[[Optional[str]], str]  # Receives the previous turn's text when after_previous
+    after_previous: bool = False  # True when generation needs the discussion so far (waits for every earlier turn)
+    header: Optional[str] = None  # Printed before the turn plays (e.g. a round banner)
+    info: Dict[str, Any] = field(default_factory=dict)  # Copied into the transcript entry
+
+
+class SpeechPipeline:
+    """
+    Producer/consumer engine for multi-speaker voice output.
+    Used by PodcastOrchestrator for discussions and quick takes.
+    """
+
+    _DONE = object()
+
+    def __init__(self, tts=None, player=None, display_names: Optional[Dict[str, str]] = None,
+                 lookahead: int = Config.PODCAST_LOOKAHEAD,
+                 generators: int = Config.PODCAST_GENERATORS, verbose: bool = True,
+                 on_generated: Optional[Callable[[Turn, str], None]] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            tts: EdgeTTS instance (None = text only)
+            player: AudioPlayer instance (None = text only)
+            display_names: Agent name to printed speaker name
+            lookahead: Generated turns allowed to wait for synthesis
+            generators: LLM calls allowed to run at the same time
+            verbose: If False, do not print turns (e.g. batch rendering)
+            on_generated: Called with each turn and its text, in turn order, before
+                          a dependent turn starts generating (e.g. to update DiscussionMemory)
+        """
+        self.tts = tts
+        self.player = player
+        self.display_names = display_names or {}
+        self.lookahead = max(1, lookahead)
+        self.generators = max(1, generators)
+        self.voice_enabled = tts is not None and player is not None
+        self.streaming = Config.TTS_STREAMING
+        self.verbose = verbose
+        self.on_generated = on_generated
+        self._agent_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._stop = threading.Event()
+
+    def _agent_lock(self, agent_name: str) -> threading.Lock:
+        """One agent never generates two turns at once (agents hold executor state)."""
+        with self._locks_guard:
+            if agent_name not in self._agent_locks:
+                self._agent_locks[agent_name] = threading.Lock()
+            return self._agent_locks[agent_name]
+
+    def _put(self, q: queue.Queue, item):
+        """Blocking put that gives up once the pipeline is stopping."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue):
+        """Blocking get that returns _DONE once the pipeline is stopping."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return self._DONE
+
+    def _generate(self, turn: Turn, previous_text: Optional[str]) -> str:
+        """Generation stage: run one turn's LLM call."""
+        with self._agent_lock(turn.agent_name):
+            return turn.generate(previous_text)
+
+    def _produce(self, turns: Iterable[Turn], pool: ThreadPoolExecutor, texts: queue.Queue):
+        """Submit generations in order, waiting only where a turn needs what came before."""
+        earlier: List[tuple] = []  # (turn, future) not yet handed to on_generated
+        try:
+            for turn in turns:
+                if self._stop.is_set():
+                    return
+                previous_text = None
+                if turn.after_previous and earlier:
+                    for done, future in earlier:
+                        previous_text = future.result().strip()
+                        if self.on_generated:
+                            self.on_generated(done, previous_text)
+                    earlier = []
+                future = pool.submit(self._generate, turn, previous_text)
+                earlier.append((turn, future))
+                self._put(texts, (turn, future))
+        except BaseException as e:
+            self._put(texts, e)
+            return
+        self._put(texts, self._DONE)
+
+    def _synthesize(self, texts: queue.Queue, clips: queue.Queue):
+        """Synthesis stage: turn generated text into audio, in turn order."""
+        while not self._stop.is_set():
+            # Never block for good: the producer may stop without posting _DONE
+            item = self._get(texts)
+            if item is self._DONE or isinstance(item, BaseException):
+                self._put(clips, item)
+                return
+
+            turn, future = item
+            try:
+                text = future.result().strip()
+            except BaseException as e:
+                self._put(clips, e)
+                return
+
+            if self.voice_enabled and self.streaming:
+                # Hand the turn to playback right away and feed it sentence chunks
+                audio = queue.Queue()
+                self._put(clips, (turn, text, audio))
+                try:
+                    for chunk in self.tts.speak_as_agent_stream(text, turn.agent_name):
+                        audio.put(chunk)
+                except Exception as e:
+                    print(f"⚠️  Voice synthesis failed: {e}")
+                finally:
+                    audio.put(self._DONE)
+                continue
+
+            audio = None
+            if self.voice_enabled:
+                # Non-blocking: the next ready turn starts synthesizing concurrently
+                audio = self.tts.submit(text, self.tts.get_agent_voice(turn.agent_name))
+
+            self._put(clips, (turn, text, audio))
+
+    def _drain(self, chunks: queue.Queue):
+        """Yield a turn's audio chunks until the synthesis stage closes it."""
+        while True:
+            chunk = chunks.get()
+            # Identity check: numpy chunks cannot be compared with ==
+            if chunk is self._DONE:
+                return
+            yield chunk
+
+    def _present(self, turn: Turn, text: str):
+        """Print a turn as it starts playing."""
+        if not self.verbose:
+            return
+
+        if turn.header:
+            print(turn.header)
+
+        display_name = self.display_names.get(turn.agent_name, turn.agent_name)
+        print(f"\n{display_name}:")
+        print(f"  {text}\n")
+
+        if not self.voice_enabled:
+            print("  (Voice synthesis not available - showing text only)")
+
+    def run(self, turns: Iterable[Turn]) -> List[Dict[str, Any]]:
+        """
+        Speak a sequence of turns, overlapping generation, synthesis and playback.
+
+        Args:
+            turns: Turns in speaking order
+
+        Returns:
+            Transcript entries (agent, text, info fields, dead_air seconds)
+        """
+        self._stop.clear()
+        texts = queue.Queue(maxsize=self.lookahead)
+        clips = queue.Queue(maxsize=1)  # One clip ready while another plays
+        transcript = []
+        started_at = time.time()
+        last_end: Optional[float] = None
+
+        pool = ThreadPoolExecutor(max_workers=self.generators)
+        producer = threading.Thread(target=self._produce, args=(turns, pool, texts), daemon=True)
+        synthesizer = threading.Thread(target=self._synthesize, args=(texts, clips), daemon=True)
+        producer.start()
+        synthesizer.start()
+
+        try:
+            while True:
+                item = clips.get()
+                if item is self._DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                turn, text, audio = item
+                # Silence since the previous speaker stopped (first turn: startup latency)
+                silence_from = last_end if last_end is not None else started_at
+                dead_air = time.time() - silence_from
+
+                self._present(turn, text)
+                if isinstance(audio, queue.Queue):
+                    try:
+                        first_audio = self.player.play_stream(self._drain(audio))
+                        if first_audio is not None:
+                            dead_air += first_audio
+                    except Exception as e:
+                        print(f"⚠️  Voice playback failed: {e}")
+                elif audio is not None:
+                    try:
+                        clip = audio.result()
+                        dead_air = time.time() - silence_from
+                        self.player.play(clip, blocking=True)
+                    except Exception as e:
+                        print(f"⚠️  Voice playback failed: {e}")
+                last_end = time.time()
+
+                transcript.append({
+                    'agent': turn.agent_name,
+                    **turn.info,
+                    'text': text,
+                    'dead_air': round(dead_air, 3),
+                })
+        finally:
+            self._stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return transcript
+
+    @staticmethod
+    def dead_air_summary(transcript: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Summarize dead air between speakers (the first turn's startup latency excluded).
+
+        Args:
+            transcript: Entries returned by run()
+
+        Returns:
+            Dictionary with startup, total, mean and max seconds
+        """
+        gaps = [entry['dead_air'] for entry in transcript[1:]]
+        return {
+            'startup': transcript[0]['dead_air'] if transcript else 0.0,
+            'total': round(sum(gaps), 3),
+            'mean': round(sum(gaps) / len(gaps), 3) if gaps else 0.0,
+            'max': round(max(gaps), 3) if gaps else 0.0,
+        }
@@ -1,34 +1,42 @@
 """
 Speech-to-Text using OpenAI Whisper API.
-Converts audio input to text transcription.
+Converts audio input to text transcription. The engine is pluggable
+(STT_BACKEND, see backends); the default is the OpenAI API.
+
+Recordings are sent with transcribe_audio(), which trims, downsamples and
+compresses them in memory first (see stt_preprocess). transcribe_stream()
+uploads segments of a live recording while capture continues, so only the
+last segment is outstanding when the user stops talking.
 """
 
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+import io
+import numpy as np
+import soundfile as sf
 import os
 import sys
+import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from config import Config
+from src.crew.instrumentation import get_instrumentation
+from .backends import STTBackend, create_stt_backend
+from .stt_preprocess import prepare_upload
 
 
 class WhisperSTT:
     """Speech-to-text using OpenAI's Whisper API."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, backend: Optional[STTBackend] = None):
         """
         Initialize Whisper STT client.
 
         Args:
             api_key: OpenAI API key (defaults to Config.OPENAI_API_KEY)
+            backend: STT engine (defaults to the Config.STT_BACKEND engine)
         """
-        self.api_key = api_key or Config.OPENAI_API_KEY
-
-        if not self.api_key:
-            raise ValueError(
-                "OpenAI API key not found! "
-                "Please set OPENAI_API_KEY in your .env file."
-            )
-
-        self.client = OpenAI(api_key=self.api_key)
+        self.backend = backend or create_stt_backend(api_key=api_key)
+        self.last_upload: Optional[Dict[str, Any]] = None  # Size and timing of the last transcribe_audio()
 
     def transcribe(self, audio_file_path: str, language: str = "en") -> str:
         """
@@ -41,20 +49,117 @@ class WhisperSTT:
         Returns:
             Transcribed text
         """
-        try:
-            with open(audio_file_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=language,
-                    response_format="text"
-                )
+        with open(audio_file_path, "rb") as audio_file:
+            data = audio_file.read()
+
+        return self.transcribe_bytes(data, os.path.basename(audio_file_path), language)
+
+    def transcribe_bytes(self, data: bytes, filename: str = "speech.flac", language: str = "en") -> str:
+        """
+        Transcribe encoded audio held in memory.
 
-            return transcript.strip()
+        Args:
+            data: Encoded audio (flac, ogg, wav, mp3, ...)
+            filename: Name whose extension tells the API the format
+            language: Language code (e.g., "en" for English)
+
+        Returns:
+            Transcribed text
+        """
+        try:
+            with get_instrumentation().span('stt', self.backend.name, cost=self._cost(data)):
+                return self.backend.transcribe(filename, data, language)
 
         except Exception as e:
             raise RuntimeError(f"Whisper transcription failed: {str(e)}")
 
+    def _cost(self, data: bytes) -> float:
+        """Estimated price of transcribing an upload (Whisper bills per minute of audio)."""
+        if self.backend.name != "openai-whisper":
+            return 0.0
+        try:
+            info = sf.info(io.BytesIO(data))
+        except RuntimeError:  # Format soundfile cannot parse (e.g. mp3 on old libsndfile)
+            return 0.0
+        return info.frames / info.samplerate / 60 * Config.STT_PRICE_PER_MINUTE
+
+    def transcribe_audio(self, audio: np.ndarray,
+                         sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                         language: str = "en") -> str:
+        """
+        Transcribe a recording without writing it to disk.
+
+        The audio is trimmed to speech, resampled to STT_SAMPLE_RATE and
+        encoded as STT_UPLOAD_FORMAT before upload. Upload size and timings
+        are kept in self.last_upload.
+
+        Args:
+            audio: Recorded samples (e.g. from AudioRecorder)
+            sample_rate: Sample rate of audio in Hz
+            language: Language code (e.g., "en" for English)
+
+        Returns:
+            Transcribed text (empty if the recording is empty)
+        """
+        upload = prepare_upload(audio, sample_rate)
+        if upload.seconds == 0:
+            return ""
+
+        start = time.perf_counter()
+        text = self.transcribe_bytes(upload.data, upload.filename, language)
+
+        self.last_upload = {
+            "bytes": upload.size,
+            "seconds": upload.seconds,
+            "input_seconds": upload.input_seconds,
+            "encode_time": upload.encode_time,
+            "latency": time.perf_counter() - start,
+        }
+        return text
+
+    def transcribe_stream(self, segments: Iterable[np.ndarray],
+                          sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                          language: str = "en",
+                          workers: int = Config.STT_STREAM_WORKERS) -> str:
+        """
+        Transcribe consecutive segments of one utterance concurrently.
+
+        Each segment is encoded and uploaded as soon as it arrives (e.g. from
+        AudioRecorder.record_segments() while the user is still speaking);
+        the texts are joined in segment order.
+
+        Args:
+            segments: Consecutive audio segments, possibly produced live
+            sample_rate: Sample rate of the segments in Hz
+            language: Language code (e.g., "en" for English)
+            workers: Segment uploads allowed in flight at once
+
+        Returns:
+            Transcribed text of all segments
+        """
+        def transcribe_segment(segment: np.ndarray):
+            # Segments are already cut at speech boundaries
+            upload = prepare_upload(segment, sample_rate, trim=False)
+            if upload.seconds == 0:
+                return upload, ""
+            return upload, self.transcribe_bytes(upload.data, upload.filename, language)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(transcribe_segment, segment) for segment in segments]
+
+            # Recording has ended; whatever is still running is the user-visible wait
+            finished_at = time.perf_counter()
+            results = [future.result() for future in futures]
+
+        self.last_upload = {
+            "bytes": sum(upload.size for upload, _ in results),
+            "seconds": sum(upload.seconds for upload, _ in results),
+            "segments": len(results),
+            "encode_time": sum(upload.encode_time for upload, _ in results),
+            "latency": time.perf_counter() - finished_at,
+        }
+        return " ".join(text for _, text in results if text)
+
     def transcribe_with_timestamps(self, audio_file_path: str, language: str = "en") -> dict:
         """
         Transcribe audio with word-level timestamps.
@@ -68,19 +173,9 @@ class WhisperSTT:
         """
         try:
             with open(audio_file_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=language,
-                    response_format="verbose_json",
-                    timestamp_granularities=["word"]
-                )
-
-            return {
-                "text": transcript.text,
-                "duration": transcript.duration,
-                "words": transcript.words if hasattr(transcript, 'words') else []
-            }
+                data = audio_file.read()
+
+            return self.backend.transcribe_verbose(os.path.basename(audio_file_path), data, language)
 
         except Exception as e:
             raise RuntimeError(f"Whisper transcription failed: {str(e)}")
@@ -88,12 +183,12 @@ class WhisperSTT:
     @staticmethod
     def validate_config() -> bool:
         """
-        Validate that OpenAI API key is configured.
+        Validate that OpenAI API key is configured (not needed by the local backend).
 
         Returns:
             True if configured, raises ValueError otherwise
         """
-        if not Config.OPENAI_API_KEY:
+        if Config.STT_BACKEND == 'openai' and not Config.OPENAI_API_KEY:
             raise ValueError(
                 "OPENAI_API_KEY not found! "
                 "Please add it to your .env file for voice capabilities."
@@ -0,0 +1,102 @@
+"""
+STT Upload Preprocessing
+Turns a microphone recording into a compact in-memory upload for Whisper.
+
+Recordings arrive as 24 kHz float32 with silence around the speech.
+prepare_upload() trims non-speech with the VAD, mixes down to mono,
+resamples to 16 kHz (the rate Whisper works at internally, so nothing it
+would use is lost) and encodes to FLAC or Opus in a BytesIO. The bytes go
+straight to the API; no temp file is written.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+import io
+import time
+import numpy as np
+import soundfile as sf
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+from .resampler import resample
+from .vad import trim_silence
+
+# Upload format name -> (soundfile format, subtype, file extension)
+UPLOAD_FORMATS = {
+    'flac': ('FLAC', 'PCM_16', '.flac'),  # Lossless, about half the size of 16-bit WAV
+    'opus': ('OGG', 'OPUS', '.ogg'),      # Lossy, smallest
+    'wav': ('WAV', 'PCM_16', '.wav'),     # Uncompressed
+}
+
+
+@dataclass
+class PreparedUpload:
+    """Encoded audio ready to send to Whisper."""
+
+    data: bytes
+    filename: str  # Extension tells the API the container format
+    sample_rate: int
+    seconds: float  # Duration uploaded
+    input_seconds: float  # Duration recorded, before trimming
+    encode_time: float  # Seconds spent trimming, resampling and encoding
+
+    @property
+    def size(self) -> int:
+        """Upload size in bytes."""
+        return len(self.data)
+
+    def as_file(self) -> Tuple[str, bytes]:
+        """(filename, bytes) tuple accepted by the OpenAI client as a file."""
+        return self.filename, self.data
+
+
+def prepare_upload(audio: np.ndarray,
+                   sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                   target_rate: int = Config.STT_SAMPLE_RATE,
+                   upload_format: str = Config.STT_UPLOAD_FORMAT,
+                   trim: bool = True) -> PreparedUpload:
+    """
+    Trim, downsample and encode a recording for transcription.
+
+    Args:
+        audio: Samples of shape (frames,) or (frames, channels)
+        sample_rate: Sample rate of audio in Hz
+        target_rate: Sample rate sent to Whisper
+        upload_format: 'flac', 'opus' or 'wav'
+        trim: If True, cut leading and trailing silence with the VAD
+
+    Returns:
+        PreparedUpload with the encoded bytes
+    """
+    if upload_format not in UPLOAD_FORMATS:
+        raise ValueError(
+            f"Unknown STT upload format: {upload_format}. "
+            f"Available formats: {list(UPLOAD_FORMATS.keys())}"
+        )
+    container, subtype, extension = UPLOAD_FORMATS[upload_format]
+
+    start = time.perf_counter()
+    input_seconds = len(audio) / sample_rate
+
+    if trim:
+        audio = trim_silence(audio, sample_rate)
+
+    # Mono without a copy for the common single-channel case
+    if audio.ndim > 1:
+        audio = audio[:, 0] if audio.shape[1] == 1 else audio.mean(axis=1)
+
+    audio = resample(audio, sample_rate, target_rate)
+    audio = np.clip(audio, -1.0, 1.0)
+
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, target_rate, format=container, subtype=subtype)
+
+    return PreparedUpload(
+        data=buffer.getvalue(),
+        filename=f"speech{extension}",
+        sample_rate=target_rate,
+        seconds=len(audio) / target_rate,
+        input_seconds=input_seconds,
+        encode_time=time.perf_counter() - start,
+    )
@@ -1,16 +1,29 @@
 """
 Text-to-Speech using Edge TTS (Microsoft).
-Converts text to speech with different voice options.
+Converts text to speech with different voice options, either as one clip or
+streamed sentence by sentence so playback can start before synthesis ends.
+The engine is pluggable (TTS_BACKEND, see backends); the default is Edge TTS.
 """
 
+from collections import deque
+from concurrent.futures import Future
+from typing import Iterator, List, Optional, Union
 import asyncio
-import edge_tts
+import io
+import re
+import threading
+import weakref
 import numpy as np
 import soundfile as sf
 import tempfile
+import time
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.crew.instrumentation import get_instrumentation
+from .audio_cache import AudioCache, get_audio_cache
+from .backends import TTSBackend, create_tts_backend
+from .resampler import resample
 from config import Config
 
 
@@ -43,13 +56,71 @@ class EdgeTTS:
         'bm_lewis': 'British male voice',
     }
 
-    def __init__(self):
-        """Initialize Edge TTS engine."""
+    # One long-lived event loop (on a daemon thread) runs every Edge TTS request
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+
+    def __init__(self, max_concurrency: int = Config.TTS_MAX_CONCURRENCY,
+                 backend: Optional[TTSBackend] = None):
+        """
+        Initialize Edge TTS engine.
+
+        Args:
+            max_concurrency: Maximum Edge TTS requests in flight at once
+            backend: TTS engine (defaults to the Config.TTS_BACKEND engine)
+        """
+        self.backend = backend or create_tts_backend()
         self.sample_rate = Config.AUDIO_SAMPLE_RATE
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphores = weakref.WeakKeyDictionary()  # event loop -> semaphore
+
+    @classmethod
+    def _background_loop(cls) -> asyncio.AbstractEventLoop:
+        """Start the shared synthesis event loop on first use."""
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="edge-tts-loop", daemon=True).start()
+                cls._loop = loop
+            return cls._loop
+
+    def _run(self, coroutine):
+        """Run a coroutine on the background loop and wait for its result (any thread)."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._background_loop()).result()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    def _edge_voice(self, voice: str) -> str:
+        """Validate a voice ID and map it to the Edge TTS voice name."""
+        if voice not in self.AVAILABLE_VOICES:
+            raise ValueError(
+                f"Invalid voice: {voice}. "
+                f"Available voices: {list(self.AVAILABLE_VOICES.keys())}"
+            )
+        return self.AVAILABLE_VOICES[voice]
 
-    def synthesize(self, text: str, voice: str = 'af_sky', speed: float = 1.0) -> np.ndarray:
+    def _decode(self, mp3_data: bytes) -> np.ndarray:
+        """Decode the backend's audio bytes (MP3 for Edge TTS) to float32 samples at the configured rate."""
+        # Decode the MP3 straight from the buffer
+        audio, sr = sf.read(io.BytesIO(mp3_data), dtype='float32')
+
+        # Resample if needed (Edge TTS outputs at different rates)
+        if sr != self.sample_rate:
+            audio = resample(audio, sr, self.sample_rate)
+
+        return audio
+
+    async def asynthesize(self, text: str, voice: str = 'af_sky', speed: float = 1.0) -> np.ndarray:
         """
-        Convert text to speech audio.
+        Convert text to speech audio (native async API).
+
+        Can be awaited on any event loop; at most max_concurrency requests
+        run at once per loop.
 
         Args:
             text: Text to synthesize
@@ -57,72 +128,221 @@ class EdgeTTS:
             speed: Speech speed multiplier (1.0 = normal)
 
         Returns:
-            Numpy array of audio samples
+            Numpy array of audio samples (read-only memory map on a cache hit)
         """
-        if voice not in self.AVAILABLE_VOICES:
-            raise ValueError(
-                f"Invalid voice: {voice}. "
-                f"Available voices: {list(self.AVAILABLE_VOICES.keys())}"
-            )
+        edge_voice = self._edge_voice(voice)
 
-        try:
-            # Map to Edge TTS voice
-            edge_voice = self.AVAILABLE_VOICES[voice]
+        # Identical requests are served from the on-disk PCM cache
+        cache = get_audio_cache()
+        key = None
+        if cache is not None:
+            key = AudioCache.make_key(text, edge_voice, speed, self.sample_rate, engine=self.backend.name)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
 
-            # Generate audio using Edge TTS (async)
-            audio_file = self._synthesize_sync(text, edge_voice, speed)
+        try:
+            # Convert rate to Edge TTS format (+/- percentage)
+            rate = f"+{int((speed - 1.0) * 100)}%" if speed >= 1.0 else f"{int((speed - 1.0) * 100)}%"
 
-            # Load audio file
-            audio, sr = sf.read(audio_file)
+            queued_at = time.perf_counter()
+            async with self._semaphore():
+                with get_instrumentation().span('tts', self.backend.name, queued_at=queued_at,
+                                                model=edge_voice):
+                    mp3_data = await self._async_synthesize(text, edge_voice, rate)
 
-            # Clean up temp file
-            os.remove(audio_file)
+            # Decoding and resampling are CPU work; keep them off the event loop
+            audio = await asyncio.get_running_loop().run_in_executor(None, self._decode, mp3_data)
 
-            # Resample if needed (Edge TTS outputs at different rates)
-            if sr != self.sample_rate:
-                import scipy.signal as sps
-                num_samples = int(len(audio) * self.sample_rate / sr)
-                audio = sps.resample(audio, num_samples)
+            if key is not None:
+                cache.put(key, audio, voice=edge_voice, sample_rate=self.sample_rate)
 
             return audio
 
         except Exception as e:
-            raise RuntimeError(f"Edge TTS synthesis failed: {str(e)}")
+            raise RuntimeError(f"TTS synthesis failed ({self.backend.name}): {str(e)}")
 
-    def _synthesize_sync(self, text: str, voice: str, rate: float) -> str:
+    async def asynthesize_many(self, texts: List[str], voices: Union[str, List[str]] = 'af_sky',
+                               speed: float = 1.0) -> List[np.ndarray]:
         """
-        Synchronous wrapper for async Edge TTS synthesis.
+        Synthesize several texts concurrently.
+
+        Args:
+            texts: Texts to synthesize
+            voices: One voice ID for all texts, or one per text
+            speed: Speech speed multiplier
+
+        Returns:
+            Audio arrays in the same order as texts
+        """
+        if isinstance(voices, str):
+            voices = [voices] * len(texts)
+        if len(voices) != len(texts):
+            raise ValueError(f"Got {len(voices)} voices for {len(texts)} texts")
+
+        return list(await asyncio.gather(
+            *(self.asynthesize(text, voice, speed) for text, voice in zip(texts, voices))
+        ))
+
+    def synthesize(self, text: str, voice: str = 'af_sky', speed: float = 1.0) -> np.ndarray:
+        """
+        Convert text to speech audio.
 
         Args:
             text: Text to synthesize
-            voice: Edge TTS voice name
-            rate: Speech rate (1.0 = normal)
+            voice: Voice ID (see AVAILABLE_VOICES)
+            speed: Speech speed multiplier (1.0 = normal)
 
         Returns:
-            Path to temporary audio file
+            Numpy array of audio samples (read-only memory map on a cache hit)
         """
-        # Create temp file
-        fd, temp_path = tempfile.mkstemp(suffix='.mp3')
-        os.close(fd)
+        self._edge_voice(voice)  # Raise ValueError here rather than from the loop thread
+        return self._run(self.asynthesize(text, voice, speed))
 
-        # Convert rate to Edge TTS format (+/- percentage)
-        rate_str = f"+{int((rate - 1.0) * 100)}%" if rate >= 1.0 else f"{int((rate - 1.0) * 100)}%"
+    def synthesize_many(self, texts: List[str], voices: Union[str, List[str]] = 'af_sky',
+                        speed: float = 1.0) -> List[np.ndarray]:
+        """
+        Synthesize several texts concurrently (blocking wrapper of asynthesize_many).
 
-        # Run async synthesis in sync context
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        Args:
+            texts: Texts to synthesize
+            voices: One voice ID for all texts, or one per text
+            speed: Speech speed multiplier
+
+        Returns:
+            Audio arrays in the same order as texts
+        """
+        return self._run(self.asynthesize_many(texts, voices, speed))
+
+    def submit(self, text: str, voice: str = 'af_sky', speed: float = 1.0) -> Future:
+        """
+        Start synthesizing without waiting for the result.
 
-        loop.run_until_complete(self._async_synthesize(text, voice, rate_str, temp_path))
+        Args:
+            text: Text to synthesize
+            voice: Voice ID
+            speed: Speech speed multiplier
+
+        Returns:
+            concurrent.futures.Future resolving to the audio array
+        """
+        self._edge_voice(voice)
+        return asyncio.run_coroutine_threadsafe(
+            self.asynthesize(text, voice, speed), self._background_loop()
+        )
+
+    async def _async_synthesize(self, text: str, voice: str, rate: str) -> bytes:
+        """Async synthesis through the backend, returning encoded audio bytes."""
+        return await self.backend.synthesize(text, voice, rate)
+
+    # Sentence boundary: terminal punctuation (plus closing quotes/brackets) followed by whitespace
+    _SENTENCE_END = re.compile(r'(?<=[.!?…])["\')\]]*\s+')
 
-        return temp_path
+    @classmethod
+    def split_sentences(cls, text: str, max_chars: int = Config.TTS_CHUNK_MAX_CHARS) -> List[str]:
+        """
+        Split text into synthesis chunks at sentence boundaries.
+
+        Short sentences are merged up to max_chars so every request carries
+        enough text to amortize its round trip; a sentence longer than
+        max_chars is split at a comma or space that fits.
 
-    async def _async_synthesize(self, text: str, voice: str, rate: str, output_path: str):
-        """Async Edge TTS synthesis."""
-        communicate = edge_tts.Communicate(text, voice, rate=rate)
-        await communicate.save(output_path)
+        Args:
+            text: Text to split
+            max_chars: Target maximum characters per chunk
+
+        Returns:
+            Non-empty chunks in reading order
+        """
+        chunks = []
+        current = ""
+
+        for sentence in cls._SENTENCE_END.split(text.strip()):
+            sentence = " ".join(sentence.split())
+            if not sentence:
+                continue
+
+            while len(sentence) > max_chars:
+                # Prefer a clause break in the second half, else the last word break
+                cut = sentence.rfind(", ", max_chars // 2, max_chars)
+                if cut < 0:
+                    cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut + 1 if cut > 0 else max_chars
+                head, sentence = sentence[:cut].strip(), sentence[cut:].strip()
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(head)
+
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}".strip()
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _trim_silence(self, audio: np.ndarray, threshold: float = 1e-3,
+                      keep_seconds: float = 0.08) -> np.ndarray:
+        """
+        Trim the padding Edge TTS adds around every clip, keeping a short pause.
+
+        Args:
+            audio: Clip samples
+            threshold: Absolute amplitude treated as silence
+            keep_seconds: Silence kept on each side
+
+        Returns:
+            Trimmed clip
+        """
+        voiced = np.flatnonzero(np.abs(audio) > threshold)
+        if voiced.size == 0:
+            return audio
+        keep = int(keep_seconds * self.sample_rate)
+        return audio[max(0, voiced[0] - keep):voiced[-1] + 1 + keep]
+
+    def synthesize_stream(self, text: str, voice: str = 'af_sky', speed: float = 1.0,
+                          max_parallel: int = Config.TTS_STREAM_PARALLEL) -> Iterator[np.ndarray]:
+        """
+        Synthesize text sentence by sentence, yielding audio chunks in order.
+
+        Up to max_parallel chunks are synthesized at once; the first chunk is
+        yielded as soon as it is decoded, so playback can start after roughly
+        one sentence's synthesis time. Chunks are trimmed of their edge
+        padding and can be played back to back without gaps.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID (see AVAILABLE_VOICES)
+            speed: Speech speed multiplier (1.0 = normal)
+            max_parallel: Maximum chunks synthesizing at the same time
+
+        Yields:
+            Numpy arrays of audio samples
+        """
+        chunks = iter(self.split_sentences(text))
+
+        # Requests run on the background loop; keep at most max_parallel ahead
+        pending = deque()
+        for chunk in chunks:
+            pending.append(self.submit(chunk, voice, speed))
+            if len(pending) >= max_parallel:
+                break
+
+        try:
+            while pending:
+                audio = pending.popleft().result()
+                # Keep the window full while the caller plays this chunk
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(self.submit(next_chunk, voice, speed))
+                yield self._trim_silence(audio)
+        finally:
+            # Caller stopped early (e.g. barge-in): drop requests not yet running
+            for future in pending:
+                future.cancel()
 
     def synthesize_to_file(self, text: str, voice: str = 'af_sky',
                           output_path: str = None, speed: float = 1.0) -> str:
@@ -145,8 +365,7 @@ class EdgeTTS:
             fd, output_path = tempfile.mkstemp(suffix='.wav')
             os.close(fd)
 
-        # Save audio to file
-        import soundfile as sf
+        # Save audio to file (the only synthesis path that touches the filesystem)
         sf.write(output_path, audio, self.sample_rate)
 
         return output_path
@@ -184,6 +403,21 @@ class EdgeTTS:
         voice = self.get_agent_voice(agent_name)
         return self.synthesize(text, voice, speed)
 
+    def speak_as_agent_stream(self, text: str, agent_name: str, speed: float = 1.0) -> Iterator[np.ndarray]:
+        """
+        Streaming variant of speak_as_agent() (see synthesize_stream).
+
+        Args:
+            text: Text to speak
+            agent_name: Agent name (philosopher, architect, optimizer)
+            speed: Speech speed multiplier
+
+        Yields:
+            Audio chunks in order
+        """
+        voice = self.get_agent_voice(agent_name)
+        return self.synthesize_stream(text, voice, speed)
+
     @staticmethod
     def list_voices():
         """Print available voices with descriptions."""
@@ -213,8 +447,8 @@ class EdgeTTS:
             audio = tts.synthesize(text, voice)
 
             # Play audio
-            from .audio_utils import AudioPlayer
-            player = AudioPlayer()
+            from .audio_utils import get_audio_player
+            player = get_audio_player()
             player.play(audio, blocking=True)
 
             print(f"✓ Voice test complete for {voice}")
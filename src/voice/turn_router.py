@@ -0,0 +1,135 @@
+"""
+Turn Router - picks the next speaker in a hands-free interactive podcast.
+Keyword rules only: no LLM call, so routing adds no latency to a turn.
+
+In order of precedence:
+  1. An utterance that is just an end phrase ("end discussion", "okay,
+     goodbye!", ...) ends the session; the phrase inside a longer sentence
+     does not.
+  2. An agent addressed by name ("Optimizer, ...") speaks next.
+  3. The agent whose topics the utterance matches best speaks next; on a
+     tie, the one mentioned last (usually the actual question) wins.
+  4. Otherwise the agent who has waited longest speaks.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import re
+
+
+class TurnRouter:
+    """
+    Rule-based next-speaker selection from a transcript.
+
+    Names are only the agents' titles and nicknames, never everyday words,
+    so a topic word cannot be mistaken for a direct address:
+
+    >>> router = TurnRouter()
+    >>> router.route("What content works for Gen Z, optimizer?")
+    'optimizer'
+    >>> router.route("I'm content with that, what do the numbers say?")
+    'optimizer'
+    >>> router.route("I think the content strategy here is weak")
+    'architect'
+    >>> router.route("Philosopher, is this just a trend?")
+    'philosopher'
+
+    Only an utterance that is nothing but an end phrase ends the session:
+
+    >>> router.route("Okay, goodbye everyone!")
+    'end'
+    >>> router.route("That's all for today. Goodbye.")
+    'end'
+    >>> router.route("That's all very interesting, but why does it work?")
+    'philosopher'
+    >>> router.route("How would a goodbye email campaign perform?")
+    'architect'
+    """
+
+    END = 'end'
+
+    # Ways to address each agent directly
+    NAMES: Dict[str, Sequence[str]] = {
+        'philosopher': ('philosopher', 'zeitgeist'),
+        'architect': ('architect',),
+        'optimizer': ('optimizer', 'optimiser', 'brutalist'),
+    }
+
+    # What each persona is asked about
+    TOPICS: Dict[str, str] = {
+        'philosopher': r"why|meaning\w*|cultur\w*|societ\w*|zeitgeist|trend\w*|future|human\w*|"
+                       r"ethic\w*|philosoph\w*|believ\w*|values?|generation\w*|identity",
+        'architect': r"writ\w*|stor\w*|content|cop(y|ies)|narrative\w*|headline\w*|posts?|"
+                     r"brand\w*|messag\w*|audience\w*|campaign\w*|tone|hooks?|script\w*",
+        'optimizer': r"numbers?|data|metric\w*|costs?|pric\w*|budget\w*|roi|convers\w*|"
+                     r"optimi[sz]\w*|efficien\w*|measur\w*|percent\w*|growth|kpis?|how much|faster",
+    }
+
+    END_PHRASES = (
+        "end discussion", "end the discussion", "stop the podcast", "end the podcast",
+        "that's all", "that is all", "goodbye", "good bye", "we're done", "we are done",
+    )
+
+    # Small words allowed around end phrases ("Okay, that's all for today, thanks!")
+    END_LEAD = r"(?:ok(?:ay)?|alright|all right|well|thanks|thank you|so)"
+    END_TAIL = r"(?:for (?:now|today)|everyone|everybody|folks|guys|then|thanks|thank you|please)"
+
+    def __init__(self, agents: Sequence[str] = ('philosopher', 'architect', 'optimizer')):
+        """
+        Initialize the router.
+
+        Args:
+            agents: Agent names that can be routed to
+        """
+        self.waiting: List[str] = list(agents)  # Longest waiting first
+        phrase = (r"(?:" + self.END_LEAD + r"[,.!]?\s+)?(?:" + "|".join(map(re.escape, self.END_PHRASES))
+                  + r")(?:[,]?\s+" + self.END_TAIL + r")*")
+        self._end = re.compile(r"^" + phrase + r"(?:[.,!]*\s+" + phrase + r")*[.!]*$")
+        self._names = {
+            agent: re.compile(r"\b(" + "|".join(self.NAMES.get(agent, (agent,))) + r")\b")
+            for agent in agents
+        }
+        self._topics = {
+            agent: re.compile(r"\b(" + self.TOPICS[agent] + r")\b")
+            for agent in agents if agent in self.TOPICS
+        }
+
+    def spoke(self, agent: str):
+        """Record that an agent has just spoken."""
+        if agent in self.waiting:
+            self.waiting.remove(agent)
+            self.waiting.append(agent)
+
+    def route(self, text: str, previous_speaker: Optional[str] = None) -> str:
+        """
+        Choose who speaks after an utterance.
+
+        Args:
+            text: What was just said (typically the user's transcript)
+            previous_speaker: Agent who spoke before the utterance (avoided on fallback)
+
+        Returns:
+            Agent name, or TurnRouter.END to finish the session
+        """
+        lowered = text.lower()
+        # The whole utterance must be the command; STT may use typographic apostrophes
+        if self._end.match(lowered.strip().replace("\u2019", "'")):
+            return self.END
+
+        # Direct address: the first agent named
+        addressed = [(match.start(), agent)
+                     for agent, pattern in self._names.items()
+                     for match in [pattern.search(lowered)] if match]
+        if addressed:
+            return min(addressed)[1]
+
+        # Best topical match; ties go to the agent mentioned last
+        scores = {}
+        for agent, pattern in self._topics.items():
+            matches = list(pattern.finditer(lowered))
+            if matches:
+                scores[agent] = (len(matches), matches[-1].start())
+        if scores:
+            return max(scores, key=scores.get)
+
+        candidates = [agent for agent in self.waiting if agent != previous_speaker]
+        return (candidates or self.waiting)[0]
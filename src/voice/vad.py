@@ -0,0 +1,237 @@
+"""
+Voice Activity Detection for microphone recordings.
+Adaptive energy detector with hangover smoothing and zero-crossing check.
+
+The detection threshold follows the room: it is a multiple of a noise floor
+that is tracked while nobody is speaking, never below a fixed minimum. A
+block counts as speech when its RMS clears the threshold and, optionally,
+its zero-crossing rate is below what broadband noise (fans, hiss) produces.
+Speech must persist for min_speech seconds to start and silence must last
+the hangover time to end it, so clicks and short pauses do not toggle state.
+Features are computed into preallocated scratch arrays, so process() is
+safe to call from an audio callback.
+"""
+
+from typing import Callable, Optional, Tuple
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import Config
+
+SPEECH_START = 'speech_start'
+SPEECH_END = 'speech_end'
+
+
+class VoiceActivityDetector:
+    """Streaming speech/silence detector emitting speech_start and speech_end events."""
+
+    def __init__(self,
+                 sample_rate: int = Config.AUDIO_SAMPLE_RATE,
+                 min_threshold: float = Config.RECORDING_SILENCE_THRESHOLD,
+                 hangover: float = Config.RECORDING_SILENCE_DURATION,
+                 noise_ratio: float = Config.VAD_NOISE_RATIO,
+                 min_speech: float = Config.VAD_MIN_SPEECH,
+                 use_zcr: bool = Config.VAD_USE_ZCR,
+                 zcr_max: float = Config.VAD_ZCR_MAX,
+                 calibration: float = Config.VAD_CALIBRATION,
+                 on_event: Optional[Callable[[str, float], None]] = None,
+                 max_block: int = 8192):
+        """
+        Initialize the detector.
+
+        Args:
+            sample_rate: Audio sample rate in Hz
+            min_threshold: Lowest RMS ever treated as speech
+            hangover: Seconds of non-speech before speech ends
+            noise_ratio: Speech threshold as a multiple of the noise floor RMS
+            min_speech: Seconds of consecutive speech blocks before speech starts
+            use_zcr: If True, reject blocks whose zero-crossing rate looks like noise
+            zcr_max: Highest zero-crossing rate (crossings per sample) accepted as speech
+            calibration: Seconds at the start used only to measure the noise floor
+            on_event: Optional callback(event, time_in_seconds) for start/end events
+            max_block: Largest block size expected (scratch space; grows if exceeded)
+        """
+        self.sample_rate = sample_rate
+        self.min_threshold = min_threshold
+        self.hangover = hangover
+        self.noise_ratio = noise_ratio
+        self.min_speech = min_speech
+        self.use_zcr = use_zcr
+        self.zcr_max = zcr_max
+        self.calibration = calibration
+        self.on_event = on_event
+
+        # Scratch space for the zero-crossing count (no per-block allocation)
+        self._signs = np.empty(max_block, dtype=bool)
+        self._changes = np.empty(max_block, dtype=bool)
+
+        self.reset()
+
+    def reset(self):
+        """Forget all state (start of a new recording)."""
+        self.noise_floor: Optional[float] = None
+        self.is_speech = False
+        self.frames_seen = 0
+        self.first_speech_frame: Optional[int] = None  # Where the first utterance began
+        self.speech_start_frame: Optional[int] = None  # Where the current/last utterance began
+        self.speech_end_frame: Optional[int] = None    # Where the last utterance ended
+        self._voiced_run = 0    # Consecutive speech frames while silent
+        self._silent_run = 0    # Consecutive non-speech frames while speaking
+        self.last_rms = 0.0
+        self.last_zcr = 0.0
+
+    @property
+    def threshold(self) -> float:
+        """Current RMS threshold for speech."""
+        if self.noise_floor is None:
+            return self.min_threshold
+        return max(self.min_threshold, self.noise_floor * self.noise_ratio)
+
+    @property
+    def heard_speech(self) -> bool:
+        """True once any speech has started in this recording."""
+        return self.first_speech_frame is not None
+
+    def _zero_crossing_rate(self, samples: np.ndarray) -> float:
+        """Crossings per sample of a 1-D block, computed in place."""
+        n = len(samples)
+        if n < 2:
+            return 0.0
+        if n > len(self._signs):
+            self._signs = np.empty(n, dtype=bool)
+            self._changes = np.empty(n, dtype=bool)
+
+        signs = self._signs[:n]
+        np.signbit(samples, out=signs)
+        changes = self._changes[:n - 1]
+        np.not_equal(signs[1:], signs[:-1], out=changes)
+        return np.count_nonzero(changes) / (n - 1)
+
+    def _update_noise_floor(self, rms: float):
+        """Track the noise floor while silent: fall fast, rise slowly."""
+        if self.noise_floor is None:
+            self.noise_floor = rms
+        elif rms < self.noise_floor:
+            self.noise_floor += 0.5 * (rms - self.noise_floor)
+        else:
+            self.noise_floor += 0.05 * (rms - self.noise_floor)
+
+    def _emit(self, event: str, frame: int) -> str:
+        """Notify the callback and return the event."""
+        if self.on_event is not None:
+            self.on_event(event, frame / self.sample_rate)
+        return event
+
+    def speech_span(self, total_frames: int, pad_frames: int = 0) -> Tuple[int, int]:
+        """
+        Frame range covering all speech heard so far.
+
+        Args:
+            total_frames: Frames processed (the end used while still speaking)
+            pad_frames: Frames of context kept before and after the speech
+
+        Returns:
+            (start, end) frames; the whole range when no speech was heard
+        """
+        if not self.heard_speech:
+            return 0, total_frames
+
+        start = max(0, self.first_speech_frame - pad_frames)
+        end = total_frames
+        if not self.is_speech and self.speech_end_frame is not None:
+            end = min(end, self.speech_end_frame + pad_frames)
+        return start, end
+
+    def seconds_since_speech_end(self) -> float:
+        """Audio seconds processed since speech last ended (0 while speaking)."""
+        if self.is_speech or self.speech_end_frame is None:
+            return 0.0
+        return (self.frames_seen - self.speech_end_frame) / self.sample_rate
+
+    def process(self, block: np.ndarray) -> Optional[str]:
+        """
+        Classify one block of audio.
+
+        Args:
+            block: Samples of shape (frames,) or (frames, channels)
+
+        Returns:
+            SPEECH_START or SPEECH_END when the state changes, else None
+        """
+        frames = len(block)
+        if frames == 0:
+            return None
+
+        # RMS over all channels without a squared temporary
+        rms = float(np.sqrt(np.vdot(block, block).real / block.size))
+        self.last_rms = rms
+        voiced = rms > self.threshold
+        if voiced and self.use_zcr:
+            mono = block[:, 0] if block.ndim > 1 else block
+            self.last_zcr = self._zero_crossing_rate(mono)
+            voiced = self.last_zcr <= self.zcr_max
+
+        self.frames_seen += frames
+        event = None
+
+        # The first moments after the prompt calibrate the floor to the room. Blocks loud
+        # enough to be speech even at the minimum floor are left to detection instead, so a
+        # user who is already talking neither raises the floor to their level nor loses words
+        calibration_cap = self.min_threshold * self.noise_ratio
+        if (self.frames_seen <= self.calibration * self.sample_rate
+                and not self.is_speech and rms <= calibration_cap):
+            self._voiced_run = 0
+            self._update_noise_floor(rms)
+            return None
+
+        if not self.is_speech:
+            if voiced:
+                self._voiced_run += frames
+                if self._voiced_run >= self.min_speech * self.sample_rate:
+                    self.is_speech = True
+                    self._silent_run = 0
+                    self.speech_start_frame = self.frames_seen - self._voiced_run
+                    if self.first_speech_frame is None:
+                        self.first_speech_frame = self.speech_start_frame
+                    event = self._emit(SPEECH_START, self.speech_start_frame)
+            else:
+                self._voiced_run = 0
+                self._update_noise_floor(rms)
+        else:
+            if voiced:
+                self._silent_run = 0
+            else:
+                self._silent_run += frames
+                if self._silent_run >= self.hangover * self.sample_rate:
+                    self.is_speech = False
+                    self._voiced_run = 0
+                    self.speech_end_frame = self.frames_seen - self._silent_run
+                    event = self._emit(SPEECH_END, self.speech_end_frame)
+
+        return event
+
+
+def trim_silence(audio: np.ndarray,
+                 sample_rate: int,
+                 pre_roll: float = Config.VAD_PRE_ROLL,
+                 block_seconds: float = 0.02) -> np.ndarray:
+    """
+    Cut leading and trailing non-speech from a complete clip.
+
+    Args:
+        audio: Samples of shape (frames,) or (frames, channels)
+        sample_rate: Audio sample rate in Hz
+        pre_roll: Seconds of context kept around the speech
+        block_seconds: Analysis block length
+
+    Returns:
+        View of audio covering the speech (the whole clip if none was found)
+    """
+    vad = VoiceActivityDetector(sample_rate=sample_rate)
+    block = max(1, int(block_seconds * sample_rate))
+    for offset in range(0, len(audio), block):
+        vad.process(audio[offset:offset + block])
+
+    start, end = vad.speech_span(len(audio), int(pre_roll * sample_rate))
+    return audio[start:end]
@@ -0,0 +1,149 @@
+"""
+AudioRecorder.record() against a fake sounddevice input stream.
+Run with: python -m pytest -q tests
+
+The fake stream feeds blocks to the recorder's callback from a thread, like
+PortAudio, and stops once the callback raises CallbackStop. record() must
+then return by itself, without the user pressing Ctrl+C.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import src.voice.audio_utils as audio_utils
+from config import Config
+
+SAMPLE_RATE = 16000
+BLOCK = 320  # 20 ms
+
+
+class CallbackStop(Exception):
+    """Stand-in for sounddevice.CallbackStop."""
+
+
+class FakeInputStream:
+    """Calls the callback with blocks from `source` until it raises CallbackStop."""
+
+    def __init__(self, source, samplerate, channels, callback, dtype):
+        self.source = source
+        self.channels = channels
+        self.callback = callback
+        self.active = False
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._feed, daemon=True)
+
+    def _feed(self):
+        for block in self.source():
+            if self._closed.is_set():
+                break
+            try:
+                self.callback(block.reshape(-1, self.channels), len(block), None, None)
+            except CallbackStop:
+                break
+            time.sleep(0.001)
+        self.active = False
+
+    def __enter__(self):
+        self.active = True
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._closed.set()
+        self._thread.join(timeout=1)
+        return False
+
+
+def silence():
+    """Endless low-level noise."""
+    rng = np.random.default_rng(0)
+    while True:
+        yield (rng.standard_normal(BLOCK) * 1e-4).astype(np.float32)
+
+
+def utterance(seconds: float = 1.0):
+    """Room noise, one second of a voiced tone, then endless room noise."""
+    noise = silence()
+    for _ in range(int(0.5 * SAMPLE_RATE / BLOCK)):
+        yield next(noise)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    tone = (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+    for start in range(0, len(tone), BLOCK):
+        yield tone[start:start + BLOCK]
+    yield from noise
+
+
+def fake_sounddevice(source):
+    """Module-like namespace replacing sounddevice for one recording."""
+    return SimpleNamespace(
+        CallbackStop=CallbackStop,
+        sleep=lambda ms: time.sleep(ms / 1000),
+        InputStream=lambda **kwargs: FakeInputStream(source, **kwargs),
+    )
+
+
+def record_in_thread(recorder, **kwargs):
+    """Run record() in a thread; returns (thread, result holder)."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(audio=recorder.record(**kwargs)),
+                              daemon=True)
+    thread.start()
+    return thread, result
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Recorder with a short hangover, wired to a fake stream per test."""
+    def make(source):
+        monkeypatch.setattr(audio_utils, 'sd', fake_sounddevice(source))
+        return audio_utils.AudioRecorder(sample_rate=SAMPLE_RATE, channels=1,
+                                         silence_duration=0.3)
+    return make
+
+
+def test_record_returns_after_speech_end(recorder):
+    rec = recorder(utterance)
+    thread, result = record_in_thread(rec)
+    thread.join(timeout=10)
+
+    assert not thread.is_alive(), "record() kept waiting after SPEECH_END"
+    assert not rec.is_recording
+    # Trimmed to the utterance plus pre-roll and hangover, not the whole capture
+    assert 0.9 * SAMPLE_RATE < len(result['audio']) < 2.5 * SAMPLE_RATE
+
+
+def test_record_returns_after_start_timeout(recorder, monkeypatch):
+    monkeypatch.setattr(Config, 'RECORDING_START_TIMEOUT', 0.5)
+    rec = recorder(silence)
+    started = time.monotonic()
+    thread, _ = record_in_thread(rec)
+    thread.join(timeout=10)
+
+    assert not thread.is_alive(), "record() ignored RECORDING_START_TIMEOUT"
+    assert not rec.vad.heard_speech
+    assert time.monotonic() - started < 5
+
+
+def test_record_respects_duration_without_auto_stop(recorder):
+    rec = recorder(silence)
+    thread, result = record_in_thread(rec, duration=0.3, auto_stop=False)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(result['audio']) > 0
+
+
+def test_close_stops_grower_thread(recorder):
+    rec = recorder(silence)
+    thread, _ = record_in_thread(rec, duration=0.3, auto_stop=False)
+    thread.join(timeout=5)
+    rec.close()
+    rec.buffer._grower_thread.join(timeout=1)
+
+    assert not rec.buffer._grower_thread.is_alive(), "close() left the grower thread running"
+    assert rec.buffer.capacity == 0
+    assert not rec.buffer.write(np.zeros((BLOCK, 1), dtype=np.float32))
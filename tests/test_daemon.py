@@ -0,0 +1,75 @@
+"""
+TwinServer request checks (headers, body size, payload fields) without running crews.
+Run with: python -m pytest -q tests
+"""
+
+import pytest
+
+from src.daemon.client import TOKEN_HEADER
+from src.daemon.server import RequestError, TwinServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = TwinServer(workers=1)
+    # Dispatch stops short of the twin: report what would have run
+    monkeypatch.setattr(server, "_with_twin", lambda fn: "dispatched")
+    return server
+
+
+def headers(server, **overrides):
+    values = {"Content-Type": "application/json", TOKEN_HEADER: server.token, "Content-Length": "2"}
+    values.update(overrides)
+    return values
+
+
+def status(call) -> int:
+    with pytest.raises(RequestError) as error:
+        call()
+    return error.value.status
+
+
+def test_posts_need_json_and_the_token(server):
+    server.authorize(headers(server))
+    server.authorize(headers(server, **{"Content-Type": "application/json; charset=utf-8"}))
+
+    assert status(lambda: server.authorize(headers(server, **{"Content-Type": "text/plain"}))) == 415
+    assert status(lambda: server.authorize(headers(server, **{TOKEN_HEADER: "guess"}))) == 401
+    assert status(lambda: server.authorize({"Content-Type": "application/json"})) == 401
+
+
+@pytest.mark.parametrize("length, expected", [("abc", 400), ("-1", 400), (str(10 ** 6), 413)])
+def test_bad_content_length_is_rejected(server, length, expected):
+    assert status(lambda: server.content_length({"Content-Length": length})) == expected
+
+
+def test_content_length_defaults_to_empty_body(server):
+    assert server.content_length({}) == 0
+    assert server.content_length({"Content-Length": "17"}) == 17
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/campaign", {}),
+    ("/campaign", {"product": 3}),
+    ("/trend", {"query": "  "}),
+    ("/analyze", {"topic": ["AI"]}),
+    ("/podcast-transcript", {"topic": "AI", "rounds": "abc"}),
+    ("/podcast-transcript", {"topic": "AI", "rounds": None}),
+    ("/podcast-transcript", {"topic": "AI", "rounds": True}),
+    ("/podcast-transcript", {"topic": "AI", "rounds": TwinServer.MAX_ROUNDS + 1}),
+])
+def test_invalid_payloads_are_bad_requests(server, path, payload):
+    assert status(lambda: server.handle(path, payload)) == 400
+    assert server.requests_served == 0
+
+
+def test_valid_payloads_are_dispatched(server):
+    assert server.handle("/analyze", {"topic": None}) == "dispatched"
+    assert server.handle("/campaign", {"product": "Oat milk"}) == "dispatched"
+    assert server.handle("/podcast-transcript", {"topic": "AI", "rounds": 3}) == "dispatched"
+    assert server.requests_served == 3
+
+
+def test_unknown_endpoint_and_non_object_body(server):
+    assert status(lambda: server.handle("/nope", {})) == 404
+    assert status(lambda: server.handle("/about", [])) == 400
@@ -0,0 +1,61 @@
+"""
+DiscussionMemory budgets over long discussions.
+Run with: python -m pytest -q tests
+"""
+
+from src.voice.discussion_memory import DiscussionMemory, clip_words, estimate_tokens
+
+
+def turn(i: int) -> str:
+    return f"Point number {i} is that attention is the scarce resource. " + "More detail follows. " * 20
+
+
+def test_recent_turns_are_verbatim_and_older_ones_summarized():
+    memory = DiscussionMemory(recent_turns=2, prompt_tokens=2000, summary_tokens=500, point_words=8)
+    for i in range(4):
+        memory.add("Philosopher", turn(i))
+    context = memory.context()
+
+    assert f'Philosopher: "{turn(3).strip()}"' in context
+    assert f'Philosopher: "{turn(2).strip()}"' in context
+    assert "Earlier in the discussion:" in context
+    # Older turns keep only the opening of their first sentence
+    assert "Point number 0 is that attention" in context
+    assert "More detail follows" not in context.split("Most recently:")[0]
+
+
+def test_context_stays_within_budget_however_long_the_discussion():
+    memory = DiscussionMemory(recent_turns=3, prompt_tokens=300, summary_tokens=100, point_words=10)
+    for i in range(200):
+        memory.add("Architect" if i % 2 else "Optimizer", turn(i))
+        assert estimate_tokens(memory.context()) <= 300
+
+    stats = memory.stats()
+    assert stats["turns"] == 200
+    assert stats["dropped_points"] > 0
+    assert stats["max_context_tokens"] <= 300
+
+
+def test_latest_turn_always_appears_even_over_budget():
+    memory = DiscussionMemory(recent_turns=2, prompt_tokens=60)
+    memory.add("Karlo (host)", "word " * 500)
+    context = memory.context()
+
+    assert "Karlo (host)" in context
+    assert estimate_tokens(context) <= 60
+
+
+def test_reset_and_blank_turns():
+    memory = DiscussionMemory()
+    memory.add("Philosopher", "   ")
+    assert memory.turns == 0 and memory.context() == ""
+
+    memory.add("Philosopher", "Hello.")
+    memory.reset()
+    assert memory.turns == 0 and memory.context() == ""
+
+
+def test_clip_words_caps_words_and_characters():
+    assert clip_words("one two three", 5) == "one two three"
+    assert clip_words("one two three", 2) == "one two..."
+    assert len(clip_words("x" * 1000, 5)) <= 40 + 3
@@ -0,0 +1,38 @@
+"""
+RateLimiter sliding window shared across threads.
+Run with: python -m pytest -q tests
+"""
+
+import threading
+import time
+
+from src.crew.rate_limiter import RateLimiter
+
+
+def test_requests_beyond_the_budget_wait_for_the_window():
+    limiter = RateLimiter(max_rpm=2)
+    limiter.WINDOW_SECONDS = 0.3
+    started = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+
+    assert time.monotonic() - started >= 0.25
+    assert limiter.total_requests == 3
+    assert limiter.total_wait > 0
+
+
+def test_threads_share_one_budget():
+    limiter = RateLimiter(max_rpm=3)
+    limiter.WINDOW_SECONDS = 0.3
+    acquired = []
+    threads = [threading.Thread(target=lambda: acquired.append(limiter.acquire() or time.monotonic()))
+               for _ in range(6)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # Three go at once; the other three wait for the window to slide
+    assert sum(1 for at in acquired if at - started < 0.2) == 3
+    assert len(acquired) == 6
@@ -0,0 +1,72 @@
+"""
+ResponseCache keys and eviction against a temporary SQLite file.
+Run with: python -m pytest -q tests
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.crew.response_cache import ResponseCache
+
+
+def agent(model: str = "google/gemini-2.5-flash", role: str = "Philosopher"):
+    """Stand-in with the attributes make_key() reads."""
+    return SimpleNamespace(llm=SimpleNamespace(model=model), role=role, goal="Spot trends",
+                           backstory="Reads too much", system_prompt=None)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(path=str(tmp_path / "cache.sqlite"), max_entries=3, max_age_days=1)
+
+
+def test_key_covers_everything_the_model_sees():
+    base = ResponseCache.make_key(agent(), "Analyze AI", "A report", ["upstream"])
+
+    assert base == ResponseCache.make_key(agent(), "Analyze AI", "A report", ["upstream"])
+    assert base != ResponseCache.make_key(agent(model="openai/gpt-4o"), "Analyze AI", "A report", ["upstream"])
+    assert base != ResponseCache.make_key(agent(role="Optimizer"), "Analyze AI", "A report", ["upstream"])
+    assert base != ResponseCache.make_key(agent(), "Analyze AI!", "A report", ["upstream"])
+    assert base != ResponseCache.make_key(agent(), "Analyze AI", "A report", ["other"])
+    # Context order matters
+    assert (ResponseCache.make_key(agent(), "d", "", ["a", "b"])
+            != ResponseCache.make_key(agent(), "d", "", ["b", "a"]))
+
+
+def test_get_counts_hits_and_misses(cache):
+    assert cache.get("k") is None
+    cache.put("k", "answer")
+
+    assert cache.get("k") == "answer"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.stats()["lifetime_hits"] == 1
+
+
+def test_empty_responses_are_not_stored(cache):
+    cache.put("k", "")
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    for key in ("a", "b", "c"):
+        cache.put(key, key)
+        time.sleep(0.01)
+    cache.get("a")  # Now the most recently used
+    time.sleep(0.01)
+    cache.put("d", "d")
+
+    assert cache.stats()["entries"] == 3
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["a", "c", "d"]
+
+
+def test_expired_entries_are_misses(cache, monkeypatch):
+    cache.put("k", "answer")
+    later = time.time() + 2 * 24 * 3600
+    monkeypatch.setattr(time, "time", lambda: later)
+
+    assert cache.get("k") is None
+    cache.put("other", "x")  # Eviction drops the expired row
+    assert cache.stats()["entries"] == 1
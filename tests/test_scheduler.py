@@ -0,0 +1,109 @@
+"""
+TaskScheduler dependency graph and execution order with stand-in tasks.
+Run with: python -m pytest -q tests
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.crew.marketing_crew import MarketingCrew
+from src.crew.scheduler import CONTEXT_SEPARATOR, TaskScheduler
+
+NOT_SPECIFIED = object()  # Like CrewAI's sentinel: neither a list nor None
+
+
+class FakeOutput(SimpleNamespace):
+    """TaskOutput stand-in: str() is the raw text."""
+
+    def __str__(self):
+        return self.raw
+
+
+class FakeTask:
+    """Task stand-in whose output names itself and the context it saw."""
+
+    def __init__(self, name: str, context=NOT_SPECIFIED, delay: float = 0.0):
+        self.name = name
+        self.context = context
+        self.delay = delay
+        self.agent = SimpleNamespace(role=name.title(), llm=SimpleNamespace(model="m"), tools=[])
+        self.tools = None
+        self.description = f"Do {name}"
+        self.expected_output = ""
+        self.output = None
+        self.started_at = None
+        self.finished_at = None
+
+    def execute_sync(self, agent, context, tools):
+        self.started_at = time.perf_counter()
+        time.sleep(self.delay)
+        self.finished_at = time.perf_counter()
+        self.output = FakeOutput(raw=f"{self.name}[{context or ''}]")
+        return self.output
+
+
+def test_dependencies_follow_context():
+    a = FakeTask("a", context=[])
+    b = FakeTask("b", context=[a])
+    c = FakeTask("c")  # Not specified: everything before it
+    d = FakeTask("d", context=None)
+
+    assert TaskScheduler.dependencies([a, b, c, d]) == {0: [], 1: [0], 2: [0, 1], 3: []}
+
+
+def test_dependency_outside_the_run_is_rejected():
+    with pytest.raises(ValueError):
+        TaskScheduler.dependencies([FakeTask("b", context=[FakeTask("a")])])
+
+
+def test_independent_tasks_run_concurrently():
+    tasks = [FakeTask(name, context=[], delay=0.2) for name in ("a", "b", "c")]
+    started = time.perf_counter()
+    outputs = TaskScheduler(max_workers=3).run(tasks)
+
+    assert outputs == ["a[]", "b[]", "c[]"]
+    assert time.perf_counter() - started < 0.5
+
+
+def test_dependent_tasks_wait_and_receive_context_in_order():
+    trend = FakeTask("trend", context=[], delay=0.05)
+    content = FakeTask("content", context=[trend])
+    optimize = FakeTask("optimize", context=[content])
+    final = FakeTask("final", context=[trend, content, optimize])
+    outputs = TaskScheduler(max_workers=3).run([trend, content, optimize, final])
+
+    assert content.started_at >= trend.finished_at
+    assert optimize.started_at >= content.finished_at
+    assert final.started_at >= optimize.finished_at
+    assert outputs[-1] == "final[" + CONTEXT_SEPARATOR.join(outputs[:3]) + "]"
+
+
+def test_one_agent_never_runs_two_tasks_at_once():
+    a, b = FakeTask("a", context=[], delay=0.1), FakeTask("b", context=[], delay=0.1)
+    b.agent = a.agent
+    TaskScheduler(max_workers=2).run([a, b])
+
+    assert b.started_at >= a.finished_at or a.started_at >= b.finished_at
+
+
+def test_intermediary_outputs_keep_pipeline_order():
+    # The last task finishes first; outputs are still numbered in pipeline order
+    slow = FakeTask("slow", context=[], delay=0.2)
+    fast = FakeTask("fast", context=[])
+    crew = SimpleNamespace(tasks=[slow, fast])
+    TaskScheduler(max_workers=2).run(crew.tasks)
+
+    assert list(MarketingCrew._intermediary_outputs(crew).items()) == [
+        ("1_slow", "slow[]"), ("2_fast", "fast[]"),
+    ]
+
+
+def test_failed_task_aborts_the_run():
+    class Broken(FakeTask):
+        def execute_sync(self, agent, context, tools):
+            raise RuntimeError("model down")
+
+    with pytest.raises(RuntimeError, match="model down"):
+        TaskScheduler(max_workers=2).run([Broken("a", context=[]), FakeTask("b")])
@@ -0,0 +1,52 @@
+"""
+VoiceActivityDetector calibration and start/end events.
+Run with: python -m pytest -q tests
+"""
+
+import numpy as np
+
+from src.voice.vad import SPEECH_END, SPEECH_START, VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+BLOCK = 320  # 20 ms
+
+
+def tone(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    """A voiced 200 Hz tone."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+
+
+def noise(seconds: float, level: float = 1e-4) -> np.ndarray:
+    """Low-level room noise."""
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * level).astype(np.float32)
+
+
+def run(vad: VoiceActivityDetector, audio: np.ndarray) -> list:
+    """Feed audio block by block; returns (event, block start frame) pairs."""
+    events = []
+    for offset in range(0, len(audio), BLOCK):
+        event = vad.process(audio[offset:offset + BLOCK])
+        if event is not None:
+            events.append((event, offset))
+    return events
+
+
+def test_speech_from_first_frame_is_detected():
+    vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE, hangover=0.3)
+    events = run(vad, np.concatenate([tone(1.0), noise(1.0)]))
+
+    assert [event for event, _ in events] == [SPEECH_START, SPEECH_END]
+    assert vad.first_speech_frame == 0
+    # Calibration skipped the speech, so the floor stayed at room level
+    assert vad.threshold < 0.3 * np.sqrt(0.5)
+
+
+def test_quiet_start_calibrates_then_detects_speech():
+    vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE, hangover=0.3)
+    events = run(vad, np.concatenate([noise(0.5), tone(1.0), noise(1.0)]))
+
+    assert [event for event, _ in events] == [SPEECH_START, SPEECH_END]
+    assert vad.noise_floor is not None and vad.noise_floor < 1e-3
+    assert abs(vad.first_speech_frame - int(0.5 * SAMPLE_RATE)) <= BLOCK